@@ -0,0 +1,30 @@
+#!/bin/sh
+
+echo ""
+echo "Web assets"
+echo ""
+echo "Compressing remote files, please wait ..."
+
+# Write the .gz siblings of the changed XML and HTML files and the SHA-256 and
+# size of every file to manifest.json for serving them with strong ETags.
+python3 makeassets.py
+
+# Compile remotes.xml into remotes.json, the model and rcType index of the
+# remote controls.
+python3 makeindex.py
+
+# Compile hardware/*.xml into hardware.json, the rcType table of each hardware
+# generation, and report the conflicting and dangling rcTypes.
+python3 makehardware.py > hardware.log
+
+# Compile every remote control definition into rc/remotes.bin so a box can show
+# a remote control without parsing its XML file.
+python3 makebundle.py
+
+git add -u
+git add *
+git commit -m "Update web assets"
+
+echo ""
+echo "Done!"
+echo ""
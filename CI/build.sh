@@ -18,9 +18,8 @@ commit_files() {
   ./CI/dos2unix.sh
   ./CI/PEP8.sh
   ./CI/futurize.sh
-  ./CI/check.sh > check.log
-  ./CI/convert.sh > convert.log
-  ./CI/preview.sh
+  ./CI/pipeline.sh
+  ./CI/assets.sh
 }
 
 upload_files() {
@@ -6,28 +6,17 @@ echo ""
 echo "Checking remote files, please wait ..." 
 begin=$(date +"%s")
 
-rm -rf check-report
-rm -rf check-result
 mkdir -p check-report
 mkdir -p check-result
 
-find ./rc -type f -name "*.xml" | while read F
-do
-  python2 CheckRemoteControls.py ${F} > ${F}.report
-done
+# Check every remote control in a single run so the key tables are only built once,
+# spread over all the available CPUs.  Remote controls whose files are unchanged
+# since the last run keep their previous reports and results.
+python2 CheckRemoteControls.py --jobs 0 --cache check-report/manifest.json --report-dir check-report --result-dir check-result ./rc
 
-mv -f rc/*.report check-report
-
-mv -f rc/*.html-* check-result
-mv -f rc/*.xml-* check-result
-
-find ./rc -type f -name "*.html" | while read F
-do
-  python2 CheckRemoteControls.py ${F}
-done
-
-mv -f rc/*.html-* check-result
-mv -f rc/*.xml-* check-result
+# Check that every remote control in remotes.xml has its files and every model its
+# box picture, and that no file is unused.
+python3 checkreferences.py --json check-references.json > check-references.log
 
 git add -u
 git add *
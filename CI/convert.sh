@@ -6,26 +6,12 @@ echo ""
 echo "Converting remote files, please wait ..." 
 begin=$(date +"%s")
 
-rm -rf convert-report
-rm -rf convert-result
 mkdir -p convert-report
 mkdir -p convert-result
 
-find ./rc -type f -name "*.xml" | while read F
-do
-  python2 ConvertRemoteControls.py ${F} > ${F}.report
-done
-
-mv -f rc/*.report convert-report
-
-mv -f rc/*-new* convert-result
-
-find ./rc -type f -name "*.html" | while read F
-do
-  python2 ConvertRemoteControls.py ${F}
-done
-
-mv -f rc/*-new* convert-result
+# Convert every remote control in a single run.  Remote controls whose files are
+# unchanged since the last run keep their previous reports and results.
+python2 ConvertRemoteControls.py --cache convert-report/manifest.json --report-dir convert-report --result-dir convert-result ./rc
 
 git add -u
 git add *
@@ -0,0 +1,35 @@
+#!/bin/sh
+
+echo ""
+echo "Remote control pipeline"
+echo ""
+echo "Checking, converting and previewing remote files, please wait ..."
+begin=$(date +"%s")
+
+# Run the check, convert, image check and preview stages in one process so every
+# remote control XML file is only parsed once.  The stages write check.log,
+# convert.log and previews.log as CI/check.sh, CI/convert.sh and CI/preview.sh do.
+python3 pipeline.py
+
+# Check that every remote control in remotes.xml has its files and every model its
+# box picture, and that no file is unused.
+python3 checkreferences.py --json check-references.json > check-references.log
+
+for f in previews/*.png; do
+    [ -e "$f" ] || continue  # No previews were drawn.
+    mv -f "$f" "rc/$(basename "${f%.png}")-preview.png"
+done
+
+rm -rf previews
+
+git add -u
+git add *
+git commit -m "Check, convert and preview remote files"
+
+echo ""
+finish=$(date +"%s")
+timediff=$(($finish-$begin))
+echo -e "Pipeline time was $(($timediff / 60)) minutes and $(($timediff % 60)) seconds."
+echo ""
+echo "Pipeline Done!"
+echo ""
@@ -12,13 +12,15 @@ echo "Creating previews, please wait ..."
 
 mkdir -p previews
 
-python3 makepreviews.py
+# Only the previews of remote controls whose image or XML file changed since the
+# last run are drawn again, spread over all the available CPUs.
+python3 makepreviews.py --jobs 0 --cache previews.json
 
 for f in previews/*.png; do
-    mv -f "$f" "${f%.png}-preview.png"
+    [ -e "$f" ] || continue  # No previews were drawn.
+    mv -f "$f" "rc/$(basename "${f%.png}")-preview.png"
 done
 
-mv -f previews/*.png rc/
 rm -rf previews
 
 git add -u
@@ -26,35 +26,32 @@
 #
 # 	See <https://www.gnu.org/licenses/>.
 
+from argparse import ArgumentParser
 from errno import ENOENT
+from multiprocessing import Pool, cpu_count
 from os import listdir
-from os.path import dirname, isfile, join as pathjoin, splitext
-from sys import argv
-from xml.etree.cElementTree import ParseError, parse, fromstring
+from os.path import basename, dirname, isdir, isfile, join as pathjoin, splitext
+import sys
+try:
+	from xml.etree.cElementTree import ParseError, fromstring
+except ImportError:  # Python 3.9 and later only have ElementTree.
+	from xml.etree.ElementTree import ParseError, fromstring
+
+from RemoteControlCache import fileDigest, fingerprint, loadManifest, lookupEntry, removeOutputs, saveManifest
+from RemoteControlDiagnostics import LOG_SILENT, LOG_PROGRAM, LOG_REPORT, LOG_ERROR, LOG_ALERT, LOG_WARNING, LOG_NOTE, LOG_INFORMATION, LOG_DEBUG, LOG_LEVELS, OUTPUT_FORMATS, OUTPUT_JSONL, OUTPUT_TEXT, catalogLines, diagnosticCode, diagnosticLevel, diagnosticRecord, formatDiagnostic, isSuppressed, loadSuppressions, parseLogLevel, summaryLines
+from RemoteControlDocuments import parseXML
+from RemoteControlGeometry import outsideImage, shapeBoxes, shapeCenter, toleranceDeviations
+from RemoteControlInventory import directoryIndex, findAssets, pngSize
+from RemoteControlKeys import AUTO_CORRECT, KEYDESCRIPTIONS, KEYIDNAMES, KEYIDS, keyIdFromName
+from RemoteControlModel import ATTRIBUTES, UNSORTED, ButtonSide, RemoteDefinition
+
+try:
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
 
 VERSION = "1.21  -  16-Aug-2022"
 
-LOG_SILENT = 0
-LOG_PROGRAM = 1
-LOG_REPORT = 2
-LOG_ERROR = 3
-LOG_ALERT = 4
-LOG_WARNING = 5
-LOG_NOTE = 6
-LOG_INFORMATION = 7
-LOG_DEBUG = 8
-LOG_LEVELS = {
-	LOG_SILENT: "Silent",
-	LOG_PROGRAM: "Program",
-	LOG_REPORT: "Report",
-	LOG_ERROR: "Error",
-	LOG_ALERT: "Alert",
-	LOG_WARNING: "Warning",
-	LOG_NOTE: "Note",
-	LOG_INFORMATION: "Information",
-	LOG_DEBUG: "Debug"
-}
-
 SORT_KEYID = 0
 SORT_POSITION_XML = 1
 SORT_POSITION_HTML = 2
@@ -78,767 +75,66 @@ FORMATS = [
 ]
 
 REMOTE_IMAGE_PATH = "/images/remotes/"
+REPORT_PATH = None  # If defined the log for each remote control is also written to "<REPORT_PATH>/<stem>.xml.report".
+RESULT_PATH = None  # If defined the generated files are written here rather than beside the source files.
+OUTPUT_FORMAT = OUTPUT_TEXT  # With OUTPUT_JSONL the diagnostics are written as JSON records rather than the log.
 
 LOG_LEVEL = LOG_INFORMATION
 SORT_ORDER = SORT_SEQUENCE_XML
 FORMAT_LABELS = FORMAT_CAPITALISE
 FORMAT_TITLES = FORMAT_CAPITALISE
 TOLERANCE = 0
+SUPPRESSED = {}  # The suppressed diagnostics and the stems they are suppressed for, None for all stems.
 
-KEYIDS = {
-	"KEY_RESERVED": 0,
-	"KEY_ESC": 1,
-	"KEY_1": 2,
-	"KEY_2": 3,
-	"KEY_3": 4,
-	"KEY_4": 5,
-	"KEY_5": 6,
-	"KEY_6": 7,
-	"KEY_7": 8,
-	"KEY_8": 9,
-	"KEY_9": 10,
-	"KEY_0": 11,
-	"KEY_MINUS": 12,
-	"KEY_EQUAL": 13,
-	"KEY_BACKSPACE": 14,
-	"KEY_TAB": 15,
-	"KEY_Q": 16,
-	"KEY_W": 17,
-	"KEY_E": 18,
-	"KEY_R": 19,
-	"KEY_T": 20,
-	"KEY_Y": 21,
-	"KEY_U": 22,
-	"KEY_I": 23,
-	"KEY_O": 24,
-	"KEY_P": 25,
-	"KEY_LEFTBRACE": 26,
-	"KEY_RIGHTBRACE": 27,
-	"KEY_ENTER": 28,
-	"KEY_LEFTCTRL": 29,
-	"KEY_A": 30,
-	"KEY_S": 31,
-	"KEY_D": 32,
-	"KEY_F": 33,
-	"KEY_G": 34,
-	"KEY_H": 35,
-	"KEY_J": 36,
-	"KEY_K": 37,
-	"KEY_L": 38,
-	"KEY_SEMICOLON": 39,
-	"KEY_APOSTROPHE": 40,
-	"KEY_GRAVE": 41,
-	"KEY_LEFTSHIFT": 42,
-	"KEY_BACKSLASH": 43,
-	"KEY_Z": 44,
-	"KEY_X": 45,
-	"KEY_C": 46,
-	"KEY_V": 47,
-	"KEY_B": 48,
-	"KEY_N": 49,
-	"KEY_M": 50,
-	"KEY_COMMA": 51,
-	"KEY_DOT": 52,
-	"KEY_SLASH": 53,
-	"KEY_RIGHTSHIFT": 54,
-	"KEY_KPASTERISK": 55,
-	"KEY_LEFTALT": 56,
-	"KEY_SPACE": 57,
-	"KEY_CAPSLOCK": 58,
-	"KEY_F1": 59,
-	"KEY_F2": 60,
-	"KEY_F3": 61,
-	"KEY_F4": 62,
-	"KEY_F5": 63,
-	"KEY_F6": 64,
-	"KEY_F7": 65,
-	"KEY_F8": 66,
-	"KEY_F9": 67,
-	"KEY_F10": 68,
-	"KEY_NUMLOCK": 69,
-	"KEY_SCROLLLOCK": 70,
-	"KEY_KP7": 71,
-	"KEY_KP8": 72,
-	"KEY_KP9": 73,
-	"KEY_KPMINUS": 74,
-	"KEY_KP4": 75,
-	"KEY_KP5": 76,
-	"KEY_KP6": 77,
-	"KEY_KPPLUS": 78,
-	"KEY_KP1": 79,
-	"KEY_KP2": 80,
-	"KEY_KP3": 81,
-	"KEY_KP0": 82,
-	"KEY_KPDOT": 83,
-	"KEY_103RD": 84,
-	"KEY_F13": 85,
-	"KEY_102ND": 86,
-	"KEY_F11": 87,
-	"KEY_F12": 88,
-	"KEY_F14": 89,
-	"KEY_F15": 90,
-	"KEY_F16": 91,
-	"KEY_F17": 92,
-	"KEY_F18": 93,
-	"KEY_F19": 94,
-	"KEY_F20": 95,
-	"KEY_KPENTER": 96,
-	"KEY_RIGHTCTRL": 97,
-	"KEY_KPSLASH": 98,
-	"KEY_SYSRQ": 99,
-	"KEY_RIGHTALT": 100,
-	"KEY_LINEFEED": 101,
-	"KEY_HOME": 102,
-	"KEY_UP": 103,
-	"KEY_PAGEUP": 104,
-	"KEY_LEFT": 105,
-	"KEY_RIGHT": 106,
-	"KEY_END": 107,
-	"KEY_DOWN": 108,
-	"KEY_PAGEDOWN": 109,
-	"KEY_INSERT": 110,
-	"KEY_DELETE": 111,
-	"KEY_MACRO": 112,
-	"KEY_MUTE": 113,
-	"KEY_VOLUMEDOWN": 114,
-	"KEY_VOLUMEUP": 115,
-	"KEY_POWER": 116,
-	"KEY_KPEQUAL": 117,
-	"KEY_KPPLUSMINUS": 118,
-	"KEY_PAUSE": 119,
-	"KEY_F21": 120,
-	"KEY_F22": 121,
-	"KEY_F23": 122,
-	"KEY_F24": 123,
-	"KEY_KPCOMMA": 124,
-	"KEY_LEFTMETA": 125,
-	"KEY_RIGHTMETA": 126,
-	"KEY_COMPOSE": 127,
-	"KEY_STOP": 128,
-	"KEY_AGAIN": 129,
-	"KEY_PROPS": 130,
-	"KEY_UNDO": 131,
-	"KEY_FRONT": 132,
-	"KEY_COPY": 133,
-	"KEY_OPEN": 134,
-	"KEY_PASTE": 135,
-	"KEY_FIND": 136,
-	"KEY_CUT": 137,
-	"KEY_HELP": 138,
-	"KEY_MENU": 139,
-	"KEY_CALC": 140,
-	"KEY_SETUP": 141,
-	"KEY_SLEEP": 142,
-	"KEY_WAKEUP": 143,
-	"KEY_FILE": 144,
-	"KEY_SENDFILE": 145,
-	"KEY_DELETEFILE": 146,
-	"KEY_XFER": 147,
-	"KEY_PROG1": 148,
-	"KEY_PROG2": 149,
-	"KEY_WWW": 150,
-	"KEY_MSDOS": 151,
-	"KEY_COFFEE": 152,
-	"KEY_DIRECTION": 153,
-	"KEY_CYCLEWINDOWS": 154,
-	"KEY_MAIL": 155,
-	"KEY_BOOKMARKS": 156,
-	"KEY_COMPUTER": 157,
-	"KEY_BACK": 158,
-	"KEY_FORWARD": 159,
-	"KEY_CLOSECD": 160,
-	"KEY_EJECTCD": 161,
-	"KEY_EJECTCLOSECD": 162,
-	"KEY_NEXTSONG": 163,
-	"KEY_PLAYPAUSE": 164,
-	"KEY_PREVIOUSSONG": 165,
-	"KEY_STOPCD": 166,
-	"KEY_RECORD": 167,
-	"KEY_REWIND": 168,
-	"KEY_PHONE": 169,
-	"KEY_ISO": 170,
-	"KEY_CONFIG": 171,
-	"KEY_HOMEPAGE": 172,
-	"KEY_REFRESH": 173,
-	"KEY_EXIT": 174,
-	"KEY_MOVE": 175,
-	"KEY_EDIT": 176,
-	"KEY_SCROLLUP": 177,
-	"KEY_SCROLLDOWN": 178,
-	"KEY_KPLEFTPAREN": 179,
-	"KEY_KPRIGHTPAREN": 180,
-	"KEY_INTL1": 181,
-	"KEY_INTL2": 182,
-	"KEY_INTL3": 183,
-	"KEY_INTL4": 184,
-	"KEY_INTL5": 185,
-	"KEY_INTL6": 186,
-	"KEY_INTL7": 187,
-	"KEY_INTL8": 188,
-	"KEY_INTL9": 189,
-	"KEY_LANG1": 190,
-	"KEY_LANG2": 191,
-	"KEY_LANG3": 192,
-	"KEY_LANG4": 193,
-	"KEY_LANG5": 194,
-	"KEY_LANG6": 195,
-	"KEY_LANG7": 196,
-	"KEY_LANG8": 197,
-	"KEY_LANG9": 198,
-	"KEY_PLAYCD": 200,
-	"KEY_PAUSECD": 201,
-	"KEY_PROG3": 202,
-	"KEY_PROG4": 203,
-	"KEY_SUSPEND": 205,
-	"KEY_CLOSE": 206,
-	"KEY_PLAY": 207,
-	"KEY_FASTFORWARD": 208,
-	"KEY_BASSBOOST": 209,
-	"KEY_PRINT": 210,
-	"KEY_HP": 211,
-	"KEY_CAMERA": 212,
-	"KEY_SOUND": 213,
-	"KEY_QUESTION": 214,
-	"KEY_EMAIL": 215,
-	"KEY_CHAT": 216,
-	"KEY_SEARCH": 217,
-	"KEY_CONNECT": 218,
-	"KEY_FINANCE": 219,
-	"KEY_SPORT": 220,
-	"KEY_SHOP": 221,
-	"KEY_ALTERASE": 222,
-	"KEY_CANCEL": 223,
-	"KEY_BRIGHTNESSDOWN": 224,
-	"KEY_BRIGHTNESSUP": 225,
-	"KEY_MEDIA": 226,
-	"KEY_VMODE": 227,  # Deprecated, retained for backwards compatibility.
-	"KEY_SWITCHVIDEOMODE": 227,
-	"KEY_LAN": 238,
-	"KEY_UNKNOWN": 240,
-	"BTN_0": 256,
-	"BTN_1": 257,
-	"BtnA": 304,
-	"BtnB": 305,
-	"BtnC": 306,
-	"BtnX": 307,
-	"BtnY": 308,
-	"BtnZ": 309,
-	"BtnTL": 310,
-	"BtnTR": 311,
-	"BtnTL2": 312,
-	"BtnTR2": 313,
-	"BtnSelect": 314,
-	"BtnStart": 315,
-	"KEY_SHIFT": 351,  # This is not a transmitted key but rather a place holder for remote controls that have a SHIFT function.
-	"KEY_OK": 352,
-	"KEY_SELECT": 353,
-	"KEY_GOTO": 354,
-	"KEY_CLEAR": 355,
-	"KEY_POWER2": 356,
-	"KEY_OPTION": 357,
-	"KEY_INFO": 358,
-	"KEY_TIME": 359,
-	"KEY_VENDOR": 360,
-	"KEY_ARCHIVE": 361,
-	"KEY_PROGRAM": 362,
-	"KEY_CHANNEL": 363,
-	"KEY_FAVORITES": 364,
-	"KEY_EPG": 365,
-	"KEY_PVR": 366,
-	"KEY_MHP": 367,
-	"KEY_LANGUAGE": 368,
-	"KEY_TITLE": 369,
-	"KEY_SUBTITLE": 370,
-	"KEY_ANGLE": 371,
-	"KEY_ZOOM": 372,
-	"KEY_MODE": 373,
-	"KEY_KEYBOARD": 374,
-	"KEY_SCREEN": 375,
-	"KEY_PC": 376,
-	"KEY_TV": 377,
-	"KEY_TV2": 378,
-	"KEY_VCR": 379,
-	"KEY_VCR2": 380,
-	"KEY_SAT": 381,
-	"KEY_SAT2": 382,
-	"KEY_CD": 383,
-	"KEY_TAPE": 384,
-	"KEY_RADIO": 385,
-	"KEY_TUNER": 386,
-	"KEY_PLAYER": 387,
-	"KEY_TEXT": 388,
-	"KEY_DVD": 389,
-	"KEY_AUX": 390,
-	"KEY_MP3": 391,
-	"KEY_AUDIO": 392,
-	"KEY_VIDEO": 393,
-	"KEY_DIRECTORY": 394,
-	"KEY_LIST": 395,
-	"KEY_MEMO": 396,
-	"KEY_CALENDAR": 397,
-	"KEY_RED": 398,
-	"KEY_GREEN": 399,
-	"KEY_YELLOW": 400,
-	"KEY_BLUE": 401,
-	"KEY_CHANNELUP": 402,
-	"KEY_CHANNELDOWN": 403,
-	"KEY_FIRST": 404,
-	"KEY_LAST": 405,
-	"KEY_AB": 406,
-	"KEY_NEXT": 407,
-	"KEY_RESTART": 408,
-	"KEY_SLOW": 409,
-	"KEY_SHUFFLE": 410,
-	"KEY_BREAK": 411,
-	"KEY_PREVIOUS": 412,
-	"KEY_DIGITS": 413,
-	"KEY_TEEN": 414,
-	"KEY_TWEN": 415,
-	"KEY_CONTEXT_MENU": 438,
-	"KEY_DEL_EOL": 448,
-	"KEY_DEL_EOS": 449,
-	"KEY_INS_LINE": 450,
-	"KEY_DEL_LINE": 451,
-	"KEY_ASCII": 510,
-	"KEY_MAX": 511,
-	"KEY_TVSAT": 512,
-	"KEY_PICASA": 513,
-	"KEY_SHOUTCAST": 514,
-	"KEY_YOUTUBE": 515,
-	"KEY_SPARK": 516,
-	"KEY_RECALL": 517,
-	"KEY_PLAYMODE": 518,
-	"KEY_USB": 519,
-	"KEY_PORTAL": 520,
-	"KEY_FAST": 521,
-	"KEY_TOUCHPAD_TOGGLE": 530,
-	"KEY_MOUSE": 530,
-	"KEY_VOD": 627
-}
-
-KNOWN_ALISAES = {
-	227: ("KEY_SWITCHVIDEOMODE", "KEY_VMODE"),
-	530: ("KEY_MOUSE", "KEY_TOUCHPAD_TOGGLE")
-}
-
-
-def invertKeyIds():
-	invKeyIds = {}
-	for key, value in KEYIDS.items():
-		if value not in invKeyIds:
-			invKeyIds[value] = key
-		else:
-			if value in KNOWN_ALISAES and key in KNOWN_ALISAES[value]:
-				invKeyIds[value] = KNOWN_ALISAES[value][0]
-			else:
-				print("[keyids] Error: Key code %d is mapped to both '%s' and '%s'!" % (value, invKeyIds[value], key))
-	return invKeyIds
-
-
-KEYIDNAMES = invertKeyIds()
-
-KEYDESCRIPTIONS = [{  # id=0 - dmm0 remote directory, DM8000.
-	# However, the dmm0 rcpositions.xml file should define
-	# an <rc id=0 /> element, but it does not, it only has
-	# an <rc id=2 /> element.
-	#
-	# The rcpositions.xml file defines <button/> elements,
-	# but they do not appear to emit codes.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("YELLOW",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLUGIN",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EDIT"]: ("EPGSETUP",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FORWARD",),
-	KEYIDS["KEY_FAVORITES"]: ("FAV",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LAST"]: ("BACK",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MEDIA"]: ("MEDIA",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_NEXTSONG"]: ("NEXTSONG",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_PLAYPAUSE"]: ("PLAYPAUSE",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PREVIOUSSONG"]: ("PREVIOUSSONG",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SCREEN"]: ("SCREEN",),
-	KEYIDS["KEY_SEARCH"]: ("WWW",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}, {  # id=1 - dmm0 remote directory, other than DM8000.
-	# However, the dmm0 rcpositions.xml file should define
-	# an <rc id=1 /> element, but it does not, it only has
-	# an <rc id=2 /> element.
-	#
-	# The rcpositions.xml file defines <button/> elements,
-	# but they do not appear to emit codes.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLUGIN",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EDIT"]: ("EPGSETUP",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_FASTFORWARD"]: ("BLUE", "SHIFT"),
-	KEYIDS["KEY_FAVORITES"]: ("FAV",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LAST"]: ("BACK",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MEDIA"]: ("MEDIA",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PLAY"]: ("GREEN", "SHIFT"),
-	KEYIDS["KEY_PAUSE"]: ("YELLOW", "SHIFT"),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RADIO", "SHIFT"),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("RED", "SHIFT"),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SCREEN"]: ("SCREEN",),
-	KEYIDS["KEY_SEARCH"]: ("WWW",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_STOP"]: ("TV", "SHIFT"),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}, {  # id=2 - Everything else.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_ARCHIVE"]: ("HISTORY",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_AUX"]: ("WIZTV",),
-	KEYIDS["KEY_BACK"]: ("RECALL",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLUGIN",),
-	KEYIDS["KEY_CALENDAR"]: ("AUTOTIMER",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_CONTEXT_MENU"]: ("CONTEXT",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EJECTCD"]: ("EJECTCD",),
-	KEYIDS["KEY_END"]: ("END",),
-	KEYIDS["KEY_ENTER"]: ("ENTER", "kbd"),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_F1"]: ("F1",),
-	KEYIDS["KEY_F2"]: ("F2",),
-	KEYIDS["KEY_F3"]: ("F3",),
-	KEYIDS["KEY_F4"]: ("F4",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FASTFORWARD",),
-	KEYIDS["KEY_FAVORITES"]: ("FAV",),
-	KEYIDS["KEY_FILE"]: ("LIST",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_GOTO"]: ("GOTO",),  # Missing.
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_HOME"]: ("HOME",),
-	KEYIDS["KEY_HOMEPAGE"]: ("HOMEPAGE",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_KEYBOARD"]: ("KEYBOARD",),
-	KEYIDS["KEY_LAST"]: ("BACK",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_LIST"]: ("PLAYLIST",),
-	KEYIDS["KEY_MEDIA"]: ("MEDIA",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MODE"]: ("VKEY",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_NEXTSONG"]: ("NEXTSONG",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_OPTION"]: ("OPTION",),
-	KEYIDS["KEY_PAGEDOWN"]: ("PAGEDOWN",),
-	KEYIDS["KEY_PAGEUP"]: ("PAGEUP",),
-	KEYIDS["KEY_PAUSE"]: ("PAUSE",),
-	KEYIDS["KEY_PC"]: ("LAN",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_PLAYPAUSE"]: ("PLAYPAUSE",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PREVIOUSSONG"]: ("PREVIOUSSONG",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_PVR"]: ("PVR",),
-	KEYIDS["KEY_QUESTION"]: ("ABOUT",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("REWIND",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SAT"]: ("SAT",),
-	KEYIDS["KEY_SCREEN"]: ("SCREEN",),
-	KEYIDS["KEY_SEARCH"]: ("WWW",),
-	KEYIDS["KEY_SETUP"]: ("SETUP",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_SLOW"]: ("SLOW",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_SWITCHVIDEOMODE"]: ("VMODE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TIME"]: ("TIMESHIFT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("VIDEO",),
-	# KEYIDS["KEY_VMODE"]: ("VMODE",),  # This value is deprecated use KEY_SWITCHVIDEOMODE instead.
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",),
-	KEYIDS["KEY_ZOOM"]: ("ZOOM",),
-	# Discrete power codes
-	KEYIDS["KEY_POWER2"]: ("POWER2",),
-	KEYIDS["KEY_SUSPEND"]: ("SUSPEND",),
-	KEYIDS["KEY_WAKEUP"]: ("WAKEUP",),
-	# Placeholder definition to assist with remote control updates.
-	KEYIDS["KEY_RESERVED"]: ("UNKNOWN",)
-
-}, {  # id=3 - XP1000.
-	# The xp1000/rcpositions file defines PLAY and PAUSE
-	# at the same location where it should just define
-	# PLAYPAUSE there. It has similar overlayed incorrect
-	# definitions for play & pause rather than play/pause
-	# in remote.html.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PORTAL",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FASTFORWARD",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_NEXTSONG"]: ("NEXTSONG",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_PLAYPAUSE"]: ("PLAYPAUSE",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PREVIOUSSONG"]: ("PREVIOUSSONG",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("REWIND",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_SWITCHVIDEOMODE"]: ("VMODE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	# KEYIDS["KEY_VMODE"]: ("VMODE",),  # This value is deprecated use KEY_SWITCHVIDEOMODE instead.
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}, {  # id=4 - Formuler F1/F3.
-	# The formuler1 rcpositions file seems to define
-	# the FF and REW keys as FASTFORWARD and KEY_REWIND,
-	# but the remote.xml file issues KEY_PREVIOUSSONG
-	# and KEY_NEXTSONG.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_BACK"]: ("RECALL",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLAYLIST",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_CONTEXT_MENU"]: ("CONTEXT",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_F1"]: ("F1",),
-	KEYIDS["KEY_F2"]: ("F2",),
-	KEYIDS["KEY_F3"]: ("F3",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FASTFORWARD",),
-	KEYIDS["KEY_FAVORITES"]: ("FAVORITES",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PAUSE"]: ("PAUSE",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("REWIND",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}]
-
-AUTO_CORRECT = {
-	"CH-": "BOUQUET-",
-	"CH+": "BOUQUET+",
-	"CHANNEL-": "BOUQUET-",
-	"CHANNEL+": "BOUQUET+",
-	"CONTEXT_MENU": "CONTEXT",
-	"FAVORITES": "FAV",
-	"FFW": "FASTFORWARD",
-	"FILELIST": "LIST",
-	"FORWARD": "FASTFORWARD",
-	"MODE": "VMODE",
-	"NEXT": "ARROWRIGHT",
-	"PREVIOUS": "ARROWLEFT",
-	"PROGRAMM": "TIMER",
-	"RES": "VMODE",
-	"REW": "REWIND",
-	"RRW": "REWIND",
-	"SWITCHVIDEOMODE": "VMODE",
-	"TIME": "TIMER"
-}
-
-invert = invertKeyIds()
+savedFiles = []  # The files written while processing the current remote control.
+diagnostics = []  # The JSON records of the diagnostics of the current remote control.
+currentStem = None  # The name of the remote control being processed.
+counts = {}  # The number of each diagnostic reported for the current remote control.
 
 
 # Load the XML specifications for the remote control.
 #
-def loadRemoteXML(filename, rcButtons):
+def loadRemoteXML(filename, remote):
 	filename = "%s.xml" % filename
-	logMessage(LOG_REPORT, "Loading remote control XML definition file '%s'." % filename)
+	logMessage(LOG_REPORT, "Loading remote control XML definition file '%s'.", filename)
 	domXML = None
-	rcButtons["xmlFound"] = False
 	try:
-		with open(filename, "r") as fd:  # This open gets around a possible file handle leak in Python's XML parser.
-			try:
-				domXML = parse(fd).getroot()
-			except ParseError as err:
-				fd.seek(0)
+		try:
+			domXML = parseXML(filename)  # The document is shared with the other tools run in the same process.
+		except ParseError as err:
+			with open(filename, "r") as fd:
 				content = fd.readlines()
-				line, column = err.position
-				print("  XML Parse Error: '%s' in '%s'!" % (err, filename))
-				data = content[line - 1].replace("\t", " ").rstrip()
-				print("  XML Parse Error: '%s'" % data)
-				print("  XML Parse Error: '%s^%s'" % ("-" * column, " " * (len(data) - column - 1)))
-			except Exception as err:
-				print("  Error: Unable to parse XML remote control data in '%s' - '%s'!" % (filename, err))
+			line, column = err.position
+			print("  XML Parse Error: '%s' in '%s'!" % (err, filename))
+			recordDiagnostic("xml-parse-error", filename=filename, error=str(err), line=line, column=column)
+			data = content[line - 1].replace("\t", " ").rstrip()
+			print("  XML Parse Error: '%s'" % data)
+			print("  XML Parse Error: '%s^%s'" % ("-" * column, " " * (len(data) - column - 1)))
+		except (IOError, OSError):
+			raise  # The file can't be opened.
+		except Exception as err:
+			print("  Error: Unable to parse XML remote control data in '%s' - '%s'!" % (filename, err))
+			recordDiagnostic("xml-invalid", filename=filename, error=str(err))
 	except (IOError, OSError) as err:
 		if err.errno == ENOENT:  # No such file or directory
 			print("  Warning: Remote control XML file '%s' does not exist!" % filename)
+			recordDiagnostic("xml-missing", filename=filename)
 		else:
 			print("  Error %d: Opening remote control XML file '%s'! (%s)" % (err.errno, filename, err.strerror))
+			recordDiagnostic("xml-open-error", filename=filename, errno=err.errno, error=err.strerror)
 	except Exception as err:
 		print("  Error: Unexpected error opening remote control XML file '%s'! (%s)" % (filename, err))
+		recordDiagnostic("xml-unexpected-error", filename=filename, error=str(err))
 	if domXML is None:
-		logMessage(LOG_WARNING, "Remote control XML is undefined so remote control id will be processed as '2'!")
-		rcButtons["id"] = 2
-		return rcButtons
+		logDiagnostic("xml-undefined")
+		remote.id = 2
+		return remote
 	rc = domXML.find("rc")
 	if rc is None:
-		logMessage(LOG_ERROR, "Remote control XML file structure is invalid!")
-		return rcButtons
-	rcButtons["xmlFound"] = True
-	rcButtons["xmlButtons"] = []
+		logDiagnostic("xml-structure")
+		return remote
+	remote.xmlFound = True
+	xmlButtons = []
 	id = rc.attrib.get("id")
 	if id:
 		msg = " but being processed as '%d'"
@@ -859,15 +155,16 @@ def loadRemoteXML(filename, rcButtons):
 			msg = msg % index
 		if id == str(index):
 			msg = ""
-		logMessage(LOG_REPORT, "Remote control id defined as '%s'%s." % (id, msg))
-		rcButtons["id"] = index
+		logMessage(LOG_REPORT, "Remote control id defined as '%s'%s.", id, msg)
+		remote.id = index
 	else:
 		logMessage(LOG_REPORT, "Remote control id is undefined so '2' will be assumed.")
-		rcButtons["id"] = 2
+		index = 2
+		remote.id = index
 	image = rc.attrib.get("image")
 	if image:
 		image = pathjoin(REMOTE_IMAGE_PATH, "%s.png" % image.split("/")[3])
-		rcButtons["xmlImage"] = image
+		remote.xmlImage = image
 	placeHolder = 0
 	found = 0
 	sequence = 0
@@ -884,7 +181,7 @@ def loadRemoteXML(filename, rcButtons):
 		if keyName:
 			keyId = KEYIDS.get(keyName)
 			if keyId is None:
-				logMessage(LOG_ERROR, "The keyName '%s' appears invalid!" % keyName)
+				logDiagnostic("keyname-invalid", keyName=keyName)
 				continue
 			elif keyId == 0:
 				placeHolder -= 1
@@ -892,15 +189,12 @@ def loadRemoteXML(filename, rcButtons):
 			if remap:
 				remapId = KEYIDS.get(remap)
 				if remapId is None:
-					logMessage(LOG_ERROR, "The remap keyName '%s' appears invalid!" % remap)
+					logDiagnostic("remap-invalid", keyId, keyName, remap=remap)
 					continue
-				labelled = " and labelled '%s'" % label if label else ""
-				titled = " and titled '%s'" % title if title else ""
-				logMessage(LOG_INFORMATION, "Button '%s' (%d) remapped to '%s' (%d)%s%s." % (keyName, keyId, remap, remapId, labelled, titled))
-				if remapId not in rcButtons:
-					rcButtons[remapId] = {}
-				rcButtons[remapId]["remapName"] = keyName
-				rcButtons[remapId]["remapId"] = keyId
+				logDiagnostic("remapped", keyId, keyName, remap=remap, remapId=remapId, label=label, title=title)
+				rcButton = remote.button(remapId)
+				rcButton.remapName = keyName
+				rcButton.remapId = keyId
 				keyName = remap
 				keyId = remapId
 		elif name:
@@ -909,48 +203,44 @@ def loadRemoteXML(filename, rcButtons):
 				dummy = int(name)
 			except (TypeError, ValueError):
 				if name and not name.isupper():
-					logMessage(LOG_NOTE, "Auto correcting case of button name '%s' to '%s'." % (name, name.upper()))
+					logDiagnostic("name-case", name=name, newName=name.upper())
 					name = name.upper()
 			if name in AUTO_CORRECT:
-				logMessage(LOG_NOTE, "Auto correcting button name '%s' to '%s'." % (name, AUTO_CORRECT[name]))
+				logDiagnostic("name-corrected", name=name, newName=AUTO_CORRECT[name])
 				name = AUTO_CORRECT[name]
-			for keyId, names in KEYDESCRIPTIONS[index].items():
-				if names[0] == name:
-					break
-			else:
-				logMessage(LOG_ERROR, "The keyId can't be derived from the name '%s'!" % name)
+			keyId = keyIdFromName(index, name)
+			if keyId is None:
+				logDiagnostic("name-unknown", name=name)
 				continue
-			keyName = invert.get(keyId)
+			keyName = KEYIDNAMES.get(keyId)
 			if keyName is None:
-				logMessage(LOG_ERROR, "The keyName can't be derived from the keyId '%s'!" % keyId)
+				logDiagnostic("keyid-unknown", keyId)
 				continue
 		else:
-			logMessage(LOG_ERROR, "The keyName and keyId can't be determined as the name is also undefined!")
+			logDiagnostic("button-unidentified")
 			continue
 		# print(">   Found keyId=%d, keyName='%s', name='%s', label='%s', pos='%s', title='%s', shape='%s', coords='%s'." % (keyId, keyName, name, label, pos, title, shape, coords))
-		if keyId not in rcButtons:
-			rcButtons[keyId] = {}
-		rcButtons["xmlButtons"].append(keyId)
-		rcButtons[keyId]["xmlKeyName"] = keyName
-		rcButtons[keyId]["xmlKeyId"] = keyId
+		xmlButtons.append(keyId)
 		sequence += 1
-		rcButtons[keyId]["xmlSequence"] = "%06d" % sequence
+		rcButton = remote.button(keyId)
+		if rcButton.xml is None:
+			rcButton.xml = ButtonSide(keyId)
+		side = rcButton.xml  # A repeated button updates the earlier definition.
+		side.keyName = keyName
+		side.sequence = sequence
 		if name:
-			rcButtons[keyId]["xmlName"] = name
+			side.name = name
 		if label:
-			rcButtons[keyId]["xmlLabel"] = label
+			side.label = label
 		if pos:
 			valid, newPos = checkValueList(pos, 2, "pos", keyId, keyName)
 			if valid:
-				rcButtons[keyId]["xmlPos"] = newPos
-				rcButtons[keyId]["xmlPosition"] = "%06d%06d" % (newPos[1], newPos[0])
-		else:
-			rcButtons[keyId]["xmlPosition"] = "999999999999"
+				side.pos = tuple(newPos)
 		if title:
-			rcButtons[keyId]["xmlTitle"] = title
+			side.title = title
 		if shape:
 			shape = checkShape(shape, coords, keyId, keyName)
-			rcButtons[keyId]["xmlShape"] = shape
+			side.shape = shape
 		if coords:
 			if shape == "circle":
 				listSize = 3
@@ -960,18 +250,17 @@ def loadRemoteXML(filename, rcButtons):
 				listSize = 4
 			valid, coords = checkValueList(coords, listSize, "coords", keyId, keyName)
 			if valid:
-				rcButtons[keyId]["xmlCoords"] = coords
-	rcButtons["xmlButtons"] = sorted([int(x) for x in rcButtons["xmlButtons"]])
-	return rcButtons
+				side.coords = tuple(coords)
+	remote.xmlButtons = sorted(xmlButtons)
+	return remote
 
 
 # Load the HTML specifications for the remote control.
 #
-def loadRemoteHTML(filename, rcButtons):
+def loadRemoteHTML(filename, remote):
 	filename = "%s.html" % filename
-	logMessage(LOG_REPORT, "Loading remote control HTML definition file '%s'." % filename)
+	logMessage(LOG_REPORT, "Loading remote control HTML definition file '%s'.", filename)
 	domHTML = None
-	rcButtons["htmlFound"] = False
 	try:
 		with open(filename, "r") as fd:  # This open gets around a possible file handle leak in Python's XML parser.
 			lines = fd.read().splitlines()
@@ -989,44 +278,49 @@ def loadRemoteHTML(filename, rcButtons):
 				content = newLines
 				line, column = err.position
 				print("  HTML Parse Error: '%s' in '%s'!" % (err, filename))
+				recordDiagnostic("html-parse-error", filename=filename, error=str(err), line=line, column=column)
 				data = content[line - 1].replace("\t", " ").rstrip()
 				print("  HTML Parse Error: '%s'" % data)
 				print("  HTML Parse Error: '%s^%s'" % ("-" * column, " " * (len(data) - column - 1)))
 			except Exception as err:
 				print("  Error: Unable to parse HTML remote control data in '%s' - '%s'!" % (filename, err))
+				recordDiagnostic("html-invalid", filename=filename, error=str(err))
 	except (IOError, OSError) as err:
 		if err.errno == ENOENT:  # No such file or directory
 			print("  Warning: Remote control HTML file '%s' does not exist!" % filename)
+			recordDiagnostic("html-missing", filename=filename)
 		else:
 			print("  Error %d: Opening remote control HTML file '%s'! (%s)" % (err.errno, filename, err.strerror))
+			recordDiagnostic("html-open-error", filename=filename, errno=err.errno, error=err.strerror)
 	except Exception as err:
 		print("  Error: Unexpected error opening remote control HTML file '%s'! (%s)" % (filename, err))
+		recordDiagnostic("html-unexpected-error", filename=filename, error=str(err))
 	if domHTML is None:
-		logMessage(LOG_WARNING, "Remote control HTML is undefined!")
-		return rcButtons
+		logDiagnostic("html-undefined")
+		return remote
 	img = domHTML.find("img")
 	if img is None:
-		logMessage(LOG_ERROR, "No remote control image found in HTML file!")
+		logDiagnostic("html-no-image")
 	else:
 		image = img.attrib.get("src")
 		if image:
 			image = pathjoin(REMOTE_IMAGE_PATH, "%s.png" % image.split("/")[3])
-			rcButtons["htmlImage"] = image
+			remote.htmlImage = image
 	map = domHTML.find("map")
 	if map is None:
-		logMessage(LOG_ERROR, "Remote control HTML file structure is invalid!")
-		return rcButtons
-	rcButtons["htmlFound"] = True
-	rcButtons["htmlButtons"] = []
+		logDiagnostic("html-structure")
+		return remote
+	remote.htmlFound = True
+	htmlButtons = []
 	placeHolder = 0
 	sequence = 0
 	for area in map.findall("area"):
 		keyId = area.attrib.get("onclick", "").replace("pressMenuRemote(", "").replace(");", "").replace("'", "")
 		if keyId:
 			keyId = int(keyId)
-			keyName = invert.get(keyId)
+			keyName = KEYIDNAMES.get(keyId)
 			if keyName is None:
-				logMessage(LOG_ERROR, "The keyName can't be derived from the keyId '%s'!" % keyId)
+				logDiagnostic("keyid-unknown", keyId)
 		else:
 			placeHolder -= 1
 			keyId = placeHolder
@@ -1034,26 +328,27 @@ def loadRemoteHTML(filename, rcButtons):
 		title = formatLine(area.attrib.get("title"), FORMAT_TITLES)
 		alt = formatLine(area.attrib.get("alt"), FORMAT_TITLES)
 		if title and alt and title != alt:
-			logMessage(LOG_NOTE, "Button '%s' (%d) has both 'title' and 'alt' attributes but they are different!  ('%s' != '%s')" % (keyName, keyId, title, alt))
+			logDiagnostic("title-alt-differ", keyId, keyName, title=title, alt=alt)
 		if title is None and alt:
-			logMessage(LOG_NOTE, "Button '%s' (%d) has no 'title' attribute, using 'alt' instead." % (keyName, keyId))
+			logDiagnostic("title-from-alt", keyId, keyName)
 			title = alt
 		shape = area.attrib.get("shape")
 		coords = area.attrib.get("coords")
 		onclick = area.attrib.get("onclick")
 		# print(">   Found keyId=%d, keyName='%s', title='%s', shape='%s', coords='%s', onclick='%s'." % (keyId, keyName, title, shape, coords, onclick))
-		if keyId not in rcButtons:
-			rcButtons[keyId] = {}
-		rcButtons["htmlButtons"].append(keyId)
+		htmlButtons.append(keyId)
 		sequence += 1
-		rcButtons[keyId]["htmlSequence"] = "%06d" % sequence
-		rcButtons[keyId]["htmlKeyName"] = keyName
-		rcButtons[keyId]["htmlKeyId"] = keyId
+		rcButton = remote.button(keyId)
+		if rcButton.html is None:
+			rcButton.html = ButtonSide(keyId)
+		side = rcButton.html  # A repeated button updates the earlier definition.
+		side.keyName = keyName
+		side.sequence = sequence
 		if title:
-			rcButtons[keyId]["htmlTitle"] = title
+			side.title = title
 		if shape:
 			shape = checkShape(shape, coords, keyId, keyName)
-			rcButtons[keyId]["htmlShape"] = shape
+			side.shape = shape
 		if coords:
 			if shape == "circle":
 				listSize = 3
@@ -1063,7 +358,7 @@ def loadRemoteHTML(filename, rcButtons):
 				listSize = 4
 			valid, coords = checkValueList(coords, listSize, "coords", keyId, keyName)
 			if valid:
-				rcButtons[keyId]["htmlCoords"] = coords
+				side.coords = tuple(coords)
 		# if shape == "circle":
 		# 	pos = [coords[0], coords[1]]
 		# elif shape == "poly":
@@ -1072,25 +367,24 @@ def loadRemoteHTML(filename, rcButtons):
 		# 	for index in range(count, 2):
 		# 		pos[0] += coords[index]
 		# 		pos[1] += coords[index + 1]
-		# 	pos = [int(round(pos[0] * 2 / count)), int(round(pos[1] * 2 / count))]
+		# 	pos = [pos[0] * 2 // count, pos[1] * 2 // count]
 		# elif shape == "rect":
-		# 	pos = [coords[0] + int(round((coords[2] - coords[0]) / 2)), coords[1] + int(round((coords[3] - coords[1]) / 2))]
+		# 	pos = [coords[0] + (coords[2] - coords[0]) // 2, coords[1] + (coords[3] - coords[1]) // 2]
 		# else:
 		# 	pos = None
 		# if pos:
 		# 	valid, pos = checkValueList(pos, 2, "pos", keyId, keyName)
 		# 	if valid:
-		# 		logMessage(LOG_NOTE, "Remote control keyid %s (%d) attribute 'pos' with a value of %s is being added." % (keyName, keyId, str(pos)))
-		# 		rcButtons[keyId]["htmlPos"] = pos
-		# 		rcButtons[keyId]["htmlPosition"] = "%06d%06d" % (pos[1], pos[0])
+		# 		logDiagnostic("pos-added", keyId, keyName, "pos", value=pos)
+		# 		side.pos = tuple(pos)
 		if keyId > 0:
 			onClick = "pressMenuRemote('%s');" % keyId
 			if onclick != onClick:
-				logMessage(LOG_NOTE, "Auto correcting format of onclick '%s' to '%s'." % (onclick, onClick))
+				logDiagnostic("onclick-format", keyId, keyName, onclick=onclick, newOnclick=onClick)
 				onclick = onClick
-			rcButtons[keyId]["htmlOnclick"] = onclick
-	rcButtons["htmlButtons"] = sorted([int(x) for x in rcButtons["htmlButtons"]])
-	return rcButtons
+			side.onclick = onclick
+	remote.htmlButtons = sorted(htmlButtons)
+	return remote
 
 
 def formatLine(line, format):
@@ -1105,15 +399,13 @@ def formatLine(line, format):
 
 
 def checkValueList(valueList, listSize, attrib, keyId, keyName):
-	attrib = " attribute '%s'" % attrib if attrib else ""
-	msg = " in button '%s' (%d)%s" % (keyName, keyId, attrib)
 	if isinstance(valueList, str):
 		if "." in valueList:
-			logMessage(LOG_ALERT, "Values%s are using '.' as a separator!" % msg)
+			logDiagnostic("value-separator", keyId, keyName, attrib, value=valueList)
 			valueList.replace(".", ",")
 		valueList = [x.strip() for x in valueList.split(",")]
 	if not isinstance(valueList, (list, tuple)):
-		logMessage(LOG_ALERT, "Value '%s'%s is not a comma separated list!" % (str(valueList), msg))
+		logDiagnostic("value-not-list", keyId, keyName, attrib, value=valueList)
 		return False, valueList
 	size = len(valueList)
 	valid = False
@@ -1123,33 +415,32 @@ def checkValueList(valueList, listSize, attrib, keyId, keyName):
 			value = int(value)
 			checkedValueList.append(value)
 			if value > 500:
-				logMessage(LOG_ALERT, "Value %s%s has an item value of %d which is out of the expected range!" % (str(valueList), msg, value))
+				logDiagnostic("value-range", keyId, keyName, attrib, value=valueList, item=value)
 		if listSize and size == listSize:
 			valid = True
 		elif listSize and size < listSize:
-			logMessage(LOG_ALERT, "Value %s%s is shorter than expected!" % (str(valueList), msg))
+			logDiagnostic("value-short", keyId, keyName, attrib, value=valueList)
 		elif listSize and size > listSize:
-			logMessage(LOG_ALERT, "Value %s%s is longer than expected!" % (str(valueList), msg))
+			logDiagnostic("value-long", keyId, keyName, attrib, value=valueList)
 		else:
 			valid = True
 		valueList = checkedValueList
 	except (ValueError, TypeError):
 		if listSize and size == listSize:
-			logMessage(LOG_ALERT, "Value %s%s is invalid but is the correct length!" % (str(valueList), msg))
+			logDiagnostic("value-invalid", keyId, keyName, attrib, value=valueList)
 		elif listSize and size < listSize:
-			logMessage(LOG_ALERT, "Value %s%s is invalid and shorter than expected!" % (str(valueList), msg))
+			logDiagnostic("value-invalid-short", keyId, keyName, attrib, value=valueList)
 		elif listSize and size > listSize:
-			logMessage(LOG_ALERT, "Value %s%s is invalid and longer than expected!" % (str(valueList), msg))
+			logDiagnostic("value-invalid-long", keyId, keyName, attrib, value=valueList)
 	return valid, valueList
 
 
 def checkShape(shape, coords, keyId, keyName):
-	msg = " in button '%s' (%d)" % (keyName, keyId)
 	if not shape.islower():
-		logMessage(LOG_NOTE, "Auto correcting case of button shape '%s'%s to '%s'." % (shape, msg, shape.lower()))
+		logDiagnostic("shape-case", keyId, keyName, shape=shape, newShape=shape.lower())
 		shape = shape.lower()
 	if shape not in ("circle", "poly", "rect"):
-		logMessage(LOG_ERROR, "Invalid shape '%s'%s detected!" % (shape, msg))
+		logDiagnostic("shape-invalid", keyId, keyName, shape=shape)
 	newShape = None
 	if coords:
 		valid, data = checkValueList(coords, 0, None, keyId, keyName)
@@ -1162,241 +453,220 @@ def checkShape(shape, coords, keyId, keyName):
 			elif size > 5 and (size % 2) == 0:
 				newShape = "poly"
 		else:
-			logMessage(LOG_WARNING, "Coordinates %s%s are invalid!" % (data, msg))
+			logDiagnostic("coords-invalid", keyId, keyName, coords=data)
 	if newShape and shape != newShape:
 		if newShape:
-			logMessage(LOG_NOTE, "Shape '%s'%s inconsistent with %d coordinates, auto correcting shape to '%s'!" % (shape, msg, size, newShape))
+			logDiagnostic("shape-corrected", keyId, keyName, shape=shape, count=size, newShape=newShape)
 			shape = newShape
 		else:
-			logMessage(LOG_ERROR, "Shape '%s'%s inconsistent with %d coordinates!" % (shape, msg, size))
+			logDiagnostic("shape-inconsistent", keyId, keyName, shape=shape, count=size)
 	return shape
 
 
-# Sort the remote control buttons ready for output.
+# Sort the remote control buttons ready for output.  Buttons without a
+# sequence or position sort after the others in key id order.
 #
-def sortButtons(sortOrder, rcButtons):
-	buttonOrder = {}
-	nonButtons = []
-	for keyId in rcButtons.keys():
-		try:
-			keyId = int(keyId)
-			if sortOrder == SORT_KEYID:
-				buttonOrder["%06d" % keyId] = keyId
-			elif sortOrder == SORT_POSITION_XML:
-				buttonOrder[rcButtons[keyId].get("xmlPosition", "999999999999")] = keyId
-			elif sortOrder == SORT_POSITION_HTML:
-				buttonOrder[rcButtons[keyId].get("htmlPosition", "999999999999")] = keyId
-			elif sortOrder == SORT_SEQUENCE_XML:
-				buttonOrder[rcButtons[keyId].get("xmlSequence", "999999")] = keyId
-			elif sortOrder == SORT_SEQUENCE_HTML:
-				buttonOrder[rcButtons[keyId].get("htmlSequence", "999999")] = keyId
-		except ValueError:
-			nonButtons.append((keyId, rcButtons[keyId]))
-	keyIds = []
-	for keyId in sorted(buttonOrder.keys()):
-		keyIds.append(buttonOrder[keyId])
-	for keyId in sorted(nonButtons):
-		logMessage(LOG_DEBUG, "Additional data item '%s' found '%s'." % (keyId[0], keyId[1]))
-	return keyIds
+def sortButtons(sortOrder, remote):
+	if sortOrder == SORT_KEYID:
+		sortKey = lambda x: x.keyId
+	elif sortOrder == SORT_POSITION_XML:
+		sortKey = lambda x: (x.xml.position() if x.xml else (UNSORTED, UNSORTED), x.keyId)
+	elif sortOrder == SORT_POSITION_HTML:
+		sortKey = lambda x: (x.html.position() if x.html else (UNSORTED, UNSORTED), x.keyId)
+	elif sortOrder == SORT_SEQUENCE_XML:
+		sortKey = lambda x: (x.xml.sequence if x.xml else UNSORTED, x.keyId)
+	elif sortOrder == SORT_SEQUENCE_HTML:
+		sortKey = lambda x: (x.html.sequence if x.html else UNSORTED, x.keyId)
+	return [x.keyId for x in sorted(remote.buttons.values(), key=sortKey)]
 
 
 # Compare the image and list of buttons defined in the XML and HTML files.
 #
-def compareRemotes(filename, rcButtons):
+def compareRemotes(filename, remote):
 	imageMatch = True
-	if "xmlImage" in rcButtons and "htmlImage" in rcButtons:
-		if rcButtons["xmlImage"] == rcButtons["htmlImage"]:
-			rcButtons["image"] = rcButtons["xmlImage"]
+	if remote.xmlImage and remote.htmlImage:
+		if remote.xmlImage == remote.htmlImage:
+			remote.image = remote.xmlImage
 		else:
-			logMessage(LOG_ALERT, "Remote control XML image value doesn't match HTML value!  ('%s' != '%s')" % (rcButtons["xmlImage"], rcButtons["htmlImage"]))
-			rcButtons["image"] = rcButtons["htmlImage"]
+			logDiagnostic("image-mismatch", xmlImage=remote.xmlImage, htmlImage=remote.htmlImage)
+			remote.image = remote.htmlImage
 			imageMatch = False
-	elif "xmlImage" in rcButtons:
-		rcButtons["image"] = rcButtons["xmlImage"]
-	elif "htmlImage" in rcButtons:
-		rcButtons["image"] = rcButtons["htmlImage"]
+	elif remote.xmlImage:
+		remote.image = remote.xmlImage
+	elif remote.htmlImage:
+		remote.image = remote.htmlImage
 	else:
-		logMessage(LOG_ERROR, "No image reference can be found for this remote control!")
-		if isfile("%s.png" % filename):
-			logMessage(LOG_INFORMATION, "An image file for this remote control appears to be available.")
+		logDiagnostic("image-undefined")
+		assets = findAssets(filename)
+		if diagnosticEnabled("image-available") and assets and assets.png:
+			logDiagnostic("image-available")
 		imageMatch = False
 	xmlDiffs = []
 	htmlDiffs = []
-	if "xmlButtons" in rcButtons and "htmlButtons" in rcButtons:
+	if remote.xmlButtons is not None and remote.htmlButtons is not None:
 		# This creates a single differences list.  I think the individual differences will be more helpful.
-		# diffs = list(set(rcButtons["xmlButtons"]).symmetric_difference(set(rcButtons["htmlButtons"])))
+		# diffs = list(set(remote.xmlButtons).symmetric_difference(set(remote.htmlButtons)))
 		# if diffs:
 		# 	msgs = []
 		# 	for keyId in sorted(diffs):
-		# 		msgs.append("Button keyid '%s' (%d)." % (invert.get(keyId, "*Undefined*"), keyId))
+		# 		msgs.append("Button keyid '%s' (%d)." % (KEYIDNAMES.get(keyId, "*Undefined*"), keyId))
 		# 	logMessage(LOG_ERROR, "The sets of buttons differ between the XML and HTML files!\n\t%s" % "\n\t".join(msgs))
-		xmlDiffs = list(set(rcButtons["xmlButtons"]) - set(rcButtons["htmlButtons"]))
-		if xmlDiffs:
-			rcButtons["xmlOnly"] = xmlDiffs
-			msgs = []
-			for keyId in sorted(xmlDiffs):
-				msgs.append("Button keyid '%s' (%d) named '%s'." % (rcButtons[keyId].get("xmlKeyName", "*Undefined*"), keyId, rcButtons[keyId].get("xmlName", "*Undefined*")))
-			logMessage(LOG_ERROR, "These buttons are in the XML file but not the HTML file!\n\t%s" % "\n\t".join(msgs))
-		htmlDiffs = list(set(rcButtons["htmlButtons"]) - set(rcButtons["xmlButtons"]))
-		if htmlDiffs:
-			rcButtons["htmlOnly"] = htmlDiffs
-			msgs = []
-			for keyId in sorted(htmlDiffs):
-				msgs.append("Button keyid '%s' (%d) titled '%s'." % (rcButtons[keyId].get("htmlKeyName", "*Undefined*"), keyId, rcButtons[keyId].get("htmlTitle", "*Undefined*")))
-			logMessage(LOG_ERROR, "These buttons are in the HTML file but not the XML file!\n\t%s" % "\n\t".join(msgs))
+		xmlDiffs = list(set(remote.xmlButtons) - set(remote.htmlButtons))
+		if xmlDiffs and diagnosticEnabled("xml-only-buttons"):
+			buttons = [(keyId, remote.buttons[keyId].xml.keyName, remote.buttons[keyId].xml.name) for keyId in sorted(xmlDiffs)]
+			logDiagnostic("xml-only-buttons", buttons=buttons)
+		htmlDiffs = list(set(remote.htmlButtons) - set(remote.xmlButtons))
+		if htmlDiffs and diagnosticEnabled("html-only-buttons"):
+			buttons = [(keyId, remote.buttons[keyId].html.keyName, remote.buttons[keyId].html.title) for keyId in sorted(htmlDiffs)]
+			logDiagnostic("html-only-buttons", buttons=buttons)
 	if xmlDiffs or htmlDiffs:
-		logMessage(LOG_ERROR, "Remote control XML and HTML buttons are mismatched so the validation is incomplete and may be in inaccurate!")
-	rcButtons["xmlOnly"] = xmlDiffs
-	rcButtons["htmlOnly"] = htmlDiffs
+		logDiagnostic("buttons-mismatched")
+	remote.xmlOnly = xmlDiffs
+	remote.htmlOnly = htmlDiffs
 	return imageMatch and xmlDiffs + htmlDiffs == []
 
 
-# Compare the XML and HTML versions of the remote control buttons.
+# Compare the XML and HTML versions of the remote control buttons.  The
+# positions of all the buttons are checked against the centers of their
+# shapes together once the buttons have been merged, the diagnostics of
+# each button are then reported in button order.
 #
-def compareButtons(keyIds, rcButtons):
+def compareButtons(keyIds, remote):
+	mismatches = {}
 	for keyId in keyIds:
-		keyName = invert.get(keyId)
-		for attrib in ["keyName", "keyId", "name", "label", "pos", "title", "shape", "coords", "onclick"]:
-			xmlAttrib = "xml%s%s" % (attrib[0].upper(), attrib[1:])
-			htmlAttrib = "html%s%s" % (attrib[0].upper(), attrib[1:])
-			if xmlAttrib in rcButtons[keyId] and htmlAttrib in rcButtons[keyId]:
-				if rcButtons[keyId][xmlAttrib] == rcButtons[keyId][htmlAttrib]:
-					rcButtons[keyId][attrib] = rcButtons[keyId][xmlAttrib]
+		button = remote.buttons[keyId]
+		xml = button.xml
+		html = button.html
+		for attrib in ATTRIBUTES:
+			xmlValue = getattr(xml, attrib) if xml else None
+			htmlValue = getattr(html, attrib) if html else None
+			if xmlValue is not None and htmlValue is not None:
+				if xmlValue == htmlValue:
+					value = xmlValue
 				else:
-					logMessage(LOG_WARNING, "Remote control keyid %s (%d) XML '%s' value doesn't match HTML value!  ('%s' != '%s')" % (keyName, keyId, attrib, rcButtons[keyId][xmlAttrib], rcButtons[keyId][htmlAttrib]))
-					if attrib == "pos":
-						rcButtons[keyId][attrib] = rcButtons[keyId][xmlAttrib]
-					else:
-						rcButtons[keyId][attrib] = rcButtons[keyId][htmlAttrib]
-			elif xmlAttrib in rcButtons[keyId]:
-				rcButtons[keyId][attrib] = rcButtons[keyId][xmlAttrib]
-			elif htmlAttrib in rcButtons[keyId]:
-				rcButtons[keyId][attrib] = rcButtons[keyId][htmlAttrib]
-			if attrib in ("label", "title") and rcButtons[keyId].get(attrib):
-				rcButtons[keyId][attrib] = rcButtons[keyId][attrib].replace("<", "&lt;").replace(">", "&gt;")
-		shape = rcButtons[keyId].get("shape")
-		pos = rcButtons[keyId].get("pos")
-		coords = rcButtons[keyId].get("coords")
-		axes = ["X axis", "Y axis"]
-		errors = []
-		if shape == "circle" and pos and coords:
-			center = [coords[0], coords[1]]
-			for index, axis in enumerate(axes):
-				if abs(pos[index] - center[index]) > TOLERANCE:
-					errors.append(axis)
-		elif shape == "poly" and pos and coords:
-			count = len(coords)
-			center = [0, 0]
-			for index in range(count, 2):
-				center[0] += coords[index]
-				center[1] += coords[index + 1]
-			center = [int(round(center[0] * 2 / count)), int(round(center[1] * 2 / count))]
-			for index, axis in enumerate(axes):
-				if abs(pos[index] - center[index]) > TOLERANCE:
-					errors.append(axis)
-		elif shape == "rect" and pos and coords:
-			center = [coords[0] + int(round((coords[2] - coords[0]) / 2)), coords[1] + int(round((coords[3] - coords[1]) / 2))]
-			for index, axis in enumerate(axes):
-				if abs(pos[index] - center[index]) > TOLERANCE:
-					errors.append(axis)
-		if errors:
-			msg = "%s value exceeds" if len(errors) == 1 else "%s values exceed"
-			msg = msg % " and ".join(errors)
-			logMessage(LOG_WARNING, "Remote control keyid %s (%d) %s tolerance of %d pixel%s!  (shape='%s' pos=%s coords=%s center=%s)" % (keyName, keyId, msg, TOLERANCE, "" if TOLERANCE == 1 else "s", shape, pos, coords, center))
-	return rcButtons
+					mismatches.setdefault(keyId, []).append((attrib, xmlValue, htmlValue))
+					value = xmlValue if attrib == "pos" else htmlValue
+			elif xmlValue is not None:
+				value = xmlValue
+			else:
+				value = htmlValue
+			if attrib in ("label", "title") and value:
+				value = value.replace("<", "&lt;").replace(">", "&gt;")
+			setattr(button, attrib, value)
+	deviations = {}
+	if diagnosticEnabled("pos-tolerance"):
+		buttons = [remote.buttons[keyId] for keyId in keyIds]
+		deviations = dict(zip(keyIds, toleranceDeviations([(x.shape, x.pos, x.coords) for x in buttons], TOLERANCE)))
+	for keyId in keyIds:
+		keyName = KEYIDNAMES.get(keyId)
+		for attrib, xmlValue, htmlValue in mismatches.get(keyId, []):
+			logDiagnostic("value-mismatch", keyId, keyName, attrib, xmlValue=xmlValue, htmlValue=htmlValue)
+		if deviations.get(keyId):
+			button = remote.buttons[keyId]
+			center, exceeds = deviations[keyId]
+			axes = [axis for axis, exceed in zip(("X axis", "Y axis"), exceeds) if exceed]
+			logDiagnostic("pos-tolerance", keyId, keyName, "pos", axes=axes, tolerance=TOLERANCE, shape=button.shape, pos=button.pos, coords=button.coords, center=list(center))
+	return remote
 
 
 # Complete any missing attributes that can be derived from other attributes.
 #
-def completeAttributes(keyIds, rcButtons):
+def completeAttributes(keyIds, remote):
 	for keyId in keyIds:
-		keyName = rcButtons[keyId].get("keyName")
-		name = rcButtons[keyId].get("name")
-		label = rcButtons[keyId].get("label")
-		title = rcButtons[keyId].get("title")
-		pos = rcButtons[keyId].get("pos")
-		shape = rcButtons[keyId].get("shape")
-		coords = rcButtons[keyId].get("coords")
+		button = remote.buttons[keyId]
+		keyName = button.keyName
+		name = button.name
+		label = button.label
+		title = button.title
+		pos = button.pos
+		shape = button.shape
+		coords = button.coords
 		if name is None and keyId > 0:
 			if label:
 				name = label.upper()
 			elif title:
 				name = title.upper()
-			logMessage(LOG_NOTE, "Remote control keyid %s (%d) attribute 'name' with a value of '%s' is being added." % (keyName, keyId, name))
-			rcButtons[keyId]["name"] = name
+			logDiagnostic("name-added", keyId, keyName, "name", value=name)
+			button.name = name
 		if label is None:
 			if name:
 				label = formatLine(name, FORMAT_LABELS)
 			elif title:
 				label = formatLine(title, FORMAT_LABELS)
-			logMessage(LOG_NOTE, "Remote control keyid %s (%d) attribute 'label' with a value of '%s' is being added." % (keyName, keyId, label))
-			rcButtons[keyId]["label"] = label
+			logDiagnostic("label-added", keyId, keyName, "label", value=label)
+			button.label = label
 		if title is None:
 			if label:
 				title = formatLine(label, FORMAT_TITLES)
 			elif name:
 				title = formatLine(name, FORMAT_TITLES)
-			logMessage(LOG_NOTE, "Remote control keyid %s (%d) attribute 'title' with a value of '%s' is being added." % (keyName, keyId, title))
-			rcButtons[keyId]["title"] = title
+			logDiagnostic("title-added", keyId, keyName, "title", value=title)
+			button.title = title
 		if pos is None and coords:
-			if shape == "circle":
-				pos = [coords[0], coords[1]]
-			elif shape == "poly":
-				count = len(coords)
-				pos = [0, 0]
-				for index in range(count, 2):
-					pos[0] += coords[index]
-					pos[1] += coords[index + 1]
-				pos = [int(round(pos[0] * 2 / count)), int(round(pos[1] * 2 / count))]
-			elif shape == "rect":
-				pos = [coords[0] + int(round((coords[2] - coords[0]) / 2)), coords[1] + int(round((coords[3] - coords[1]) / 2))]
-			logMessage(LOG_NOTE, "Remote control keyid %s (%d) attribute 'pos' with a value of %s is being added." % (keyName, keyId, str(pos)))
-			rcButtons[keyId]["pos"] = pos
+			pos = shapeCenter(shape, coords)
+			logDiagnostic("pos-added", keyId, keyName, "pos", value=pos)
+			button.pos = pos
 		if coords is None and pos:
 			if shape == "circle":
-				coords = [pos[0], pos[1], 12]
+				coords = (pos[0], pos[1], 12)
 			elif shape == "poly":
-				coords = [pos[0] - 6, pos[1], pos[0], pos[1] - 6, pos[0] + 6, pos[1], pos[0] + 6]
+				coords = (pos[0] - 6, pos[1], pos[0], pos[1] - 6, pos[0] + 6, pos[1], pos[0] + 6)
 			elif shape == "rect":
-				coords = [pos[0] - 6, pos[1] - 6, pos[0] + 6, pos[1] + 6]
-			logMessage(LOG_NOTE, "Remote control keyid %s (%d) attribute 'coords' with a value of %s is being added." % (keyName, keyId, str(coords)))
-			rcButtons[keyId]["coords"] = coords
-	return rcButtons
+				coords = (pos[0] - 6, pos[1] - 6, pos[0] + 6, pos[1] + 6)
+			logDiagnostic("coords-added", keyId, keyName, "coords", value=coords)
+			button.coords = coords
+	return remote
+
+
+# Check that the shapes of all the buttons lie within the remote control
+# image.  Nothing is checked if the image is missing or invalid.
+#
+def checkImageBounds(filename, keyIds, remote):
+	if not diagnosticEnabled("shape-outside-image"):
+		return
+	assets = findAssets(filename)
+	size = pngSize(assets.png) if assets and assets.png else None
+	if size is None:
+		return
+	buttons = [remote.buttons[keyId] for keyId in keyIds]
+	for keyId, button, outside in zip(keyIds, buttons, outsideImage(shapeBoxes([(x.shape, x.coords) for x in buttons]), size[0], size[1])):
+		if outside:
+			logDiagnostic("shape-outside-image", keyId, KEYIDNAMES.get(keyId), "coords", shape=button.shape, coords=button.coords, width=size[0], height=size[1])
 
 
 # Create the XML button definition file.
 #
-def buildXML(filename, type, keyIds, rcButtons):
+def buildXML(filename, type, keyIds, remote):
 	xml = []
 	xml.append("<rcs>")
+	id = 2 if remote.id is None else remote.id
 	if type == "New":
-		xml.append("\t<rc image=\"%s\">" % rcButtons.get("image"))
+		xml.append("\t<rc image=\"%s\">" % remote.image)
 	elif type == "Old":
-		xml.append("\t<rc id=\"%d\">" % rcButtons.get("id", 2))
+		xml.append("\t<rc id=\"%d\">" % id)
 	else:
-		xml.append("\t<rc id=\"%d\" image=\"%s\">" % (rcButtons.get("id", 2), rcButtons.get("image")))
+		xml.append("\t<rc id=\"%d\" image=\"%s\">" % (id, remote.image))
 	for key in keyIds:
-		value = rcButtons[key]
+		button = remote.buttons[key]
 		attribs = []
-		keyName = value.get("keyName", "KEY_RESERVED")
-		keyId = value.get("keyId", 0)
+		keyName = button.keyName or "KEY_RESERVED"
+		keyId = button.keyId
 		if key != keyId:
-			logMessage(LOG_ERROR, "Sort key '%d' does not match the key id '%d'!" % (key, keyId))
-		remapName = value.get("remapName")
-		if remapName:
-			attribs.append("id=\"%s\"" % remapName)
+			logDiagnostic("sort-key-mismatch", keyId, button.keyName, key=key)
+		if button.remapName:
+			attribs.append("id=\"%s\"" % button.remapName)
 			attribs.append("remap=\"%s\"" % keyName)
 		elif type in ("Hybrid", "New"):
 			attribs.append("id=\"%s\"" % keyName)
 		if type in ("Hybrid", "Old"):
-			attribs.append("name=\"%s\"" % value.get("name", ""))
+			attribs.append("name=\"%s\"" % (button.name or ""))
 		if type in ("Hybrid", "New"):
-			attribs.append("label=\"%s\"" % value.get("label", ""))
-		attribs.append("pos=\"%s\"" % ",".join([str(x) for x in value.get("pos", "")]))
+			attribs.append("label=\"%s\"" % (button.label or ""))
+		attribs.append("pos=\"%s\"" % ",".join([str(x) for x in button.pos or ()]))
 		if type in ("Hybrid", "New"):
-			title = value.get("title", "")
-			shape = value.get("shape", "")
-			coords = value.get("coords", "")
+			title = button.title
+			shape = button.shape
+			coords = button.coords
 			if title and shape and coords:
 				attribs.append("title=\"%s\"" % title)
 				attribs.append("shape=\"%s\"" % shape)
@@ -1407,27 +677,26 @@ def buildXML(filename, type, keyIds, rcButtons):
 			xml.append("\t\t<button %s />" % " ".join(attribs))
 	xml.append("\t</rc>")
 	xml.append("</rcs>")
-	logMessage(LOG_REPORT, "%d buttons found and written to %s format XML file." % (len(keyIds), type.lower()))
+	logMessage(LOG_REPORT, "%d buttons found and written to %s format XML file.", len(keyIds), type.lower())
 	saveFile(filename, ".xml-%s" % type, xml)
 	return
 
 
 # Create the new format XML button definition file.
 #
-def buildHTML(filename, keyIds, rcButtons):
+def buildHTML(filename, keyIds, remote):
 	html = []
-	html.append("<img border=\"0\" src=\"%s\" usemap=\"#map\" />" % rcButtons.get("image", ""))
+	html.append("<img border=\"0\" src=\"%s\" usemap=\"#map\" />" % (remote.image or ""))
 	html.append("<map name=\"map\">")
 	for key in keyIds:
-		value = rcButtons[key]
+		button = remote.buttons[key]
 		attribs = []
-		keyName = value.get("keyName", "KEY_RESERVED")
-		keyId = value.get("keyId", 0)
+		keyId = button.keyId
 		if key != keyId:
-			logMessage(LOG_ERROR, "Sort key '%d' does not match the key id '%d'!" % (key, keyId))
-		title = value.get("title", "")
-		shape = value.get("shape", "")
-		coords = value.get("coords", "")
+			logDiagnostic("sort-key-mismatch", keyId, button.keyName, key=key)
+		title = button.title
+		shape = button.shape
+		coords = button.coords
 		if title and shape and coords:
 			attribs.append("title=\"%s\"" % title)
 			attribs.append("shape=\"%s\"" % shape)
@@ -1436,7 +705,7 @@ def buildHTML(filename, keyIds, rcButtons):
 			attribs.append("onclick=\"pressMenuRemote('%d');\"" % keyId)
 		html.append("\t<area %s />" % " ".join(attribs))
 	html.append("</map>")
-	logMessage(LOG_REPORT, "%d buttons found and written to HTML file." % len(keyIds))
+	logMessage(LOG_REPORT, "%d buttons found and written to HTML file.", len(keyIds))
 	saveFile(filename, ".html-New", html)
 	return
 
@@ -1444,10 +713,13 @@ def buildHTML(filename, keyIds, rcButtons):
 def saveFile(filename, suffix, content):
 	# print("\n".join(content))
 	filename = "%s%s" % (filename, suffix)
+	if RESULT_PATH:
+		filename = pathjoin(RESULT_PATH, basename(filename))
 	try:
 		with open(filename, "w") as fd:
 			for line in content:
 				fd.write("%s\n" % line)
+		savedFiles.append(filename)
 	except (IOError, OSError) as err:
 		print("  Error %d: Writing remote control file '%s'! (%s)" % (err.errno, filename, err.strerror))
 	except Exception as err:
@@ -1455,66 +727,288 @@ def saveFile(filename, suffix, content):
 	return
 
 
-def logMessage(level, message):
-	if LOG_LEVEL >= level:
-		if level == LOG_PROGRAM:
-			print(message)
-		elif level == LOG_REPORT:
-			print("  %s" % message)
-		else:
-			print("    %s: %s" % (LOG_LEVELS[level], message))
+# Log a message if the logging level allows it.  The message is a format
+# string that is only formatted with the arguments if it is shown and
+# any callable arguments are only called then.  This keeps the cost of
+# messages that are not shown to the level check.
+#
+def logMessage(level, message, *args):
+	if level > LOG_LEVEL:
+		return
+	if args:
+		message = message % tuple([x() if callable(x) else x for x in args])
+	printMessage(level, message)
 
 
-# This is the mainline part of the code.
+# Log a diagnostic from the catalog in RemoteControlDiagnostics.py if the
+# logging level allows it and it is not suppressed for the current remote
+# control.  The message is only formatted if it is shown.
+#
+def logDiagnostic(diagnostic, keyId=None, keyName=None, attribute=None, **values):
+	if not diagnosticEnabled(diagnostic):
+		return
+	recordDiagnostic(diagnostic, keyId, keyName, attribute, **values)
+	printMessage(diagnosticLevel(diagnostic), formatDiagnostic(diagnostic, keyId, keyName, attribute, values))
+
+
+# Return True if a diagnostic would be reported for the current remote
+# control.  Checks that only report a diagnostic are skipped if not.
+#
+def diagnosticEnabled(diagnostic):
+	return diagnosticLevel(diagnostic) <= LOG_LEVEL and not isSuppressed(SUPPRESSED, diagnostic, currentStem)
+
+
+# Count a diagnostic and keep its JSON record when the diagnostics are
+# being written as JSON records.  This is also used for the problems
+# that are always shown and so have their own messages.
+#
+def recordDiagnostic(diagnostic, keyId=None, keyName=None, attribute=None, **values):
+	counts[diagnostic] = counts.get(diagnostic, 0) + 1
+	if OUTPUT_FORMAT == OUTPUT_JSONL:
+		diagnostics.append(diagnosticRecord(currentStem, diagnostic, keyId, keyName, attribute, values))
+
+
+def printMessage(level, message):
+	if level == LOG_PROGRAM:
+		print(message)
+	elif level == LOG_REPORT:
+		print("  %s" % message)
+	else:
+		print("    %s: %s" % (LOG_LEVELS[level], message))
+
+
+def reportFilename(filename):
+	return pathjoin(REPORT_PATH, "%s.xml.report" % basename(filename))
+
+
+def recordsFilename(filename):
+	return pathjoin(REPORT_PATH, "%s.xml.jsonl" % basename(filename))
+
+
+def saveReport(filename, report):
+	try:
+		with open(filename, "w") as fd:
+			fd.write(report)
+	except (IOError, OSError) as err:
+		print("  Error %d: Writing remote control report file '%s'! (%s)" % (err.errno, filename, err.strerror))
+	except Exception as err:
+		print("  Error: Unexpected error writing remote control report file '%s'! (%s)" % (filename, err))
+	return
+
+
+# Run a function and return everything it printed rather than displaying it.
+#
+def captureOutput(function, *args):
+	stdout = sys.stdout
+	sys.stdout = StringIO()
+	try:
+		function(*args)
+		output = sys.stdout.getvalue()
+	finally:
+		sys.stdout = stdout
+	return output
+
+
+def showBanner():
+	logMessage(LOG_PROGRAM, "CheckRemoteControl version %s", VERSION)
+	logMessage(LOG_PROGRAM, "Copyright (C) 2021  IanSav  -  All rights reserved.\n")
+	logMessage(LOG_PROGRAM, "This program comes with ABSOLUTELY NO WARRANTY.")
+	logMessage(LOG_PROGRAM, "This is free software, and you are welcome to redistribute it under")
+	logMessage(LOG_PROGRAM, "certain conditions.  See source code and GNUv3 for details.\n")
+	logMessage(LOG_PROGRAM, "Running at logging level %d (%s).", LOG_LEVEL, LOG_LEVELS[LOG_LEVEL])
+	logMessage(LOG_PROGRAM, "Output files will be sorted in %s order.", SORT_ORDERS[SORT_ORDER])
+	if FORMAT_LABELS:
+		logMessage(LOG_PROGRAM, "XML labels will be %s.", FORMATS[FORMAT_LABELS])
+	if FORMAT_TITLES:
+		logMessage(LOG_PROGRAM, "HTML titles will be %s.", FORMATS[FORMAT_TITLES])
+	if SUPPRESSED:
+		logMessage(LOG_PROGRAM, "Diagnostics %s will be suppressed.", ", ".join(sorted([diagnosticCode(x) for x in SUPPRESSED.keys()])))
+	logMessage(LOG_PROGRAM, "If both XML and HTML data is valid but different the HTML attributes will be used except for 'pos'.\n")
+
+
+# Show the number of diagnostics of each code and level reported in the run.
 #
-logMessage(LOG_PROGRAM, "CheckRemoteControl version %s" % VERSION)
-logMessage(LOG_PROGRAM, "Copyright (C) 2021  IanSav  -  All rights reserved.\n")
-logMessage(LOG_PROGRAM, "This program comes with ABSOLUTELY NO WARRANTY.")
-logMessage(LOG_PROGRAM, "This is free software, and you are welcome to redistribute it under")
-logMessage(LOG_PROGRAM, "certain conditions.  See source code and GNUv3 for details.\n")
-logMessage(LOG_PROGRAM, "Running at logging level %d (%s)." % (LOG_LEVEL, LOG_LEVELS[LOG_LEVEL]))
-logMessage(LOG_PROGRAM, "Output files will be sorted in %s order." % SORT_ORDERS[SORT_ORDER])
-if FORMAT_LABELS:
-	logMessage(LOG_PROGRAM, "XML labels will be %s." % FORMATS[FORMAT_LABELS])
-if FORMAT_TITLES:
-	logMessage(LOG_PROGRAM, "HTML titles will be %s." % FORMATS[FORMAT_TITLES])
-logMessage(LOG_PROGRAM, "If both XML and HTML data is valid but different the HTML attributes will be used except for 'pos'.\n")
-filenames = set()
-if len(argv) > 1:
-	args = argv
-	args.pop(0)
-else:
-	args = [x for x in listdir(".") if isfile(x)]
-for filename in args:
-	if filename.endswith(".png") or filename.endswith(".xml") or filename.endswith(".html"):
-		if filename.startswith("ini5") or filename.startswith("ini7") or filename.startswith("beyonwiz"):
-			continue  # Don't process Beyonwiz remote controls yet.
-		filenames.add(splitext(filename)[0])
-	elif splitext(filename)[1] == "":
-		filenames.add(filename)
-# filenames = ["0test", "zgemma3"]
-for filename in sorted(filenames):
-	logMessage(LOG_PROGRAM, "Processing remote control filename '%s'." % filename)
-	rcButtons = {}
-	rcButtons = loadRemoteXML(filename, rcButtons)  # Load the XML specifications for the remote control.
-	rcButtons = loadRemoteHTML(filename, rcButtons)  # Load the HTML specifications for the remote control.
-	comparable = compareRemotes(filename, rcButtons)  # Compare the image and list of buttons defined in the XML and HTML files.
-	keyIds = sortButtons(SORT_ORDER, rcButtons)  # Sort the remote control buttons ready for output.
-	rcButtons = compareButtons(keyIds, rcButtons)  # Compare the XML and HTML versions of the remote control.
-	rcButtons = completeAttributes(keyIds, rcButtons)  # Complete any missing attributes that can be derived from other attributes.
+def showSummary(totals):
+	logMessage(LOG_PROGRAM, "Diagnostic summary:")
+	for line in summaryLines(totals):
+		logMessage(LOG_REPORT, line)
+	logMessage(LOG_PROGRAM, "")
+
+
+# Process all the definition files of a single remote control.
+#
+def processRemote(filename):
+	logMessage(LOG_PROGRAM, "Processing remote control filename '%s'.", filename)
+	remote = RemoteDefinition(filename)
+	remote = loadRemoteXML(filename, remote)  # Load the XML specifications for the remote control.
+	remote = loadRemoteHTML(filename, remote)  # Load the HTML specifications for the remote control.
+	comparable = compareRemotes(filename, remote)  # Compare the image and list of buttons defined in the XML and HTML files.
+	keyIds = sortButtons(SORT_ORDER, remote)  # Sort the remote control buttons ready for output.
+	remote = compareButtons(keyIds, remote)  # Compare the XML and HTML versions of the remote control.
+	remote = completeAttributes(keyIds, remote)  # Complete any missing attributes that can be derived from other attributes.
+	checkImageBounds(filename, keyIds, remote)  # Check that the button shapes lie within the remote control image.
 	if comparable:
 		# if filename in ["0test", "zgemma3"]:
 		# 	print(keyIds)
 		# 	for key in keyIds:
-		# 		if isinstance(rcButtons[key], dict):
-		# 			for item in sorted(rcButtons[key].keys()):
-		# 				print(key, item, rcButtons[key][item])
-		# 		else:
-		# 			print(key, rcButtons[key])
-		buildXML(filename, "Old", keyIds, rcButtons)  # Create the old format XML button definition file.
-		buildXML(filename, "New", keyIds, rcButtons)  # Create the new format XML button definition file.
-		buildXML(filename, "Hybrid", keyIds, rcButtons)  # Create the hybrid format XML button definition file.
-		buildHTML(filename, keyIds, rcButtons)  # Create the HTML button definition file.
+		# 		for item in ATTRIBUTES:
+		# 			print(key, item, getattr(remote.buttons[key], item))
+		buildXML(filename, "Old", keyIds, remote)  # Create the old format XML button definition file.
+		buildXML(filename, "New", keyIds, remote)  # Create the new format XML button definition file.
+		buildXML(filename, "Hybrid", keyIds, remote)  # Create the hybrid format XML button definition file.
+		buildHTML(filename, keyIds, remote)  # Create the HTML button definition file.
 	logMessage(LOG_PROGRAM, "")
-logMessage(LOG_PROGRAM, "Processing complete.")
-exit(0)
+
+
+# Apply the command line options to the program settings.  This is
+# also run in each worker process of a parallel check.
+#
+def applyOptions(options):
+	global LOG_LEVEL, OUTPUT_FORMAT, REPORT_PATH, RESULT_PATH, SUPPRESSED
+	LOG_LEVEL = options.logLevel
+	SUPPRESSED = options.suppress
+	OUTPUT_FORMAT = options.format
+	REPORT_PATH = options.reportDir
+	RESULT_PATH = options.resultDir
+
+
+# Check a single remote control and return its log, the JSON records of
+# its diagnostics, the number of each diagnostic and the files written.
+#
+def checkRemote(filename):
+	global currentStem
+	del savedFiles[:]
+	del diagnostics[:]
+	counts.clear()
+	currentStem = basename(filename)
+	log = captureOutput(processRemote, filename)
+	return log, "".join(diagnostics), dict(counts), savedFiles[:]
+
+
+# Return the log of a remote control from its report if the cached
+# outputs from an earlier run are still valid, otherwise None.
+#
+def cachedLog(entries, filename, digest, banner, footer):
+	if lookupEntry(entries, filename, digest) is None:
+		return None
+	try:
+		with open(reportFilename(filename), "r") as fd:
+			report = fd.read()
+	except (IOError, OSError):
+		return None
+	if report.startswith(banner) and report.endswith(footer):
+		return report[len(banner):len(report) - len(footer)]
+	return None
+
+
+# Return the JSON records of a remote control saved by an earlier run, or
+# None if they were not saved.
+#
+def cachedRecords(filename):
+	try:
+		with open(recordsFilename(filename), "r") as fd:
+			return fd.read()
+	except (IOError, OSError):
+		return None
+
+
+# This is the mainline part of the code.
+#
+if __name__ == "__main__":
+	parser = ArgumentParser(description="Check and rebuild Enigma2 remote control XML and HTML definition files.")
+	parser.add_argument("files", nargs="*", help="remote control files, stems or directories of remote control files to process (default: the current directory)")
+	parser.add_argument("--report-dir", dest="reportDir", metavar="DIR", help="also write the log of each remote control to 'DIR/<stem>.xml.report'")
+	parser.add_argument("--result-dir", dest="resultDir", metavar="DIR", help="write the generated XML and HTML files into DIR")
+	parser.add_argument("--cache", dest="cache", metavar="FILE", help="skip remote controls whose files are unchanged since the run recorded in the manifest FILE (requires --report-dir)")
+	parser.add_argument("--log-level", dest="logLevel", type=parseLogLevel, default=LOG_LEVEL, metavar="LEVEL", help="show messages up to LEVEL, one of silent, program, report, error, alert, warning, note, information or debug or their number 0-8 (default: %s)" % LOG_LEVELS[LOG_LEVEL].lower())
+	parser.add_argument("--format", dest="format", choices=OUTPUT_FORMATS, default=OUTPUT_FORMAT, help="write the log as text or the diagnostics as one JSON record per line, the reports are always text (default: %s)" % OUTPUT_FORMAT)
+	parser.add_argument("-j", "--jobs", dest="jobs", type=int, default=1, metavar="N", help="check the remote controls with N worker processes, 0 uses one per CPU (default: 1)")
+	parser.add_argument("--suppress", dest="suppress", type=loadSuppressions, default={}, metavar="FILE", help="skip the diagnostics listed in FILE, one code or name per line optionally followed by the remote control stems it applies to")
+	parser.add_argument("--list-codes", dest="listCodes", action="store_true", help="list the diagnostic codes and exit")
+	options = parser.parse_args()
+	if options.listCodes:
+		print("\n".join(catalogLines()))
+		exit(0)
+	if options.cache and not options.reportDir:
+		parser.error("--cache requires --report-dir")
+	applyOptions(options)
+	banner = captureOutput(showBanner)
+	jsonl = OUTPUT_FORMAT == OUTPUT_JSONL
+	if not jsonl:
+		sys.stdout.write(banner)
+	filenames = set()
+	if options.files:
+		args = []
+	else:
+		args = [x for x in listdir(".") if isfile(x)]
+	for arg in options.files:
+		if isdir(arg):  # Process every remote control definition in a directory with the tables loaded only once.
+			for assets in directoryIndex(arg).values():
+				args.extend([pathjoin(arg, basename(x)) for x in (assets.xml, assets.html) if x])  # Keep the directory as it was given.
+		else:
+			args.append(arg)
+	for filename in args:
+		if filename.endswith(".png") or filename.endswith(".xml") or filename.endswith(".html"):
+			if filename.startswith("ini5") or filename.startswith("ini7") or filename.startswith("beyonwiz"):
+				continue  # Don't process Beyonwiz remote controls yet.
+			filenames.add(splitext(filename)[0])
+		elif splitext(filename)[1] == "":
+			filenames.add(filename)
+	# filenames = ["0test", "zgemma3"]
+	filenames = sorted(filenames)
+	footer = captureOutput(logMessage, LOG_PROGRAM, "Processing complete.")
+	entries = {}
+	digests = {}
+	cached = {}
+	pending = filenames
+	if options.cache:  # Reuse the outputs of remote controls whose inputs are unchanged.
+		tables = fingerprint(banner, TOLERANCE, SUPPRESSED, REMOTE_IMAGE_PATH, KEYIDS, KEYDESCRIPTIONS, AUTO_CORRECT, REPORT_PATH, RESULT_PATH, fileDigest("%s.py" % splitext(__file__)[0], pathjoin(dirname(__file__), "RemoteControlModel.py"), pathjoin(dirname(__file__), "RemoteControlDiagnostics.py"), pathjoin(dirname(__file__), "RemoteControlDocuments.py"), pathjoin(dirname(__file__), "RemoteControlGeometry.py"), pathjoin(dirname(__file__), "RemoteControlInventory.py")))
+		entries = loadManifest(options.cache, tables)
+		for filename in list(entries.keys()):
+			assets = findAssets(filename)
+			if assets is None or (assets.xml is None and assets.html is None):
+				removeOutputs(entries, filename)  # The remote control has been removed.
+		pending = []
+		for filename in filenames:
+			digests[filename] = fileDigest("%s.xml" % filename, "%s.html" % filename, "%s.png" % filename)  # The image is checked too.
+			log = cachedLog(entries, filename, digests[filename], banner, footer)
+			records = cachedRecords(filename) if jsonl and log is not None else ""
+			if log is None or records is None:
+				removeOutputs(entries, filename)
+				pending.append(filename)
+			else:
+				cached[filename] = (log, records, entries[filename].get("counts", {}))
+	jobs = options.jobs if options.jobs > 0 else cpu_count()
+	pool = None
+	if jobs > 1 and len(pending) > 1:
+		pool = Pool(min(jobs, len(pending)), applyOptions, (options,))
+		results = pool.imap(checkRemote, pending)  # The results are returned in the order of pending.
+	else:
+		results = (checkRemote(filename) for filename in pending)
+	totals = {}
+	for filename in filenames:
+		if filename in cached:
+			log, records, reported = cached[filename]
+		else:
+			log, records, reported, outputs = next(results)
+			if REPORT_PATH:
+				saveReport(reportFilename(filename), "%s%s%s" % (banner, log, footer))
+				outputs.append(reportFilename(filename))
+				if jsonl:
+					saveReport(recordsFilename(filename), records)
+					outputs.append(recordsFilename(filename))
+			if options.cache:
+				entries[filename] = {"digest": digests[filename], "outputs": outputs, "counts": reported}
+		for diagnostic, count in reported.items():
+			totals[diagnostic] = totals.get(diagnostic, 0) + count
+		sys.stdout.write(records if jsonl else log)
+	if pool:
+		pool.close()
+		pool.join()
+	if options.cache:
+		saveManifest(options.cache, tables, entries)
+	if not jsonl:
+		if totals:
+			showSummary(totals)
+		sys.stdout.write(footer)
+	exit(0)
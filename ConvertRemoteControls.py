@@ -26,35 +26,30 @@
 #
 # 	See <https://www.gnu.org/licenses/>.
 
+from argparse import ArgumentParser
 from errno import ENOENT
 from os import listdir
-from os.path import isfile, join as pathjoin
-from sys import argv
-from xml.etree.cElementTree import ParseError, parse, fromstring
+from os.path import basename, dirname, isdir, isfile, join as pathjoin, splitext
+import sys
+try:
+	from xml.etree.cElementTree import ParseError
+except ImportError:  # Python 3.9 and later only have ElementTree.
+	from xml.etree.ElementTree import ParseError
+
+from RemoteControlCache import fileDigest, fingerprint, loadManifest, lookupEntry, removeOutputs, saveManifest
+from RemoteControlDiagnostics import LOG_SILENT, LOG_PROGRAM, LOG_REPORT, LOG_ERROR, LOG_ALERT, LOG_WARNING, LOG_NOTE, LOG_INFORMATION, LOG_DEBUG, LOG_LEVELS, OUTPUT_FORMATS, OUTPUT_JSONL, OUTPUT_TEXT, catalogLines, diagnosticCode, diagnosticLevel, diagnosticRecord, formatDiagnostic, isSuppressed, loadSuppressions, parseLogLevel, summaryLines
+from RemoteControlDocuments import parseXML
+from RemoteControlGeometry import findOverlaps
+from RemoteControlInventory import directoryIndex, findAssets
+from RemoteControlKeys import AUTO_CORRECT, KEYDESCRIPTIONS, KEYIDNAMES, KEYIDS, keyIdFromName
+
+try:
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
 
 VERSION = "1.21  -  16-Aug-2022"
 
-LOG_SILENT = 0
-LOG_PROGRAM = 1
-LOG_REPORT = 2
-LOG_ERROR = 3
-LOG_ALERT = 4
-LOG_WARNING = 5
-LOG_NOTE = 6
-LOG_INFORMATION = 7
-LOG_DEBUG = 8
-LOG_LEVELS = {
-	LOG_SILENT: "Silent",
-	LOG_PROGRAM: "Program",
-	LOG_REPORT: "Report",
-	LOG_ERROR: "Error",
-	LOG_ALERT: "Alert",
-	LOG_WARNING: "Warning",
-	LOG_NOTE: "Note",
-	LOG_INFORMATION: "Information",
-	LOG_DEBUG: "Debug"
-}
-
 SORT_SEQUENCE = 0
 SORT_POSITION = 1
 SORT_KEYID = 2
@@ -76,767 +71,59 @@ FORMATS = [
 ]
 
 REMOTE_IMAGE_PATH = "/images/remotes/"
+REPORT_PATH = None  # If defined the log for each remote control is also written to "<REPORT_PATH>/<file>.report".
+RESULT_PATH = None  # If defined the converted files are written here rather than beside the source files.
+OUTPUT_FORMAT = OUTPUT_TEXT  # With OUTPUT_JSONL the diagnostics are written as JSON records rather than the log.
 
 LOG_LEVEL = LOG_INFORMATION
 SORT_ORDER = SORT_POSITION
 FORMAT_LABELS = FORMAT_CAPITALISE
 FORMAT_TITLES = FORMAT_CAPITALISE
+SUPPRESSED = {}  # The suppressed diagnostics and the stems they are suppressed for, None for all stems.
 
-KEYIDS = {
-	"KEY_RESERVED": 0,
-	"KEY_ESC": 1,
-	"KEY_1": 2,
-	"KEY_2": 3,
-	"KEY_3": 4,
-	"KEY_4": 5,
-	"KEY_5": 6,
-	"KEY_6": 7,
-	"KEY_7": 8,
-	"KEY_8": 9,
-	"KEY_9": 10,
-	"KEY_0": 11,
-	"KEY_MINUS": 12,
-	"KEY_EQUAL": 13,
-	"KEY_BACKSPACE": 14,
-	"KEY_TAB": 15,
-	"KEY_Q": 16,
-	"KEY_W": 17,
-	"KEY_E": 18,
-	"KEY_R": 19,
-	"KEY_T": 20,
-	"KEY_Y": 21,
-	"KEY_U": 22,
-	"KEY_I": 23,
-	"KEY_O": 24,
-	"KEY_P": 25,
-	"KEY_LEFTBRACE": 26,
-	"KEY_RIGHTBRACE": 27,
-	"KEY_ENTER": 28,
-	"KEY_LEFTCTRL": 29,
-	"KEY_A": 30,
-	"KEY_S": 31,
-	"KEY_D": 32,
-	"KEY_F": 33,
-	"KEY_G": 34,
-	"KEY_H": 35,
-	"KEY_J": 36,
-	"KEY_K": 37,
-	"KEY_L": 38,
-	"KEY_SEMICOLON": 39,
-	"KEY_APOSTROPHE": 40,
-	"KEY_GRAVE": 41,
-	"KEY_LEFTSHIFT": 42,
-	"KEY_BACKSLASH": 43,
-	"KEY_Z": 44,
-	"KEY_X": 45,
-	"KEY_C": 46,
-	"KEY_V": 47,
-	"KEY_B": 48,
-	"KEY_N": 49,
-	"KEY_M": 50,
-	"KEY_COMMA": 51,
-	"KEY_DOT": 52,
-	"KEY_SLASH": 53,
-	"KEY_RIGHTSHIFT": 54,
-	"KEY_KPASTERISK": 55,
-	"KEY_LEFTALT": 56,
-	"KEY_SPACE": 57,
-	"KEY_CAPSLOCK": 58,
-	"KEY_F1": 59,
-	"KEY_F2": 60,
-	"KEY_F3": 61,
-	"KEY_F4": 62,
-	"KEY_F5": 63,
-	"KEY_F6": 64,
-	"KEY_F7": 65,
-	"KEY_F8": 66,
-	"KEY_F9": 67,
-	"KEY_F10": 68,
-	"KEY_NUMLOCK": 69,
-	"KEY_SCROLLLOCK": 70,
-	"KEY_KP7": 71,
-	"KEY_KP8": 72,
-	"KEY_KP9": 73,
-	"KEY_KPMINUS": 74,
-	"KEY_KP4": 75,
-	"KEY_KP5": 76,
-	"KEY_KP6": 77,
-	"KEY_KPPLUS": 78,
-	"KEY_KP1": 79,
-	"KEY_KP2": 80,
-	"KEY_KP3": 81,
-	"KEY_KP0": 82,
-	"KEY_KPDOT": 83,
-	"KEY_103RD": 84,
-	"KEY_F13": 85,
-	"KEY_102ND": 86,
-	"KEY_F11": 87,
-	"KEY_F12": 88,
-	"KEY_F14": 89,
-	"KEY_F15": 90,
-	"KEY_F16": 91,
-	"KEY_F17": 92,
-	"KEY_F18": 93,
-	"KEY_F19": 94,
-	"KEY_F20": 95,
-	"KEY_KPENTER": 96,
-	"KEY_RIGHTCTRL": 97,
-	"KEY_KPSLASH": 98,
-	"KEY_SYSRQ": 99,
-	"KEY_RIGHTALT": 100,
-	"KEY_LINEFEED": 101,
-	"KEY_HOME": 102,
-	"KEY_UP": 103,
-	"KEY_PAGEUP": 104,
-	"KEY_LEFT": 105,
-	"KEY_RIGHT": 106,
-	"KEY_END": 107,
-	"KEY_DOWN": 108,
-	"KEY_PAGEDOWN": 109,
-	"KEY_INSERT": 110,
-	"KEY_DELETE": 111,
-	"KEY_MACRO": 112,
-	"KEY_MUTE": 113,
-	"KEY_VOLUMEDOWN": 114,
-	"KEY_VOLUMEUP": 115,
-	"KEY_POWER": 116,
-	"KEY_KPEQUAL": 117,
-	"KEY_KPPLUSMINUS": 118,
-	"KEY_PAUSE": 119,
-	"KEY_F21": 120,
-	"KEY_F22": 121,
-	"KEY_F23": 122,
-	"KEY_F24": 123,
-	"KEY_KPCOMMA": 124,
-	"KEY_LEFTMETA": 125,
-	"KEY_RIGHTMETA": 126,
-	"KEY_COMPOSE": 127,
-	"KEY_STOP": 128,
-	"KEY_AGAIN": 129,
-	"KEY_PROPS": 130,
-	"KEY_UNDO": 131,
-	"KEY_FRONT": 132,
-	"KEY_COPY": 133,
-	"KEY_OPEN": 134,
-	"KEY_PASTE": 135,
-	"KEY_FIND": 136,
-	"KEY_CUT": 137,
-	"KEY_HELP": 138,
-	"KEY_MENU": 139,
-	"KEY_CALC": 140,
-	"KEY_SETUP": 141,
-	"KEY_SLEEP": 142,
-	"KEY_WAKEUP": 143,
-	"KEY_FILE": 144,
-	"KEY_SENDFILE": 145,
-	"KEY_DELETEFILE": 146,
-	"KEY_XFER": 147,
-	"KEY_PROG1": 148,
-	"KEY_PROG2": 149,
-	"KEY_WWW": 150,
-	"KEY_MSDOS": 151,
-	"KEY_COFFEE": 152,
-	"KEY_DIRECTION": 153,
-	"KEY_CYCLEWINDOWS": 154,
-	"KEY_MAIL": 155,
-	"KEY_BOOKMARKS": 156,
-	"KEY_COMPUTER": 157,
-	"KEY_BACK": 158,
-	"KEY_FORWARD": 159,
-	"KEY_CLOSECD": 160,
-	"KEY_EJECTCD": 161,
-	"KEY_EJECTCLOSECD": 162,
-	"KEY_NEXTSONG": 163,
-	"KEY_PLAYPAUSE": 164,
-	"KEY_PREVIOUSSONG": 165,
-	"KEY_STOPCD": 166,
-	"KEY_RECORD": 167,
-	"KEY_REWIND": 168,
-	"KEY_PHONE": 169,
-	"KEY_ISO": 170,
-	"KEY_CONFIG": 171,
-	"KEY_HOMEPAGE": 172,
-	"KEY_REFRESH": 173,
-	"KEY_EXIT": 174,
-	"KEY_MOVE": 175,
-	"KEY_EDIT": 176,
-	"KEY_SCROLLUP": 177,
-	"KEY_SCROLLDOWN": 178,
-	"KEY_KPLEFTPAREN": 179,
-	"KEY_KPRIGHTPAREN": 180,
-	"KEY_INTL1": 181,
-	"KEY_INTL2": 182,
-	"KEY_INTL3": 183,
-	"KEY_INTL4": 184,
-	"KEY_INTL5": 185,
-	"KEY_INTL6": 186,
-	"KEY_INTL7": 187,
-	"KEY_INTL8": 188,
-	"KEY_INTL9": 189,
-	"KEY_LANG1": 190,
-	"KEY_LANG2": 191,
-	"KEY_LANG3": 192,
-	"KEY_LANG4": 193,
-	"KEY_LANG5": 194,
-	"KEY_LANG6": 195,
-	"KEY_LANG7": 196,
-	"KEY_LANG8": 197,
-	"KEY_LANG9": 198,
-	"KEY_PLAYCD": 200,
-	"KEY_PAUSECD": 201,
-	"KEY_PROG3": 202,
-	"KEY_PROG4": 203,
-	"KEY_SUSPEND": 205,
-	"KEY_CLOSE": 206,
-	"KEY_PLAY": 207,
-	"KEY_FASTFORWARD": 208,
-	"KEY_BASSBOOST": 209,
-	"KEY_PRINT": 210,
-	"KEY_HP": 211,
-	"KEY_CAMERA": 212,
-	"KEY_SOUND": 213,
-	"KEY_QUESTION": 214,
-	"KEY_EMAIL": 215,
-	"KEY_CHAT": 216,
-	"KEY_SEARCH": 217,
-	"KEY_CONNECT": 218,
-	"KEY_FINANCE": 219,
-	"KEY_SPORT": 220,
-	"KEY_SHOP": 221,
-	"KEY_ALTERASE": 222,
-	"KEY_CANCEL": 223,
-	"KEY_BRIGHTNESSDOWN": 224,
-	"KEY_BRIGHTNESSUP": 225,
-	"KEY_MEDIA": 226,
-	"KEY_VMODE": 227,  # Deprecated, retained for backwards compatibility.
-	"KEY_SWITCHVIDEOMODE": 227,
-	"KEY_LAN": 238,
-	"KEY_UNKNOWN": 240,
-	"BTN_0": 256,
-	"BTN_1": 257,
-	"BtnA": 304,
-	"BtnB": 305,
-	"BtnC": 306,
-	"BtnX": 307,
-	"BtnY": 308,
-	"BtnZ": 309,
-	"BtnTL": 310,
-	"BtnTR": 311,
-	"BtnTL2": 312,
-	"BtnTR2": 313,
-	"BtnSelect": 314,
-	"BtnStart": 315,
-	"KEY_SHIFT": 351,  # This is not a transmitted key but rather a place holder for remote controls that have a SHIFT function.
-	"KEY_OK": 352,
-	"KEY_SELECT": 353,
-	"KEY_GOTO": 354,
-	"KEY_CLEAR": 355,
-	"KEY_POWER2": 356,
-	"KEY_OPTION": 357,
-	"KEY_INFO": 358,
-	"KEY_TIME": 359,
-	"KEY_VENDOR": 360,
-	"KEY_ARCHIVE": 361,
-	"KEY_PROGRAM": 362,
-	"KEY_CHANNEL": 363,
-	"KEY_FAVORITES": 364,
-	"KEY_EPG": 365,
-	"KEY_PVR": 366,
-	"KEY_MHP": 367,
-	"KEY_LANGUAGE": 368,
-	"KEY_TITLE": 369,
-	"KEY_SUBTITLE": 370,
-	"KEY_ANGLE": 371,
-	"KEY_ZOOM": 372,
-	"KEY_MODE": 373,
-	"KEY_KEYBOARD": 374,
-	"KEY_SCREEN": 375,
-	"KEY_PC": 376,
-	"KEY_TV": 377,
-	"KEY_TV2": 378,
-	"KEY_VCR": 379,
-	"KEY_VCR2": 380,
-	"KEY_SAT": 381,
-	"KEY_SAT2": 382,
-	"KEY_CD": 383,
-	"KEY_TAPE": 384,
-	"KEY_RADIO": 385,
-	"KEY_TUNER": 386,
-	"KEY_PLAYER": 387,
-	"KEY_TEXT": 388,
-	"KEY_DVD": 389,
-	"KEY_AUX": 390,
-	"KEY_MP3": 391,
-	"KEY_AUDIO": 392,
-	"KEY_VIDEO": 393,
-	"KEY_DIRECTORY": 394,
-	"KEY_LIST": 395,
-	"KEY_MEMO": 396,
-	"KEY_CALENDAR": 397,
-	"KEY_RED": 398,
-	"KEY_GREEN": 399,
-	"KEY_YELLOW": 400,
-	"KEY_BLUE": 401,
-	"KEY_CHANNELUP": 402,
-	"KEY_CHANNELDOWN": 403,
-	"KEY_FIRST": 404,
-	"KEY_LAST": 405,
-	"KEY_AB": 406,
-	"KEY_NEXT": 407,
-	"KEY_RESTART": 408,
-	"KEY_SLOW": 409,
-	"KEY_SHUFFLE": 410,
-	"KEY_BREAK": 411,
-	"KEY_PREVIOUS": 412,
-	"KEY_DIGITS": 413,
-	"KEY_TEEN": 414,
-	"KEY_TWEN": 415,
-	"KEY_CONTEXT_MENU": 438,
-	"KEY_DEL_EOL": 448,
-	"KEY_DEL_EOS": 449,
-	"KEY_INS_LINE": 450,
-	"KEY_DEL_LINE": 451,
-	"KEY_ASCII": 510,
-	"KEY_MAX": 511,
-	"KEY_TVSAT": 512,
-	"KEY_PICASA": 513,
-	"KEY_SHOUTCAST": 514,
-	"KEY_YOUTUBE": 515,
-	"KEY_SPARK": 516,
-	"KEY_RECALL": 517,
-	"KEY_PLAYMODE": 518,
-	"KEY_USB": 519,
-	"KEY_PORTAL": 520,
-	"KEY_FAST": 521,
-	"KEY_TOUCHPAD_TOGGLE": 530,
-	"KEY_MOUSE": 530,
-	"KEY_VOD": 627
-}
-
-KNOWN_ALISAES = {
-	227: ("KEY_SWITCHVIDEOMODE", "KEY_VMODE"),
-	530: ("KEY_MOUSE", "KEY_TOUCHPAD_TOGGLE")
-}
-
-
-def invertKeyIds():
-	invKeyIds = {}
-	for key, value in KEYIDS.items():
-		if value not in invKeyIds:
-			invKeyIds[value] = key
-		else:
-			if value in KNOWN_ALISAES and key in KNOWN_ALISAES[value]:
-				invKeyIds[value] = KNOWN_ALISAES[value][0]
-			else:
-				print("[keyids] Error: Key code %d is mapped to both '%s' and '%s'!" % (value, invKeyIds[value], key))
-	return invKeyIds
-
-
-KEYIDNAMES = invertKeyIds()
-
-KEYDESCRIPTIONS = [{  # id=0 - dmm0 remote directory, DM8000.
-	# However, the dmm0 rcpositions.xml file should define
-	# an <rc id=0 /> element, but it does not, it only has
-	# an <rc id=2 /> element.
-	#
-	# The rcpositions.xml file defines <button/> elements,
-	# but they do not appear to emit codes.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("YELLOW",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLUGIN",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EDIT"]: ("EPGSETUP",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FORWARD",),
-	KEYIDS["KEY_FAVORITES"]: ("FAV",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LAST"]: ("BACK",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MEDIA"]: ("MEDIA",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_NEXTSONG"]: ("NEXTSONG",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_PLAYPAUSE"]: ("PLAYPAUSE",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PREVIOUSSONG"]: ("PREVIOUSSONG",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SCREEN"]: ("SCREEN",),
-	KEYIDS["KEY_SEARCH"]: ("WWW",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}, {  # id=1 - dmm0 remote directory, other than DM8000.
-	# However, the dmm0 rcpositions.xml file should define
-	# an <rc id=1 /> element, but it does not, it only has
-	# an <rc id=2 /> element.
-	#
-	# The rcpositions.xml file defines <button/> elements,
-	# but they do not appear to emit codes.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLUGIN",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EDIT"]: ("EPGSETUP",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_FASTFORWARD"]: ("BLUE", "SHIFT"),
-	KEYIDS["KEY_FAVORITES"]: ("FAV",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LAST"]: ("BACK",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MEDIA"]: ("MEDIA",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PLAY"]: ("GREEN", "SHIFT"),
-	KEYIDS["KEY_PAUSE"]: ("YELLOW", "SHIFT"),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RADIO", "SHIFT"),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("RED", "SHIFT"),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SCREEN"]: ("SCREEN",),
-	KEYIDS["KEY_SEARCH"]: ("WWW",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_STOP"]: ("TV", "SHIFT"),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}, {  # id=2 - Everything else.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_ARCHIVE"]: ("HISTORY",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_AUX"]: ("WIZTV",),
-	KEYIDS["KEY_BACK"]: ("RECALL",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLUGIN",),
-	KEYIDS["KEY_CALENDAR"]: ("AUTOTIMER",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_CONTEXT_MENU"]: ("CONTEXT",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EJECTCD"]: ("EJECTCD",),
-	KEYIDS["KEY_END"]: ("END",),
-	KEYIDS["KEY_ENTER"]: ("ENTER", "kbd"),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_F1"]: ("F1",),
-	KEYIDS["KEY_F2"]: ("F2",),
-	KEYIDS["KEY_F3"]: ("F3",),
-	KEYIDS["KEY_F4"]: ("F4",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FASTFORWARD",),
-	KEYIDS["KEY_FAVORITES"]: ("FAV",),
-	KEYIDS["KEY_FILE"]: ("LIST",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_GOTO"]: ("GOTO",),  # Missing.
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_HOME"]: ("HOME",),
-	KEYIDS["KEY_HOMEPAGE"]: ("HOMEPAGE",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_KEYBOARD"]: ("KEYBOARD",),
-	KEYIDS["KEY_LAST"]: ("BACK",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_LIST"]: ("PLAYLIST",),
-	KEYIDS["KEY_MEDIA"]: ("MEDIA",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MODE"]: ("VKEY",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_NEXTSONG"]: ("NEXTSONG",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_OPTION"]: ("OPTION",),
-	KEYIDS["KEY_PAGEDOWN"]: ("PAGEDOWN",),
-	KEYIDS["KEY_PAGEUP"]: ("PAGEUP",),
-	KEYIDS["KEY_PAUSE"]: ("PAUSE",),
-	KEYIDS["KEY_PC"]: ("LAN",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_PLAYPAUSE"]: ("PLAYPAUSE",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PREVIOUSSONG"]: ("PREVIOUSSONG",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_PVR"]: ("PVR",),
-	KEYIDS["KEY_QUESTION"]: ("ABOUT",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("REWIND",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SAT"]: ("SAT",),
-	KEYIDS["KEY_SCREEN"]: ("SCREEN",),
-	KEYIDS["KEY_SEARCH"]: ("WWW",),
-	KEYIDS["KEY_SETUP"]: ("SETUP",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_SLOW"]: ("SLOW",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_SWITCHVIDEOMODE"]: ("VMODE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TIME"]: ("TIMESHIFT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("VIDEO",),
-	# KEYIDS["KEY_VMODE"]: ("VMODE",),  # This value is deprecated use KEY_SWITCHVIDEOMODE instead.
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",),
-	KEYIDS["KEY_ZOOM"]: ("ZOOM",),
-	# Discrete power codes
-	KEYIDS["KEY_POWER2"]: ("POWER2",),
-	KEYIDS["KEY_SUSPEND"]: ("SUSPEND",),
-	KEYIDS["KEY_WAKEUP"]: ("WAKEUP",),
-	# Placeholder definition to assist with remote control updates.
-	KEYIDS["KEY_RESERVED"]: ("UNKNOWN",)
-
-}, {  # id=3 - XP1000.
-	# The xp1000/rcpositions file defines PLAY and PAUSE
-	# at the same location where it should just define
-	# PLAYPAUSE there. It has similar overlayed incorrect
-	# definitions for play & pause rather than play/pause
-	# in remote.html.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PORTAL",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FASTFORWARD",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_NEXTSONG"]: ("NEXTSONG",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_PLAYPAUSE"]: ("PLAYPAUSE",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_PREVIOUSSONG"]: ("PREVIOUSSONG",),
-	KEYIDS["KEY_PROGRAM"]: ("TIMER",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("REWIND",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_SLEEP"]: ("SLEEP",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_SUBTITLE"]: ("SUBTITLE",),
-	KEYIDS["KEY_SWITCHVIDEOMODE"]: ("VMODE",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	# KEYIDS["KEY_VMODE"]: ("VMODE",),  # This value is deprecated use KEY_SWITCHVIDEOMODE instead.
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}, {  # id=4 - Formuler F1/F3.
-	# The formuler1 rcpositions file seems to define
-	# the FF and REW keys as FASTFORWARD and KEY_REWIND,
-	# but the remote.xml file issues KEY_PREVIOUSSONG
-	# and KEY_NEXTSONG.
-	KEYIDS["BTN_0"]: ("UP", "fp"),
-	KEYIDS["BTN_1"]: ("DOWN", "fp"),
-	KEYIDS["KEY_0"]: ("0",),
-	KEYIDS["KEY_1"]: ("1",),
-	KEYIDS["KEY_2"]: ("2",),
-	KEYIDS["KEY_3"]: ("3",),
-	KEYIDS["KEY_4"]: ("4",),
-	KEYIDS["KEY_5"]: ("5",),
-	KEYIDS["KEY_6"]: ("6",),
-	KEYIDS["KEY_7"]: ("7",),
-	KEYIDS["KEY_8"]: ("8",),
-	KEYIDS["KEY_9"]: ("9",),
-	KEYIDS["KEY_AUDIO"]: ("AUDIO",),
-	KEYIDS["KEY_BACK"]: ("RECALL",),
-	KEYIDS["KEY_BLUE"]: ("BLUE",),
-	KEYIDS["KEY_BOOKMARKS"]: ("PLAYLIST",),
-	KEYIDS["KEY_CHANNELDOWN"]: ("BOUQUET-",),
-	KEYIDS["KEY_CHANNELUP"]: ("BOUQUET+",),
-	KEYIDS["KEY_CONTEXT_MENU"]: ("CONTEXT",),
-	KEYIDS["KEY_DOWN"]: ("DOWN",),
-	KEYIDS["KEY_EPG"]: ("EPG",),
-	KEYIDS["KEY_EXIT"]: ("EXIT",),
-	KEYIDS["KEY_F1"]: ("F1",),
-	KEYIDS["KEY_F2"]: ("F2",),
-	KEYIDS["KEY_F3"]: ("F3",),
-	KEYIDS["KEY_FASTFORWARD"]: ("FASTFORWARD",),
-	KEYIDS["KEY_FAVORITES"]: ("FAVORITES",),
-	KEYIDS["KEY_GREEN"]: ("GREEN",),
-	KEYIDS["KEY_HELP"]: ("HELP",),
-	KEYIDS["KEY_INFO"]: ("INFO",),
-	KEYIDS["KEY_LEFT"]: ("LEFT",),
-	KEYIDS["KEY_MENU"]: ("MENU",),
-	KEYIDS["KEY_MUTE"]: ("MUTE",),
-	KEYIDS["KEY_NEXT"]: ("ARROWRIGHT",),
-	KEYIDS["KEY_OK"]: ("OK",),
-	KEYIDS["KEY_PAUSE"]: ("PAUSE",),
-	KEYIDS["KEY_PLAY"]: ("PLAY",),
-	KEYIDS["KEY_POWER"]: ("POWER",),
-	KEYIDS["KEY_PREVIOUS"]: ("ARROWLEFT",),
-	KEYIDS["KEY_RADIO"]: ("RADIO",),
-	KEYIDS["KEY_RECORD"]: ("RECORD",),
-	KEYIDS["KEY_RED"]: ("RED",),
-	KEYIDS["KEY_REWIND"]: ("REWIND",),
-	KEYIDS["KEY_RIGHT"]: ("RIGHT",),
-	KEYIDS["KEY_STOP"]: ("STOP",),
-	KEYIDS["KEY_TEXT"]: ("TEXT",),
-	KEYIDS["KEY_TV"]: ("TV",),
-	KEYIDS["KEY_UP"]: ("UP",),
-	KEYIDS["KEY_VIDEO"]: ("PVR",),
-	KEYIDS["KEY_VOLUMEDOWN"]: ("VOL-",),
-	KEYIDS["KEY_VOLUMEUP"]: ("VOL+",),
-	KEYIDS["KEY_YELLOW"]: ("YELLOW",)
-}]
-
-AUTO_CORRECT = {
-	"CH-": "BOUQUET-",
-	"CH+": "BOUQUET+",
-	"CHANNEL-": "BOUQUET-",
-	"CHANNEL+": "BOUQUET+",
-	"CONTEXT_MENU": "CONTEXT",
-	"DREAMSELECT": "UNKNOWN",
-	"FAVORITES": "FAV",
-	"FFW": "FASTFORWARD",
-	"FILELIST": "LIST",
-	"FORWARD": "FASTFORWARD",
-	"MODE": "VMODE",
-	"NEXT": "ARROWRIGHT",
-	"PORTAL": "PLUGIN",
-	"PORV": "FAV",
-	"PREVIOUS": "ARROWLEFT",
-	"PROGRAMM": "TIMER",
-	"RES": "VMODE",
-	"REW": "REWIND",
-	"RRW": "REWIND",
-	"SHIFT": "UNKNOWN",
-	"SKIPBACK": "PREVIOUSSONG",
-	"SKIPFORWARD": "NEXTSONG",
-	"SWITCHVIDEOMODE": "VMODE",
-	"TIME": "TIMER",
-	"TOUCHPAD_TOGGLE": "UNKNOWN",
-	"TV-OUT": "VMODE",
-	"TVSELECT": "UNKNOWN",
-	"WEB": "WWW"
-}
+savedFiles = []  # The files written while converting the current remote control.
+diagnostics = []  # The JSON records of the diagnostics of the current remote control.
+currentStem = None  # The name of the remote control being converted.
+counts = {}  # The number of each diagnostic reported for the current remote control.
 
 
 # Load the XML specifications for the remote control.
 #
 def loadRemoteXML(filename):
-	logMessage(LOG_REPORT, "Loading remote control XML definition file '%s'." % filename)
+	logMessage(LOG_REPORT, "Loading remote control XML definition file '%s'.", filename)
 	domXML = None
 	try:
-		with open(filename, "r") as fd:  # This open gets around a possible file handle leak in Python's XML parser.
-			try:
-				domXML = parse(fd).getroot()
-			except ParseError as err:
-				fd.seek(0)
+		try:
+			domXML = parseXML(filename)  # The document is shared with the other tools run in the same process.
+		except ParseError as err:
+			with open(filename, "r") as fd:
 				content = fd.readlines()
-				line, column = err.position
-				print("  XML Parse Error: '%s' in '%s'!" % (err, filename))
-				data = content[line - 1].replace("\t", " ").rstrip()
-				print("  XML Parse Error: '%s'" % data)
-				print("  XML Parse Error: '%s^%s'" % ("-" * column, " " * (len(data) - column - 1)))
-			except Exception as err:
-				print("  Error: Unable to parse XML remote control data in '%s' - '%s'!" % (filename, err))
+			line, column = err.position
+			print("  XML Parse Error: '%s' in '%s'!" % (err, filename))
+			recordDiagnostic("xml-parse-error", filename=filename, error=str(err), line=line, column=column)
+			data = content[line - 1].replace("\t", " ").rstrip()
+			print("  XML Parse Error: '%s'" % data)
+			print("  XML Parse Error: '%s^%s'" % ("-" * column, " " * (len(data) - column - 1)))
+		except (IOError, OSError):
+			raise  # The file can't be opened.
+		except Exception as err:
+			print("  Error: Unable to parse XML remote control data in '%s' - '%s'!" % (filename, err))
+			recordDiagnostic("xml-invalid", filename=filename, error=str(err))
 	except (IOError, OSError) as err:
 		if err.errno == ENOENT:  # No such file or directory
 			print("  Warning: Remote control XML file '%s' does not exist!" % filename)
+			recordDiagnostic("xml-missing", filename=filename)
 		else:
 			print("  Error %d: Opening remote control XML file '%s'! (%s)" % (err.errno, filename, err.strerror))
+			recordDiagnostic("xml-open-error", filename=filename, errno=err.errno, error=err.strerror)
 	except Exception as err:
 		print("  Error: Unexpected error opening remote control XML file '%s'! (%s)" % (filename, err))
+		recordDiagnostic("xml-unexpected-error", filename=filename, error=str(err))
 	if domXML is None:
 		return None
 	rc = domXML.find("rc")
 	if rc is None:
-		logMessage(LOG_ERROR, "Remote control XML file structure is invalid!")
+		logDiagnostic("xml-structure")
 		return None
 	rcButtons = {}
 	bindIndex = rc.attrib.get("id")
@@ -855,11 +142,12 @@ def loadRemoteXML(filename):
 		msg = msg % index
 		if bindIndex == str(index):
 			msg = ""
-		logMessage(LOG_REPORT, "Remote control id defined as '%s'%s." % (bindIndex, msg))
+		logMessage(LOG_REPORT, "Remote control id defined as '%s'%s.", bindIndex, msg)
 		rcButtons["id"] = index
 	else:
 		logMessage(LOG_REPORT, "Remote control id is undefined so '2' will be assumed.")
-		rcButtons["id"] = 2
+		index = 2
+		rcButtons["id"] = index
 	image = rc.attrib.get("image")
 	if image:
 		image = pathjoin(REMOTE_IMAGE_PATH, "%s.png" % image.split("/")[3])
@@ -878,51 +166,45 @@ def loadRemoteXML(filename):
 		coords = button.attrib.get("coords")
 		radius = button.attrib.get("radius")
 		size = button.attrib.get("size")
+		remapId = None
 		if id:
 			keyId = KEYIDS.get(id)
 			if keyId is None:
-				logMessage(LOG_ERROR, "The id '%s' appears invalid!" % id)
+				logDiagnostic("id-invalid", keyName=id)
 				continue
 			if remap:
 				remapId = KEYIDS.get(remap)
 				if remapId is None:
-					logMessage(LOG_ERROR, "The remap id '%s' appears invalid!" % remap)
+					logDiagnostic("remap-id-invalid", remap=remap)
 					continue
-				labelled = " and labelled '%s'" % label if label else ""
-				titled = " and titled '%s'" % title if title else ""
-				logMessage(LOG_INFORMATION, "Button '%s' (%d) remapped to '%s' (%d)%s%s." % (id, keyId, remap, remapId, labelled, titled))
+				logDiagnostic("remapped", keyId, id, remap=remap, remapId=remapId, label=label, title=title)
 		elif name:
 			name = name.strip()
 			try:
 				dummy = int(name)
 			except (TypeError, ValueError):
 				if name and not name.isupper():
-					logMessage(LOG_NOTE, "Auto correcting case of button name '%s' to '%s'." % (name, name.upper()))
+					logDiagnostic("name-case", name=name, newName=name.upper())
 					name = name.upper()
 			if name in AUTO_CORRECT:
-				logMessage(LOG_NOTE, "Auto correcting button name '%s' to '%s'." % (name, AUTO_CORRECT[name]))
+				logDiagnostic("name-corrected", name=name, newName=AUTO_CORRECT[name])
 				name = AUTO_CORRECT[name]
-			try:
-				for keyId, names in KEYDESCRIPTIONS[index].items():
-					if names[0] == name:
-						break
-			except:
-				pass
-			else:
-				logMessage(LOG_ERROR, "The keyId can't be derived from the name '%s'!" % name)
+			keyId = keyIdFromName(index, name)
+			if keyId is None:
+				logDiagnostic("name-unknown", name=name)
 				continue
 			id = KEYIDNAMES.get(keyId)
 			if id is None:
-				logMessage(LOG_ERROR, "The id can't be derived from the keyId '%s'!" % keyId)
+				logDiagnostic("id-unknown", keyId)
 				continue
 		else:
-			logMessage(LOG_ERROR, "The id and keyId can't be determined as the name is also undefined!")
+			logDiagnostic("id-unidentified")
 			continue
 		# print(">   Found %03d: id='%s', keyId=%d, name='%s', label='%s', pos='%s', title='%s', shape='%s', coords='%s'." % (sequence, id, keyId, name, label, pos, title, shape, coords))
 		rcButtons["buttons"].append(keyId)
 		rcButtons[sequence] = {}
 		rcButtons[sequence]["sequence"] = sequence
-		if remap:
+		if remapId is not None:  # A remap is only used with an id.
 			rcButtons[sequence]["remap"] = id
 			rcButtons[sequence]["remapId"] = keyId
 			rcButtons[sequence]["id"] = remap
@@ -989,15 +271,13 @@ def formatLine(line, format):
 
 
 def checkValueList(valueList, listSize, attrib, keyId, id):
-	attrib = " attribute '%s'" % attrib if attrib else ""
-	msg = " in button '%s' (%d)%s" % (id, keyId, attrib)
 	if isinstance(valueList, str):
 		if "." in valueList:
-			logMessage(LOG_ALERT, "Values%s are using '.' as a separator!" % msg)
+			logDiagnostic("value-separator", keyId, id, attrib, value=valueList)
 			valueList.replace(".", ",")
 		valueList = [x.strip() for x in valueList.split(",")]
 	if not isinstance(valueList, (list, tuple)):
-		logMessage(LOG_ALERT, "Value '%s'%s is not a comma separated list!" % (str(valueList), msg))
+		logDiagnostic("value-not-list", keyId, id, attrib, value=valueList)
 		return False, valueList
 	size = len(valueList)
 	valid = False
@@ -1007,33 +287,32 @@ def checkValueList(valueList, listSize, attrib, keyId, id):
 			value = int(value)
 			checkedValueList.append(value)
 			if value > 500:
-				logMessage(LOG_ALERT, "Value %s%s has an item value of %d which is out of the expected range!" % (str(valueList), msg, value))
+				logDiagnostic("value-range", keyId, id, attrib, value=valueList, item=value)
 		if listSize and size == listSize:
 			valid = True
 		elif listSize and size < listSize:
-			logMessage(LOG_ALERT, "Value %s%s is shorter than expected!" % (str(valueList), msg))
+			logDiagnostic("value-short", keyId, id, attrib, value=valueList)
 		elif listSize and size > listSize:
-			logMessage(LOG_ALERT, "Value %s%s is longer than expected!" % (str(valueList), msg))
+			logDiagnostic("value-long", keyId, id, attrib, value=valueList)
 		else:
 			valid = True
 		valueList = checkedValueList
 	except (ValueError, TypeError):
 		if listSize and size == listSize:
-			logMessage(LOG_ALERT, "Value %s%s is invalid but is the correct length!" % (str(valueList), msg))
+			logDiagnostic("value-invalid", keyId, id, attrib, value=valueList)
 		elif listSize and size < listSize:
-			logMessage(LOG_ALERT, "Value %s%s is invalid and shorter than expected!" % (str(valueList), msg))
+			logDiagnostic("value-invalid-short", keyId, id, attrib, value=valueList)
 		elif listSize and size > listSize:
-			logMessage(LOG_ALERT, "Value %s%s is invalid and longer than expected!" % (str(valueList), msg))
+			logDiagnostic("value-invalid-long", keyId, id, attrib, value=valueList)
 	return valid, valueList
 
 
 def checkShape(shape, coords, keyId, id):
-	msg = " in button '%s' (%d)" % (id, keyId)
 	if not shape.islower():
-		logMessage(LOG_NOTE, "Auto correcting case of button shape '%s'%s to '%s'." % (shape, msg, shape.lower()))
+		logDiagnostic("shape-case", keyId, id, shape=shape, newShape=shape.lower())
 		shape = shape.lower()
 	if shape not in ("circle", "poly", "rect"):
-		logMessage(LOG_ERROR, "Invalid shape '%s'%s detected!" % (shape, msg))
+		logDiagnostic("shape-invalid", keyId, id, shape=shape)
 	newShape = None
 	if coords:
 		valid, data = checkValueList(coords, 0, None, keyId, id)
@@ -1046,13 +325,13 @@ def checkShape(shape, coords, keyId, id):
 			elif size > 5 and (size % 2) == 0:
 				newShape = "poly"
 		else:
-			logMessage(LOG_WARNING, "Coordinates %s%s are invalid!" % (data, msg))
+			logDiagnostic("coords-invalid", keyId, id, coords=data)
 	if newShape and shape != newShape:
 		if newShape:
-			logMessage(LOG_NOTE, "Shape '%s'%s inconsistent with %d coordinates, auto correcting shape to '%s'!" % (shape, msg, size, newShape))
+			logDiagnostic("shape-corrected", keyId, id, shape=shape, count=size, newShape=newShape)
 			shape = newShape
 		else:
-			logMessage(LOG_ERROR, "Shape '%s'%s inconsistent with %d coordinates!" % (shape, msg, size))
+			logDiagnostic("shape-inconsistent", keyId, id, shape=shape, count=size)
 	return shape
 
 
@@ -1081,8 +360,9 @@ def sortButtons(sortOrder, rcButtons):
 	for button in sorted(buttonOrder):
 		sequence = int(button[-4:])
 		buttonList.append(sequence)
-	for sequence in sorted(nonButtons):
-		logMessage(LOG_DEBUG, "Additional data item '%s' found '%s'." % (sequence[0], sequence[1]))
+	if diagnosticEnabled("additional-data"):
+		for sequence in sorted(nonButtons):
+			logDiagnostic("additional-data", item=sequence[0], value=sequence[1])
 	return buttonList
 
 
@@ -1090,6 +370,8 @@ def sortButtons(sortOrder, rcButtons):
 #
 def findDuplicates(buttonList, rcButtons):
 	for item in ("position", "id", "label"):
+		if not diagnosticEnabled("duplicate-%s" % item):
+			continue
 		values = {}
 		for button in buttonList:
 			value = rcButtons[button].get(item)
@@ -1097,17 +379,29 @@ def findDuplicates(buttonList, rcButtons):
 				continue
 			if value in values:
 				if item == "id":
-					logMessage(LOG_WARNING, "Button %d with id '%s' (%d) is a duplicate %s with button %d!" % (button, rcButtons[button].get("id", "Unknown"), rcButtons[button].get("keyId", 0), item, values[value]))
+					logDiagnostic("duplicate-id", rcButtons[button].get("keyId", 0), rcButtons[button].get("id", "Unknown"), button=button, other=values[value])
 				elif item == "position":
 					pos = "%d,%d" % (int(value[3:]), int(value[:3]))
-					logMessage(LOG_WARNING, "Button %d with id '%s' (%d) is a duplicate %s (%s) with button %d with id '%s' (%d)!" % (button, rcButtons[button].get("id", "Unknown"), rcButtons[button].get("keyId", 0), item, pos, values[value], rcButtons[values[value]].get("id", "Unknown"), rcButtons[values[value]].get("keyId", 0)))
+					logDiagnostic("duplicate-position", rcButtons[button].get("keyId", 0), rcButtons[button].get("id", "Unknown"), button=button, value=pos, other=values[value], otherKeyName=rcButtons[values[value]].get("id", "Unknown"), otherKeyId=rcButtons[values[value]].get("keyId", 0))
 				else:
-					logMessage(LOG_WARNING, "Button %d with id '%s' (%d) is a duplicate %s (%s) with button %d with id '%s' (%d)!" % (button, rcButtons[button].get("id", "Unknown"), rcButtons[button].get("keyId", 0), item, value, values[value], rcButtons[values[value]].get("id", "Unknown"), rcButtons[values[value]].get("keyId", 0)))
+					logDiagnostic("duplicate-label", rcButtons[button].get("keyId", 0), rcButtons[button].get("id", "Unknown"), button=button, value=value, other=values[value], otherKeyName=rcButtons[values[value]].get("id", "Unknown"), otherKeyId=rcButtons[values[value]].get("keyId", 0))
 			else:
 				values[value] = button
 	return
 
 
+# Look for, and report, buttons whose shapes overlap so that the image
+# map is ambiguous.  Overlaps of less than half a pixel are ignored.
+#
+def findOverlappingShapes(buttonList, rcButtons):
+	if not diagnosticEnabled("overlapping-shape"):
+		return
+	shapes = [(button, rcButtons[button].get("shape"), rcButtons[button].get("coords")) for button in buttonList]
+	for other, button, area in findOverlaps(shapes, 0.5):
+		logDiagnostic("overlapping-shape", rcButtons[button].get("keyId", 0), rcButtons[button].get("id", "Unknown"), button=button, shape=rcButtons[button].get("shape"), other=other, otherKeyName=rcButtons[other].get("id", "Unknown"), otherKeyId=rcButtons[other].get("keyId", 0), otherShape=rcButtons[other].get("shape"), area=int(round(area)))
+	return
+
+
 # Create the XML button definition file.
 #
 def buildXML(filename, buttonList, rcButtons):
@@ -1142,7 +436,7 @@ def buildXML(filename, buttonList, rcButtons):
 	xml.append("\t</rc>")
 	xml.append("</rcs>")
 	try:
-		logMessage(LOG_REPORT, "%d buttons loaded, %d buttons verified and written to the XML file." % (len(rcButtons.get("buttons")), len(buttonList)))
+		logMessage(LOG_REPORT, "%d buttons loaded, %d buttons verified and written to the XML file.", len(rcButtons.get("buttons")), len(buttonList))
 	except:
 		pass
 	saveFile(filename, xml)
@@ -1151,10 +445,13 @@ def buildXML(filename, buttonList, rcButtons):
 
 def saveFile(filename, content):
 	filename = "%s-new" % filename
+	if RESULT_PATH:
+		filename = pathjoin(RESULT_PATH, basename(filename))
 	try:
 		with open(filename, "w") as fd:
 			for line in content:
 				fd.write("%s\n" % line)
+		savedFiles.append(filename)
 	except (IOError, OSError) as err:
 		print("  Error %d: Writing remote control file '%s'! (%s)" % (err.errno, filename, err.strerror))
 	except Exception as err:
@@ -1162,42 +459,241 @@ def saveFile(filename, content):
 	return
 
 
-def logMessage(level, message):
-	if LOG_LEVEL >= level:
-		if level == LOG_PROGRAM:
-			print(message)
-		elif level == LOG_REPORT:
-			print("  %s" % message)
-		else:
-			print("    %s: %s" % (LOG_LEVELS[level], message))
+# Log a message if the logging level allows it.  The message is a format
+# string that is only formatted with the arguments if it is shown and
+# any callable arguments are only called then.  This keeps the cost of
+# messages that are not shown to the level check.
+#
+def logMessage(level, message, *args):
+	if level > LOG_LEVEL:
+		return
+	if args:
+		message = message % tuple([x() if callable(x) else x for x in args])
+	printMessage(level, message)
 
 
-# This is the mainline part of the code.
+# Log a diagnostic from the catalog if the logging level allows it and it
+# is not suppressed for the current remote control.
+#
+def logDiagnostic(diagnostic, keyId=None, keyName=None, attribute=None, **values):
+	if not diagnosticEnabled(diagnostic):
+		return
+	recordDiagnostic(diagnostic, keyId, keyName, attribute, **values)
+	printMessage(diagnosticLevel(diagnostic), formatDiagnostic(diagnostic, keyId, keyName, attribute, values))
+
+
+# Return True if a diagnostic would be reported for the current remote
+# control.  Checks that only report a diagnostic are skipped if not.
+#
+def diagnosticEnabled(diagnostic):
+	return diagnosticLevel(diagnostic) <= LOG_LEVEL and not isSuppressed(SUPPRESSED, diagnostic, currentStem)
+
+
+# Count a diagnostic and keep its JSON record when the diagnostics are
+# being written as JSON records.  This is also used for the problems
+# that are always shown and so have their own messages.
+#
+def recordDiagnostic(diagnostic, keyId=None, keyName=None, attribute=None, **values):
+	counts[diagnostic] = counts.get(diagnostic, 0) + 1
+	if OUTPUT_FORMAT == OUTPUT_JSONL:
+		diagnostics.append(diagnosticRecord(currentStem, diagnostic, keyId, keyName, attribute, values))
+
+
+def printMessage(level, message):
+	if level == LOG_PROGRAM:
+		print(message)
+	elif level == LOG_REPORT:
+		print("  %s" % message)
+	else:
+		print("    %s: %s" % (LOG_LEVELS[level], message))
+
+
+def reportFilename(filename):
+	return pathjoin(REPORT_PATH, "%s.report" % basename(filename))
+
+
+def recordsFilename(filename):
+	return pathjoin(REPORT_PATH, "%s.jsonl" % basename(filename))
+
+
+def saveReport(filename, report):
+	try:
+		with open(filename, "w") as fd:
+			fd.write(report)
+	except (IOError, OSError) as err:
+		print("  Error %d: Writing remote control report file '%s'! (%s)" % (err.errno, filename, err.strerror))
+	except Exception as err:
+		print("  Error: Unexpected error writing remote control report file '%s'! (%s)" % (filename, err))
+	return
+
+
+# Run a function and return everything it printed rather than displaying it.
+#
+def captureOutput(function, *args):
+	stdout = sys.stdout
+	sys.stdout = StringIO()
+	try:
+		function(*args)
+		output = sys.stdout.getvalue()
+	finally:
+		sys.stdout = stdout
+	return output
+
+
+def showBanner():
+	logMessage(LOG_PROGRAM, "ConvertRemoteControl version %s", VERSION)
+	logMessage(LOG_PROGRAM, "Copyright (C) 2021  IanSav  -  All rights reserved.\n")
+	logMessage(LOG_PROGRAM, "This program comes with ABSOLUTELY NO WARRANTY.")
+	logMessage(LOG_PROGRAM, "This is free software, and you are welcome to redistribute it under")
+	logMessage(LOG_PROGRAM, "certain conditions.  See source code and GNUv3 for details.\n")
+	logMessage(LOG_PROGRAM, "Running at logging level %d (%s).", LOG_LEVEL, LOG_LEVELS[LOG_LEVEL])
+	logMessage(LOG_PROGRAM, "Output files will be sorted in %s order.", SORT_ORDERS[SORT_ORDER])
+	if FORMAT_LABELS:
+		logMessage(LOG_PROGRAM, "Labels will be %s.", FORMATS[FORMAT_LABELS])
+	if FORMAT_TITLES:
+		logMessage(LOG_PROGRAM, "Titles will be %s.", FORMATS[FORMAT_TITLES])
+	if SUPPRESSED:
+		logMessage(LOG_PROGRAM, "Diagnostics %s will be suppressed.", ", ".join(sorted([diagnosticCode(x) for x in SUPPRESSED.keys()])))
+
+
+# Show the number of diagnostics of each code and level reported in the run.
 #
-logMessage(LOG_PROGRAM, "ConvertRemoteControl version %s" % VERSION)
-logMessage(LOG_PROGRAM, "Copyright (C) 2021  IanSav  -  All rights reserved.\n")
-logMessage(LOG_PROGRAM, "This program comes with ABSOLUTELY NO WARRANTY.")
-logMessage(LOG_PROGRAM, "This is free software, and you are welcome to redistribute it under")
-logMessage(LOG_PROGRAM, "certain conditions.  See source code and GNUv3 for details.\n")
-logMessage(LOG_PROGRAM, "Running at logging level %d (%s)." % (LOG_LEVEL, LOG_LEVELS[LOG_LEVEL]))
-logMessage(LOG_PROGRAM, "Output files will be sorted in %s order." % SORT_ORDERS[SORT_ORDER])
-if FORMAT_LABELS:
-	logMessage(LOG_PROGRAM, "Labels will be %s." % FORMATS[FORMAT_LABELS])
-if FORMAT_TITLES:
-	logMessage(LOG_PROGRAM, "Titles will be %s." % FORMATS[FORMAT_TITLES])
-if len(argv) > 1:
-	args = argv
-	args.pop(0)
-else:
-	args = [x for x in listdir(".") if isfile(x) and x.endswith(".xml")]
-for filename in sorted(args):
-	logMessage(LOG_PROGRAM, "\nProcessing remote control filename '%s'." % filename)
+def showSummary(totals):
+	logMessage(LOG_PROGRAM, "\nDiagnostic summary:")
+	for line in summaryLines(totals):
+		logMessage(LOG_REPORT, line)
+
+
+# Convert a single remote control XML file.
+#
+def processRemote(filename):
+	logMessage(LOG_PROGRAM, "\nProcessing remote control filename '%s'.", filename)
 	rcButtons = loadRemoteXML(filename)
 	buttonList = sortButtons(SORT_ORDER, rcButtons)
 	findDuplicates(buttonList, rcButtons)
+	findOverlappingShapes(buttonList, rcButtons)
 	try:
 		buildXML(filename, buttonList, rcButtons)
 	except:
 		pass
-logMessage(LOG_PROGRAM, "\nProcessing complete.")
-exit(0)
+
+
+# Convert a single remote control and return its log, the JSON records of
+# its diagnostics, the number of each diagnostic and the files written.
+#
+def convertRemote(filename):
+	global currentStem
+	currentStem = splitext(basename(filename))[0]
+	del savedFiles[:]
+	del diagnostics[:]
+	counts.clear()
+	log = captureOutput(processRemote, filename)
+	return log, "".join(diagnostics), dict(counts), savedFiles[:]
+
+
+# Return the log of a remote control from its report if the cached
+# outputs from an earlier run are still valid, otherwise None.
+#
+def cachedLog(entries, filename, digest, banner, footer):
+	if lookupEntry(entries, filename, digest) is None:
+		return None
+	try:
+		with open(reportFilename(filename), "r") as fd:
+			report = fd.read()
+	except (IOError, OSError):
+		return None
+	if report.startswith(banner) and report.endswith(footer):
+		return report[len(banner):len(report) - len(footer)]
+	return None
+
+
+# Return the JSON records of a remote control saved by an earlier run, or
+# None if they were not saved.
+#
+def cachedRecords(filename):
+	try:
+		with open(recordsFilename(filename), "r") as fd:
+			return fd.read()
+	except (IOError, OSError):
+		return None
+
+
+# This is the mainline part of the code.
+#
+if __name__ == "__main__":
+	parser = ArgumentParser(description="Convert Enigma2 remote control XML definition files to the current format.")
+	parser.add_argument("files", nargs="*", help="remote control XML files or directories of remote control XML files to process (default: the XML files in the current directory)")
+	parser.add_argument("--report-dir", dest="reportDir", metavar="DIR", help="also write the log of each remote control to 'DIR/<file>.report'")
+	parser.add_argument("--result-dir", dest="resultDir", metavar="DIR", help="write the converted XML files into DIR")
+	parser.add_argument("--cache", dest="cache", metavar="FILE", help="skip remote controls whose files are unchanged since the run recorded in the manifest FILE (requires --report-dir)")
+	parser.add_argument("--log-level", dest="logLevel", type=parseLogLevel, default=LOG_LEVEL, metavar="LEVEL", help="show messages up to LEVEL, one of silent, program, report, error, alert, warning, note, information or debug or their number 0-8 (default: %s)" % LOG_LEVELS[LOG_LEVEL].lower())
+	parser.add_argument("--format", dest="format", choices=OUTPUT_FORMATS, default=OUTPUT_FORMAT, help="write the log as text or the diagnostics as one JSON record per line, the reports are always text (default: %s)" % OUTPUT_FORMAT)
+	parser.add_argument("--suppress", dest="suppress", type=loadSuppressions, default={}, metavar="FILE", help="skip the diagnostics listed in FILE, one code or name per line optionally followed by the remote control stems it applies to")
+	parser.add_argument("--list-codes", dest="listCodes", action="store_true", help="list the diagnostic codes and exit")
+	options = parser.parse_args()
+	if options.listCodes:
+		print("\n".join(catalogLines()))
+		exit(0)
+	if options.cache and not options.reportDir:
+		parser.error("--cache requires --report-dir")
+	LOG_LEVEL = options.logLevel
+	REPORT_PATH = options.reportDir
+	RESULT_PATH = options.resultDir
+	OUTPUT_FORMAT = options.format
+	SUPPRESSED = options.suppress
+	banner = captureOutput(showBanner)
+	jsonl = OUTPUT_FORMAT == OUTPUT_JSONL
+	if not jsonl:
+		sys.stdout.write(banner)
+	if options.files:
+		args = []
+	else:
+		args = [x for x in listdir(".") if isfile(x) and x.endswith(".xml")]
+	for arg in options.files:
+		if isdir(arg):  # Process every remote control XML file in a directory with the tables loaded only once.
+			args.extend([pathjoin(arg, basename(x.xml)) for x in directoryIndex(arg).values() if x.xml])  # Keep the directory as it was given.
+		else:
+			args.append(arg)
+	footer = captureOutput(logMessage, LOG_PROGRAM, "\nProcessing complete.")
+	entries = {}
+	if options.cache:  # Reuse the outputs of remote controls whose inputs are unchanged.
+		tables = fingerprint(banner, SUPPRESSED, REMOTE_IMAGE_PATH, KEYIDS, KEYDESCRIPTIONS, AUTO_CORRECT, REPORT_PATH, RESULT_PATH, fileDigest("%s.py" % splitext(__file__)[0], pathjoin(dirname(__file__), "RemoteControlDiagnostics.py"), pathjoin(dirname(__file__), "RemoteControlDocuments.py"), pathjoin(dirname(__file__), "RemoteControlGeometry.py")))
+		entries = loadManifest(options.cache, tables)
+		for filename in list(entries.keys()):
+			assets = findAssets(splitext(filename)[0])
+			if assets is None or assets.xml is None:
+				removeOutputs(entries, filename)  # The remote control has been removed.
+	totals = {}
+	for filename in sorted(args):
+		log = None
+		records = None
+		reported = {}
+		if options.cache:
+			digest = fileDigest(filename)
+			log = cachedLog(entries, filename, digest, banner, footer)
+			records = cachedRecords(filename) if jsonl and log is not None else ""
+			if log is None or records is None:
+				removeOutputs(entries, filename)
+				log = None
+			else:
+				reported = entries[filename].get("counts", {})
+		if log is None:
+			log, records, reported, outputs = convertRemote(filename)
+			if REPORT_PATH:
+				saveReport(reportFilename(filename), "%s%s%s" % (banner, log, footer))
+				outputs.append(reportFilename(filename))
+				if jsonl:
+					saveReport(recordsFilename(filename), records)
+					outputs.append(recordsFilename(filename))
+			if options.cache:
+				entries[filename] = {"digest": digest, "outputs": outputs, "counts": reported}
+		for diagnostic, count in reported.items():
+			totals[diagnostic] = totals.get(diagnostic, 0) + count
+		sys.stdout.write(records if jsonl else log)
+	if options.cache:
+		saveManifest(options.cache, tables, entries)
+	if not jsonl:
+		if totals:
+			showSummary(totals)
+		sys.stdout.write(footer)
+	exit(0)
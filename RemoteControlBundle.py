@@ -0,0 +1,454 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlBundle.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	A compact binary bundle of every remote control XML definition so
+# 	that a box can show a remote control without parsing its XML file.
+# 	makebundle.py compiles rc/*.xml into the bundle and BundleReader
+# 	reads the buttons of one remote control with a single seek and read.
+# 	MappedBundle maps the bundle into memory instead and reads the
+# 	buttons and strings straight from the mapped pages as they are used.
+#
+# 	The bundle is little endian and has four parts:
+#
+# 	The HEADER with the magic, version, number of remote controls and
+# 	the offsets of the other parts.
+#
+# 	The table of remote controls, one REMOTE record each sorted by code
+# 	name, with the code name, id and image of the remote control and the
+# 	offset and size of its block.
+#
+# 	The block of each remote control, one BUTTON record for each button
+# 	in the order of the XML file followed by the coords of all its
+# 	buttons as signed 16 bit integers.
+#
+# 	The string pool shared by all the remote controls.  Each string is
+# 	stored once as its 16 bit length and its UTF-8 bytes and is referred
+# 	to by its offset in the pool, NO_STRING if there is no string.
+
+from mmap import ACCESS_READ, mmap
+from os.path import join as pathjoin
+from struct import Struct, unpack_from
+
+try:
+	from xml.etree.cElementTree import parse
+except ImportError:  # Python 3.9 and later only have ElementTree.
+	from xml.etree.ElementTree import parse
+
+from RemoteControlInventory import REMOTES_PATH
+from RemoteControlKeys import KEYIDS
+
+BUNDLE_MAGIC = b"RCBN"
+BUNDLE_VERSION = 1
+BUNDLE_FILE = pathjoin(REMOTES_PATH, "remotes.bin")
+
+HEADER = Struct("<4sHHIIII")  # Magic, version, unused, remote controls, remote table offset, string pool offset and size.
+REMOTE = Struct("<IIIIII")  # Code name, id and image strings, block offset, buttons and coords.
+BUTTON = Struct("<7hBBHH4I")  # Key id, remap key id, pos, size, radius, shape, unused, first coord and coords, key name, label, title and remap strings.
+COORD = Struct("<h")
+LENGTH = Struct("<H")
+
+NO_STRING = 0xFFFFFFFF
+NO_VALUE = -32768  # The value of a missing key id, pos, size or radius.
+
+SHAPES = (None, "circle", "rect", "poly", "default")  # The shape names indexed by their code.
+
+
+def parseIntegers(value):
+	return tuple([int(x.strip()) for x in value.split(",")]) if value is not None else None
+
+
+def shortValue(value):
+	if value is None:
+		return NO_VALUE
+	if not -32767 <= value <= 32767:
+		raise ValueError("Value %d is too large for the bundle!" % value)
+	return value
+
+
+# Read a remote control XML definition and return it as a dict with its
+# code name, id, image and list of buttons, and a list of (level,
+# message) tuples for the problems found.  Each button is a dict with
+# the values of its attributes, where "pos", "size" and "coords" are
+# tuples of integers.  The old "keyid" and "name" attributes are read as
+# "id" and "label".  The shape is read in lower case, as the check does,
+# and a button with an unknown shape is kept with no shape.
+#
+def compileRemote(filename, codeName):
+	rc = parse(filename).getroot().find("rc")
+	if rc is None:
+		raise ValueError("'%s' has no rc element!" % filename)
+	problems = []
+	buttons = []
+	for element in rc.findall("button"):
+		keyName = element.get("id", element.get("keyid"))
+		remap = element.get("remap")
+		radius = element.get("radius")
+		shape = element.get("shape")
+		if shape is not None:
+			shape = shape.lower()
+			if shape not in SHAPES:
+				problems.append(("warning", "'%s' button '%s' has the unknown shape '%s'" % (filename, keyName, element.get("shape"))))
+				shape = None
+		buttons.append({
+			"keyName": keyName,
+			"keyId": KEYIDS.get(keyName),
+			"label": element.get("label", element.get("name")),
+			"title": element.get("title"),
+			"pos": parseIntegers(element.get("pos")),
+			"shape": shape,
+			"size": parseIntegers(element.get("size")),
+			"radius": int(radius) if radius is not None else None,
+			"coords": parseIntegers(element.get("coords")),
+			"remap": remap,
+			"remapId": KEYIDS.get(remap) if remap else None
+		})
+	return {"codeName": codeName, "id": rc.get("id"), "image": rc.get("image"), "buttons": buttons}, problems
+
+
+class StringPool(object):
+	__slots__ = ("data", "offsets")
+
+	def __init__(self):
+		self.data = bytearray()
+		self.offsets = {}
+
+	# Return the offset of a string in the pool, adding it if it is new.
+	#
+	def add(self, value):
+		if value is None:
+			return NO_STRING
+		offset = self.offsets.get(value)
+		if offset is None:
+			data = value if isinstance(value, bytes) else value.encode("utf-8")
+			offset = len(self.data)
+			self.data.extend(LENGTH.pack(len(data)))
+			self.data.extend(data)
+			self.offsets[value] = offset
+		return offset
+
+
+def packButton(button, pool, firstCoord):
+	pos = button["pos"] or (None, None)
+	size = button["size"] or (None, None)
+	coords = button["coords"] or ()
+	return BUTTON.pack(
+		shortValue(button["keyId"]), shortValue(button["remapId"]),
+		shortValue(pos[0]), shortValue(pos[1]),
+		shortValue(size[0]), shortValue(size[1]),
+		shortValue(button["radius"]),
+		SHAPES.index(button["shape"]), 0,
+		firstCoord, len(coords),
+		pool.add(button["keyName"]), pool.add(button["label"]), pool.add(button["title"]), pool.add(button["remap"])
+	)
+
+
+# Pack a list of remote controls, as returned by compileRemote, into the
+# bytes of a bundle.  The bundle only depends on the remote controls so
+# the same definitions always give the same bundle.
+#
+def packBundle(remotes):
+	remotes = sorted(remotes, key=lambda x: x["codeName"])
+	pool = StringPool()
+	tableOffset = HEADER.size
+	offset = tableOffset + REMOTE.size * len(remotes)
+	table = []
+	blocks = []
+	for remote in remotes:
+		records = []
+		coords = []
+		for button in remote["buttons"]:
+			if len(coords) + len(button["coords"] or ()) > 0xFFFF:
+				raise ValueError("Remote control '%s' has too many coords for the bundle!" % remote["codeName"])
+			records.append(packButton(button, pool, len(coords)))
+			coords.extend([shortValue(x) for x in button["coords"] or ()])
+		block = b"".join(records) + b"".join([COORD.pack(x) for x in coords])
+		table.append(REMOTE.pack(pool.add(remote["codeName"]), pool.add(remote["id"]), pool.add(remote["image"]), offset, len(records), len(coords)))
+		blocks.append(block)
+		offset += len(block)
+	header = HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(remotes), tableOffset, offset, len(pool.data))
+	return header + b"".join(table) + b"".join(blocks) + bytes(pool.data)
+
+
+def unpackString(pool, offset):
+	if offset == NO_STRING:
+		return None
+	length = LENGTH.unpack_from(pool, offset)[0]
+	return bytes(pool[offset + LENGTH.size:offset + LENGTH.size + length]).decode("utf-8")
+
+
+def optionalValue(value):
+	return None if value == NO_VALUE else value
+
+
+def optionalPair(first, second):
+	return None if first == NO_VALUE else (first, second)
+
+
+# Unpack the block of a remote control into the list of its buttons, as
+# returned by compileRemote.  The strings are looked up with the string
+# function, which is given the offset of each string in the pool.
+#
+def unpackButtons(block, string, buttons):
+	coordsOffset = BUTTON.size * buttons
+	result = []
+	for index in range(buttons):
+		keyId, remapId, x, y, width, height, radius, shape, unused, firstCoord, coords, keyName, label, title, remap = BUTTON.unpack_from(block, BUTTON.size * index)
+		start = coordsOffset + COORD.size * firstCoord
+		result.append({
+			"keyName": string(keyName),
+			"keyId": optionalValue(keyId),
+			"label": string(label),
+			"title": string(title),
+			"pos": optionalPair(x, y),
+			"shape": SHAPES[shape],
+			"size": optionalPair(width, height),
+			"radius": optionalValue(radius),
+			"coords": unpack_from("<%dh" % coords, block, start) if coords else None,
+			"remap": string(remap),
+			"remapId": optionalValue(remapId)
+		})
+	return result
+
+
+# Read remote controls from a bundle file.  Opening the bundle reads the
+# header, the table of remote controls and the string pool.  Each remote
+# control is then read with a single seek and read of its block.  The
+# strings are only decoded once as most labels are shared by many remote
+# controls.
+#
+class BundleReader(object):
+	__slots__ = ("fd", "pool", "strings", "remotes")
+
+	def __init__(self, filename=BUNDLE_FILE):
+		self.fd = open(filename, "rb")
+		try:
+			magic, version, unused, count, tableOffset, poolOffset, poolSize = HEADER.unpack(self.fd.read(HEADER.size))
+			if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+				raise ValueError("'%s' is not a version %d remote control bundle!" % (filename, BUNDLE_VERSION))
+			self.fd.seek(tableOffset)
+			table = self.fd.read(REMOTE.size * count)
+			self.fd.seek(poolOffset)
+			self.pool = self.fd.read(poolSize)
+			self.strings = {}
+			self.remotes = {}
+			for index in range(count):
+				codeName, rcId, image, offset, buttons, coords = REMOTE.unpack_from(table, REMOTE.size * index)
+				self.remotes[unpackString(self.pool, codeName)] = (unpackString(self.pool, rcId), unpackString(self.pool, image), offset, buttons, coords)
+		except Exception:
+			self.fd.close()
+			raise
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, excType, excValue, traceback):
+		self.close()
+
+	def close(self):
+		self.fd.close()
+
+	def string(self, offset):
+		try:
+			return self.strings[offset]
+		except KeyError:
+			value = unpackString(self.pool, offset)
+			self.strings[offset] = value
+			return value
+
+	def codeNames(self):
+		return sorted(self.remotes.keys())
+
+	# Return a remote control as returned by compileRemote or None if the
+	# bundle has no remote control with the code name.
+	#
+	def remote(self, codeName):
+		entry = self.remotes.get(codeName)
+		if entry is None:
+			return None
+		rcId, image, offset, buttons, coords = entry
+		self.fd.seek(offset)
+		block = self.fd.read(BUTTON.size * buttons + COORD.size * coords)
+		return {"codeName": codeName, "id": rcId, "image": image, "buttons": unpackButtons(block, self.string, buttons)}
+
+
+# A button of a MappedBundle.  The values are unpacked from the mapped
+# button record each time they are used and the strings are decoded
+# from the mapped string pool, so a view holds no copy of the button.
+#
+class ButtonView(object):
+	__slots__ = ("bundle", "offset", "coordsOffset")
+
+	def __init__(self, bundle, offset, coordsOffset):
+		self.bundle = bundle
+		self.offset = offset
+		self.coordsOffset = coordsOffset
+
+	def record(self):
+		return BUTTON.unpack_from(self.bundle.data, self.offset)
+
+	@property
+	def keyName(self):
+		return self.bundle.string(self.record()[11])
+
+	@property
+	def keyId(self):
+		return optionalValue(self.record()[0])
+
+	@property
+	def label(self):
+		return self.bundle.string(self.record()[12])
+
+	@property
+	def title(self):
+		return self.bundle.string(self.record()[13])
+
+	@property
+	def pos(self):
+		record = self.record()
+		return optionalPair(record[2], record[3])
+
+	@property
+	def shape(self):
+		return SHAPES[self.record()[7]]
+
+	@property
+	def size(self):
+		record = self.record()
+		return optionalPair(record[4], record[5])
+
+	@property
+	def radius(self):
+		return optionalValue(self.record()[6])
+
+	@property
+	def coords(self):
+		record = self.record()
+		if not record[10]:
+			return None
+		return unpack_from("<%dh" % record[10], self.bundle.data, self.coordsOffset + COORD.size * record[9])
+
+	@property
+	def remap(self):
+		return self.bundle.string(self.record()[14])
+
+	@property
+	def remapId(self):
+		return optionalValue(self.record()[1])
+
+	# Return the button as a dict, as returned by compileRemote.
+	#
+	def asDict(self):
+		return dict([(x, getattr(self, x)) for x in ("keyName", "keyId", "label", "title", "pos", "shape", "size", "radius", "coords", "remap", "remapId")])
+
+
+# A remote control of a MappedBundle.  It is a sequence of the
+# ButtonView of each of its buttons.
+#
+class RemoteView(object):
+	__slots__ = ("bundle", "offset")
+
+	def __init__(self, bundle, offset):
+		self.bundle = bundle
+		self.offset = offset  # The offset of the REMOTE record of the remote control.
+
+	def record(self):
+		return REMOTE.unpack_from(self.bundle.data, self.offset)
+
+	@property
+	def codeName(self):
+		return self.bundle.string(self.record()[0])
+
+	@property
+	def id(self):
+		return self.bundle.string(self.record()[1])
+
+	@property
+	def image(self):
+		return self.bundle.string(self.record()[2])
+
+	def __len__(self):
+		return self.record()[4]
+
+	def __getitem__(self, index):
+		codeName, rcId, image, offset, buttons, coords = self.record()
+		if index < 0:
+			index += buttons
+		if not 0 <= index < buttons:
+			raise IndexError("button index out of range")
+		return ButtonView(self.bundle, offset + BUTTON.size * index, offset + BUTTON.size * buttons)
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield self[index]
+
+	# Return the remote control as a dict, as returned by compileRemote.
+	#
+	def asDict(self):
+		return {"codeName": self.codeName, "id": self.id, "image": self.image, "buttons": [x.asDict() for x in self]}
+
+
+# Read remote controls from a bundle file mapped into memory.  Nothing
+# is read when the bundle is opened.  A remote control is found with a
+# binary search of the table of remote controls, which is sorted by code
+# name, and its buttons and strings are only read from the mapped pages
+# when they are used.  The memory used only grows with the pages that
+# are touched and not with the number of remote controls in the bundle.
+#
+class MappedBundle(object):
+	__slots__ = ("data", "count", "tableOffset", "poolOffset")
+
+	def __init__(self, filename=BUNDLE_FILE):
+		with open(filename, "rb") as fd:
+			self.data = mmap(fd.fileno(), 0, access=ACCESS_READ)  # The mapping stays valid once the file is closed.
+		try:
+			magic, version, unused, self.count, self.tableOffset, self.poolOffset, poolSize = HEADER.unpack_from(self.data, 0)
+			if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+				raise ValueError("'%s' is not a version %d remote control bundle!" % (filename, BUNDLE_VERSION))
+		except Exception:
+			self.data.close()
+			raise
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, excType, excValue, traceback):
+		self.close()
+
+	def close(self):
+		self.data.close()
+
+	def __len__(self):
+		return self.count
+
+	def rawString(self, offset):
+		start = self.poolOffset + offset + LENGTH.size
+		return self.data[start:start + LENGTH.unpack_from(self.data, start - LENGTH.size)[0]]
+
+	def string(self, offset):
+		return None if offset == NO_STRING else self.rawString(offset).decode("utf-8")
+
+	def codeNames(self):
+		return [self.string(REMOTE.unpack_from(self.data, self.tableOffset + REMOTE.size * x)[0]) for x in range(self.count)]
+
+	# Return the RemoteView of a remote control or None if the bundle has
+	# no remote control with the code name.
+	#
+	def remote(self, codeName):
+		key = codeName.encode("utf-8")
+		low = 0
+		high = self.count
+		while low < high:
+			middle = (low + high) // 2
+			offset = self.tableOffset + REMOTE.size * middle
+			name = self.rawString(REMOTE.unpack_from(self.data, offset)[0])
+			if name < key:
+				low = middle + 1
+			elif name > key:
+				high = middle
+			else:
+				return RemoteView(self, offset)
+		return None
@@ -0,0 +1,108 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlCache.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Incremental build support for the remote control tools.  A small
+# 	JSON manifest records, for each remote control, the SHA-256 digest
+# 	of its input files and the output files that were generated from
+# 	them.  Remote controls whose inputs, program version and tables are
+# 	unchanged can then reuse the previously generated outputs.
+
+from errno import ENOENT
+from hashlib import sha256
+from json import dump, load
+from os import remove
+from os.path import isfile
+
+MANIFEST_VERSION = 1
+
+
+# Return the SHA-256 digest of the content of all the given files.  A
+# missing file is hashed as a marker so that adding or removing a file
+# also changes the digest.
+#
+def fileDigest(*filenames):
+	digest = sha256()
+	for filename in filenames:
+		digest.update(("\0%s\0" % filename).encode("utf-8"))
+		try:
+			with open(filename, "rb") as fd:
+				digest.update(fd.read())
+		except (IOError, OSError) as err:
+			if err.errno != ENOENT:
+				raise
+			digest.update(b"\0missing\0")
+	return digest.hexdigest()
+
+
+# Return the SHA-256 digest of a set of Python values.  The values
+# should only contain strings, numbers, lists, tuples and dicts so that
+# the result is the same on all versions of Python.
+#
+def fingerprint(*items):
+	digest = sha256()
+	for item in items:
+		digest.update(("%s\0" % canonical(item)).encode("utf-8"))
+	return digest.hexdigest()
+
+
+def canonical(item):
+	if isinstance(item, dict):
+		return "{%s}" % ",".join(["%s:%s" % (canonical(key), canonical(value)) for key, value in sorted(item.items())])
+	if isinstance(item, (list, tuple)):
+		return "[%s]" % ",".join([canonical(value) for value in item])
+	return repr(item).lstrip("u")
+
+
+# Load the manifest.  If the manifest is missing, unreadable or was
+# produced with a different fingerprint an empty manifest is returned.
+#
+def loadManifest(filename, fingerprint):
+	try:
+		with open(filename, "r") as fd:
+			manifest = load(fd)
+		if manifest.get("version") == MANIFEST_VERSION and manifest.get("fingerprint") == fingerprint:
+			return manifest.get("entries", {})
+	except (IOError, OSError, ValueError, AttributeError):
+		pass
+	return {}
+
+
+def saveManifest(filename, fingerprint, entries):
+	manifest = {
+		"version": MANIFEST_VERSION,
+		"fingerprint": fingerprint,
+		"entries": entries
+	}
+	try:
+		with open(filename, "w") as fd:
+			dump(manifest, fd, indent=1, separators=(",", ": "), sort_keys=True)
+			fd.write("\n")
+	except (IOError, OSError) as err:
+		print("  Error %d: Writing cache manifest file '%s'! (%s)" % (err.errno, filename, err.strerror))
+
+
+# Return the manifest entry for a remote control if its inputs are
+# unchanged and all its recorded outputs still exist, otherwise None.
+#
+def lookupEntry(entries, stem, digest):
+	entry = entries.get(stem)
+	if entry and entry.get("digest") == digest and all([isfile(x) for x in entry.get("outputs", [])]):
+		return entry
+	return None
+
+
+# Delete the outputs previously recorded for a remote control so that
+# a rebuild can not leave stale files behind.
+#
+def removeOutputs(entries, stem):
+	entry = entries.pop(stem, None)
+	if entry:
+		for filename in entry.get("outputs", []):
+			try:
+				remove(filename)
+			except (IOError, OSError):
+				pass
@@ -0,0 +1,258 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlDiagnostics.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	The logging levels and the catalog of diagnostics reported by the
+# 	remote control tools.  Every diagnostic has a name, which is used
+# 	in the code, a stable numbered code, a logging level and the format
+# 	of its message.  A diagnostic can be shown as a line of the human
+# 	readable log or written as a JSON record for other tools to read.
+# 	Diagnostics can be suppressed, for all remote controls or only some,
+# 	with a suppression file and are counted for the end of run summary.
+
+from argparse import ArgumentTypeError
+from json import dumps
+
+LOG_SILENT = 0
+LOG_PROGRAM = 1
+LOG_REPORT = 2
+LOG_ERROR = 3
+LOG_ALERT = 4
+LOG_WARNING = 5
+LOG_NOTE = 6
+LOG_INFORMATION = 7
+LOG_DEBUG = 8
+LOG_LEVELS = {
+	LOG_SILENT: "Silent",
+	LOG_PROGRAM: "Program",
+	LOG_REPORT: "Report",
+	LOG_ERROR: "Error",
+	LOG_ALERT: "Alert",
+	LOG_WARNING: "Warning",
+	LOG_NOTE: "Note",
+	LOG_INFORMATION: "Information",
+	LOG_DEBUG: "Debug"
+}
+
+OUTPUT_TEXT = "text"
+OUTPUT_JSONL = "jsonl"
+OUTPUT_FORMATS = (OUTPUT_TEXT, OUTPUT_JSONL)
+
+
+def formatRemap(fields):
+	labelled = " and labelled '%s'" % fields["label"] if fields["label"] else ""
+	titled = " and titled '%s'" % fields["title"] if fields["title"] else ""
+	return "Button '%s' (%d) remapped to '%s' (%d)%s%s." % (fields["keyName"], fields["keyId"], fields["remap"], fields["remapId"], labelled, titled)
+
+
+def formatXMLOnly(fields):
+	msgs = ["Button keyid '%s' (%d) named '%s'." % (keyName, keyId, name or "*Undefined*") for keyId, keyName, name in fields["buttons"]]
+	return "These buttons are in the XML file but not the HTML file!\n\t%s" % "\n\t".join(msgs)
+
+
+def formatHTMLOnly(fields):
+	msgs = ["Button keyid '%s' (%d) titled '%s'." % (keyName, keyId, title or "*Undefined*") for keyId, keyName, title in fields["buttons"]]
+	return "These buttons are in the HTML file but not the XML file!\n\t%s" % "\n\t".join(msgs)
+
+
+def formatTolerance(fields):
+	axes = fields["axes"]
+	msg = "%s value exceeds" if len(axes) == 1 else "%s values exceed"
+	tolerance = fields["tolerance"]
+	return "Remote control keyid %s (%d) %s tolerance of %d pixel%s!  (shape='%s' pos=%s coords=%s center=%s)" % (fields["keyName"], fields["keyId"], msg % " and ".join(axes), tolerance, "" if tolerance == 1 else "s", fields["shape"], fields["pos"], fields["coords"], fields["center"])
+
+
+# The diagnostics catalog.  Each entry maps the name of a diagnostic to
+# its code, level and message.  The message is a format string for the
+# diagnostic fields or a function returning the message from the fields.
+# The codes are grouped by the stage that reports them and must never be
+# reused for a different diagnostic.
+#
+#	RC1xx  Reading the definition files.
+#	RC2xx  Identifying the buttons.
+#	RC3xx  Checking attribute values and shapes.
+#	RC4xx  Comparing the XML and HTML definitions.
+#	RC5xx  Completing missing attributes.
+#	RC6xx  Sorting, checking and building the output.
+#
+CATALOG = {
+	"xml-missing": ("RC101", LOG_WARNING, "Remote control XML file '%(filename)s' does not exist!"),
+	"xml-open-error": ("RC102", LOG_ERROR, "Error %(errno)d: Opening remote control XML file '%(filename)s'! (%(error)s)"),
+	"xml-parse-error": ("RC103", LOG_ERROR, "XML Parse Error: '%(error)s' in '%(filename)s'!"),
+	"xml-invalid": ("RC104", LOG_ERROR, "Unable to parse XML remote control data in '%(filename)s' - '%(error)s'!"),
+	"xml-undefined": ("RC105", LOG_WARNING, "Remote control XML is undefined so remote control id will be processed as '2'!"),
+	"xml-structure": ("RC106", LOG_ERROR, "Remote control XML file structure is invalid!"),
+	"xml-unexpected-error": ("RC107", LOG_ERROR, "Unexpected error opening remote control XML file '%(filename)s'! (%(error)s)"),
+	"html-missing": ("RC111", LOG_WARNING, "Remote control HTML file '%(filename)s' does not exist!"),
+	"html-open-error": ("RC112", LOG_ERROR, "Error %(errno)d: Opening remote control HTML file '%(filename)s'! (%(error)s)"),
+	"html-parse-error": ("RC113", LOG_ERROR, "HTML Parse Error: '%(error)s' in '%(filename)s'!"),
+	"html-invalid": ("RC114", LOG_ERROR, "Unable to parse HTML remote control data in '%(filename)s' - '%(error)s'!"),
+	"html-undefined": ("RC115", LOG_WARNING, "Remote control HTML is undefined!"),
+	"html-structure": ("RC116", LOG_ERROR, "Remote control HTML file structure is invalid!"),
+	"html-no-image": ("RC117", LOG_ERROR, "No remote control image found in HTML file!"),
+	"html-unexpected-error": ("RC118", LOG_ERROR, "Unexpected error opening remote control HTML file '%(filename)s'! (%(error)s)"),
+	"keyname-invalid": ("RC201", LOG_ERROR, "The keyName '%(keyName)s' appears invalid!"),
+	"remap-invalid": ("RC202", LOG_ERROR, "The remap keyName '%(remap)s' appears invalid!"),
+	"remapped": ("RC203", LOG_INFORMATION, formatRemap),
+	"name-case": ("RC204", LOG_NOTE, "Auto correcting case of button name '%(name)s' to '%(newName)s'."),
+	"name-corrected": ("RC205", LOG_NOTE, "Auto correcting button name '%(name)s' to '%(newName)s'."),
+	"name-unknown": ("RC206", LOG_ERROR, "The keyId can't be derived from the name '%(name)s'!"),
+	"keyid-unknown": ("RC207", LOG_ERROR, "The keyName can't be derived from the keyId '%(keyId)s'!"),
+	"button-unidentified": ("RC208", LOG_ERROR, "The keyName and keyId can't be determined as the name is also undefined!"),
+	"id-invalid": ("RC211", LOG_ERROR, "The id '%(keyName)s' appears invalid!"),
+	"remap-id-invalid": ("RC212", LOG_ERROR, "The remap id '%(remap)s' appears invalid!"),
+	"id-unknown": ("RC217", LOG_ERROR, "The id can't be derived from the keyId '%(keyId)s'!"),
+	"id-unidentified": ("RC218", LOG_ERROR, "The id and keyId can't be determined as the name is also undefined!"),
+	"title-alt-differ": ("RC221", LOG_NOTE, "Button '%(keyName)s' (%(keyId)d) has both 'title' and 'alt' attributes but they are different!  ('%(title)s' != '%(alt)s')"),
+	"title-from-alt": ("RC222", LOG_NOTE, "Button '%(keyName)s' (%(keyId)d) has no 'title' attribute, using 'alt' instead."),
+	"onclick-format": ("RC223", LOG_NOTE, "Auto correcting format of onclick '%(onclick)s' to '%(newOnclick)s'."),
+	"value-separator": ("RC301", LOG_ALERT, "Values%(button)s are using '.' as a separator!"),
+	"value-not-list": ("RC302", LOG_ALERT, "Value '%(value)s'%(button)s is not a comma separated list!"),
+	"value-range": ("RC303", LOG_ALERT, "Value %(value)s%(button)s has an item value of %(item)d which is out of the expected range!"),
+	"value-short": ("RC304", LOG_ALERT, "Value %(value)s%(button)s is shorter than expected!"),
+	"value-long": ("RC305", LOG_ALERT, "Value %(value)s%(button)s is longer than expected!"),
+	"value-invalid": ("RC306", LOG_ALERT, "Value %(value)s%(button)s is invalid but is the correct length!"),
+	"value-invalid-short": ("RC307", LOG_ALERT, "Value %(value)s%(button)s is invalid and shorter than expected!"),
+	"value-invalid-long": ("RC308", LOG_ALERT, "Value %(value)s%(button)s is invalid and longer than expected!"),
+	"shape-case": ("RC311", LOG_NOTE, "Auto correcting case of button shape '%(shape)s'%(button)s to '%(newShape)s'."),
+	"shape-invalid": ("RC312", LOG_ERROR, "Invalid shape '%(shape)s'%(button)s detected!"),
+	"coords-invalid": ("RC313", LOG_WARNING, "Coordinates %(coords)s%(button)s are invalid!"),
+	"shape-corrected": ("RC314", LOG_NOTE, "Shape '%(shape)s'%(button)s inconsistent with %(count)d coordinates, auto correcting shape to '%(newShape)s'!"),
+	"shape-inconsistent": ("RC315", LOG_ERROR, "Shape '%(shape)s'%(button)s inconsistent with %(count)d coordinates!"),
+	"shape-outside-image": ("RC316", LOG_WARNING, "Remote control keyid %(keyName)s (%(keyId)d) %(shape)s coords %(coords)s extend outside the %(width)dx%(height)d image!"),
+	"image-mismatch": ("RC401", LOG_ALERT, "Remote control XML image value doesn't match HTML value!  ('%(xmlImage)s' != '%(htmlImage)s')"),
+	"image-undefined": ("RC402", LOG_ERROR, "No image reference can be found for this remote control!"),
+	"image-available": ("RC403", LOG_INFORMATION, "An image file for this remote control appears to be available."),
+	"xml-only-buttons": ("RC404", LOG_ERROR, formatXMLOnly),
+	"html-only-buttons": ("RC405", LOG_ERROR, formatHTMLOnly),
+	"buttons-mismatched": ("RC406", LOG_ERROR, "Remote control XML and HTML buttons are mismatched so the validation is incomplete and may be in inaccurate!"),
+	"value-mismatch": ("RC407", LOG_WARNING, "Remote control keyid %(keyName)s (%(keyId)d) XML '%(attribute)s' value doesn't match HTML value!  ('%(xmlValue)s' != '%(htmlValue)s')"),
+	"pos-tolerance": ("RC408", LOG_WARNING, formatTolerance),
+	"name-added": ("RC501", LOG_NOTE, "Remote control keyid %(keyName)s (%(keyId)d) attribute 'name' with a value of '%(value)s' is being added."),
+	"label-added": ("RC502", LOG_NOTE, "Remote control keyid %(keyName)s (%(keyId)d) attribute 'label' with a value of '%(value)s' is being added."),
+	"title-added": ("RC503", LOG_NOTE, "Remote control keyid %(keyName)s (%(keyId)d) attribute 'title' with a value of '%(value)s' is being added."),
+	"pos-added": ("RC504", LOG_NOTE, "Remote control keyid %(keyName)s (%(keyId)d) attribute 'pos' with a value of %(value)s is being added."),
+	"coords-added": ("RC505", LOG_NOTE, "Remote control keyid %(keyName)s (%(keyId)d) attribute 'coords' with a value of %(value)s is being added."),
+	"sort-key-mismatch": ("RC601", LOG_ERROR, "Sort key '%(key)d' does not match the key id '%(keyId)d'!"),
+	"additional-data": ("RC602", LOG_DEBUG, "Additional data item '%(item)s' found '%(value)s'."),
+	"duplicate-id": ("RC611", LOG_WARNING, "Button %(button)d with id '%(keyName)s' (%(keyId)d) is a duplicate id with button %(other)d!"),
+	"duplicate-position": ("RC612", LOG_WARNING, "Button %(button)d with id '%(keyName)s' (%(keyId)d) is a duplicate position (%(value)s) with button %(other)d with id '%(otherKeyName)s' (%(otherKeyId)d)!"),
+	"duplicate-label": ("RC613", LOG_WARNING, "Button %(button)d with id '%(keyName)s' (%(keyId)d) is a duplicate label (%(value)s) with button %(other)d with id '%(otherKeyName)s' (%(otherKeyId)d)!"),
+	"overlapping-shape": ("RC614", LOG_WARNING, "Button %(button)d with id '%(keyName)s' (%(keyId)d) %(shape)s overlaps button %(other)d with id '%(otherKeyName)s' (%(otherKeyId)d) %(otherShape)s by %(area)d square pixels!")
+}
+
+
+# The fields of a diagnostic used to format its message.  Tuples are
+# shown the way the logs have always shown a list of values and the
+# button description is only built if the message uses it.
+#
+class MessageFields(dict):
+	def __init__(self, keyId, keyName, attribute, values):
+		dict.__init__(self, [(key, str(list(value)) if isinstance(value, tuple) else value) for key, value in values.items()])
+		self["keyId"] = keyId
+		self["keyName"] = keyName
+		self["attribute"] = attribute
+
+	def __missing__(self, key):
+		if key != "button":
+			raise KeyError(key)
+		attribute = " attribute '%s'" % self["attribute"] if self["attribute"] else ""
+		return " in button '%s' (%d)%s" % (self["keyName"], self["keyId"], attribute)
+
+
+def diagnosticCode(name):
+	return CATALOG[name][0]
+
+
+def diagnosticLevel(name):
+	return CATALOG[name][1]
+
+
+def formatDiagnostic(name, keyId, keyName, attribute, values):
+	message = CATALOG[name][2]
+	fields = MessageFields(keyId, keyName, attribute, values)
+	return message(fields) if callable(message) else message % fields
+
+
+# Return a diagnostic as a single line JSON record.
+#
+def diagnosticRecord(stem, name, keyId, keyName, attribute, values):
+	code, level, message = CATALOG[name]
+	record = {
+		"stem": stem,
+		"code": code,
+		"name": name,
+		"level": LOG_LEVELS[level].lower(),
+		"keyId": keyId,
+		"keyName": keyName,
+		"attribute": attribute,
+		"values": values
+	}
+	return "%s\n" % dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+
+
+# Return the catalog as lines of code, level and name in code order.
+#
+def catalogLines():
+	return ["%s  %-11s  %s" % (code, LOG_LEVELS[level], name) for code, level, name in sorted([(x[1][0], x[1][1], x[0]) for x in CATALOG.items()])]
+
+
+# Return the summary of the diagnostics reported in a run as lines with
+# the count of each code followed by the count of each level.
+#
+def summaryLines(counts):
+	lines = []
+	levels = {}
+	for code, level, name in sorted([(CATALOG[x][0], CATALOG[x][1], x) for x in counts.keys()]):
+		lines.append("%s  %-11s  %6d  %s" % (code, LOG_LEVELS[level], counts[name], name))
+		levels[level] = levels.get(level, 0) + counts[name]
+	for level in sorted(levels.keys()):
+		lines.append("%-18s  %6d" % (LOG_LEVELS[level], levels[level]))
+	return lines
+
+
+# Load a diagnostic suppression file.  Each line names a diagnostic by
+# its code or name optionally followed by the stems of the remote
+# controls it is suppressed for, otherwise it is suppressed for all of
+# them.  Anything after a "#" is a comment.  Return a dict of the names
+# of the suppressed diagnostics and a sorted list of their stems, or
+# None where a diagnostic is suppressed for all remote controls.
+#
+def loadSuppressions(filename):
+	names = dict([(x[1][0], x[0]) for x in CATALOG.items()] + [(x, x) for x in CATALOG.keys()])
+	suppressions = {}
+	try:
+		with open(filename, "r") as fd:
+			for number, line in enumerate(fd, 1):
+				fields = line.split("#", 1)[0].split()
+				if not fields:
+					continue
+				name = names.get(fields[0]) or names.get(fields[0].upper())
+				if name is None:
+					raise ArgumentTypeError("unknown diagnostic '%s' in line %d of '%s'" % (fields[0], number, filename))
+				if len(fields) == 1 or suppressions.get(name, ()) is None:
+					suppressions[name] = None
+				else:
+					suppressions[name] = sorted(set(suppressions.get(name, []) + fields[1:]))
+	except (IOError, OSError) as err:
+		raise ArgumentTypeError("can't read suppression file '%s' (%s)" % (filename, err.strerror))
+	return suppressions
+
+
+def isSuppressed(suppressions, name, stem):
+	if name not in suppressions:
+		return False
+	stems = suppressions[name]
+	return stems is None or stem in stems
+
+
+# Return the logging level for a command line level name or number.
+#
+def parseLogLevel(value):
+	for level, name in LOG_LEVELS.items():
+		if value.lower() in (name.lower(), str(level)):
+			return level
+	raise ArgumentTypeError("invalid logging level '%s'" % value)
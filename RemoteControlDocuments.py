@@ -0,0 +1,40 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlDocuments.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	The parsed remote control XML definition files.  Every tool gets the
+# 	document of a remote control XML file from here so that when the
+# 	tools are run in one process by pipeline.py each file is only parsed
+# 	once and the later tools reuse the document parsed by the first.
+# 	The documents are shared so they must never be changed.
+
+from os.path import normpath
+
+try:
+	from xml.etree.cElementTree import parse
+except ImportError:  # Python 3.9 and later only have ElementTree.
+	from xml.etree.ElementTree import parse
+
+documents = {}  # The root element, or the exception raised reading it, of each file that has been parsed.
+
+
+# Return the root element of an XML file, parsing the file only the
+# first time it is used.  The exception raised by opening or parsing the
+# file is raised again every time the file is used.
+#
+def parseXML(filename):
+	key = normpath(filename)
+	result = documents.get(key)
+	if result is None:
+		try:
+			with open(filename, "rb") as fd:  # This open gets around a possible file handle leak in Python's XML parser.
+				result = parse(fd).getroot()
+		except Exception as err:
+			result = err
+		documents[key] = result
+	if isinstance(result, Exception):
+		raise result
+	return result
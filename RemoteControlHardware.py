@@ -0,0 +1,198 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlHardware.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	The rcType tables of the hardware generations.  Each file in hardware/
+# 	is a generation that either selects the remote control by writing its
+# 	rcType to a proc file (v1 and v2) or lists the remote controls and the
+# 	device select code units written to a proc file (gb and vu).  The
+# 	models of a generation are listed in a model="..." comment at the top
+# 	of its file.  makehardware.py compiles every generation into
+# 	hardware.json so that a box can look up the rcName of an rcType
+# 	without parsing any XML.  The rcTypes that conflict within or between
+# 	the generations are reported as are the remote controls, models and
+# 	the rcTypes of remotes.xml that refer to nothing.
+
+from errno import ENOENT
+from glob import glob
+from hashlib import sha256
+from json import dump, load
+from os.path import basename, isfile, join as pathjoin
+from re import compile as recompile
+
+try:
+	from xml.etree.cElementTree import fromstring
+except ImportError:  # Python 3.9 and later only have ElementTree.
+	from xml.etree.ElementTree import fromstring
+
+from RemoteControlIndex import REMOTES_XML
+from RemoteControlInventory import REMOTES_PATH
+
+HARDWARE_VERSION = 1
+HARDWARE_PATH = "hardware"
+HARDWARE_TABLE = "hardware.json"
+
+MODELS_COMMENT = recompile(r"<!--\s*model=\"([^\"]*)\"\s*-->")
+
+
+def hardwareSources(path=HARDWARE_PATH):
+	return sorted(glob(pathjoin(path, "*.xml")))
+
+
+def sourceDigests(filenames):
+	digests = {}
+	for filename in filenames:
+		with open(filename, "rb") as fd:
+			digests[basename(filename)] = sha256(fd.read()).hexdigest()
+	return digests
+
+
+# Compile one hardware file into the table of its generation.  Return the
+# table and a list of (level, message) tuples for the problems found.
+#
+def compileGeneration(filename):
+	problems = []
+	with open(filename, "rb") as fd:
+		data = fd.read()
+	match = MODELS_COMMENT.search(data.decode("utf-8"))
+	generation = {
+		"models": sorted([x.strip() for x in match.group(1).split(",") if x.strip()]) if match else [],
+		"proc": None,
+		"rcTypes": {},
+		"remotes": {}
+	}
+	root = fromstring(data)
+	remotes = root.find("remotes")
+	if remotes is None:
+		problems.append(("error", "'%s' has no remotes" % filename))
+		return generation, problems
+	generation["proc"] = remotes.get("proc")
+	for remote in remotes.findall("remote"):
+		rcName = remote.get("rcName")
+		rcType = remote.get("rcType")
+		if rcName in generation["remotes"]:
+			problems.append(("error", "'%s' lists remote control '%s' more than once" % (filename, rcName)))
+		generation["remotes"][rcName] = {"name": remote.get("name"), "rcType": rcType}
+		if rcType is None:
+			continue
+		if rcType in generation["rcTypes"]:
+			problems.append(("error", "'%s' rcType %s is both '%s' and '%s'" % (filename, rcType, generation["rcTypes"][rcType], rcName)))
+			continue
+		generation["rcTypes"][rcType] = rcName
+	if generation["proc"] and not generation["rcTypes"]:
+		problems.append(("error", "'%s' writes to '%s' but has no rcTypes" % (filename, generation["proc"])))
+	units = root.find("units")
+	if units is not None:
+		generation["units"] = {
+			"codes": dict([(x.get("code"), x.get("name")) for x in units.findall("unit")]),
+			"exclude": sorted([x.strip() for x in units.get("exclude", "").split(",") if x.strip()]),
+			"proc": units.get("proc")
+		}
+		for rcName in generation["units"]["exclude"]:
+			if rcName not in generation["remotes"]:
+				problems.append(("warning", "'%s' excludes the unknown remote control '%s' from its units" % (filename, rcName)))
+	return generation, problems
+
+
+# Compile every hardware file into the table of its generation and check
+# the generations against each other.  Return the tables indexed by
+# generation and a list of (level, message) tuples for the problems
+# found.
+#
+def compileHardware(filenames):
+	generations = {}
+	problems = []
+	for filename in filenames:
+		name = basename(filename).rsplit(".", 1)[0]
+		generations[name], found = compileGeneration(filename)
+		problems.extend(found)
+	rcTypes = {}  # The rcName of every rcType in each generation.
+	rcNames = {}  # The rcType of every rcName in each generation.
+	for name in sorted(generations.keys()):
+		for rcType, rcName in generations[name]["rcTypes"].items():
+			rcTypes.setdefault(rcType, {})[name] = rcName
+			rcNames.setdefault(rcName, {})[name] = rcType
+	for rcType in sorted(rcTypes.keys(), key=lambda x: (len(x), x)):
+		if len(set(rcTypes[rcType].values())) > 1:
+			problems.append(("warning", "rcType %s is %s" % (rcType, " and ".join(["'%s' in %s" % (rcTypes[rcType][x], x) for x in sorted(rcTypes[rcType].keys())]))))
+	for rcName in sorted(rcNames.keys()):
+		if len(set(rcNames[rcName].values())) > 1:
+			problems.append(("warning", "'%s' is %s" % (rcName, " and ".join(["rcType %s in %s" % (rcNames[rcName][x], x) for x in sorted(rcNames[rcName].keys())]))))
+	return generations, problems
+
+
+# Check the generations against the remote control definitions and the
+# models and rcTypes of remotes.xml.  Return a list of (level, message)
+# tuples for the remote controls, models and rcTypes that refer to
+# nothing.
+#
+def checkHardware(generations, remotes, remotesPath=REMOTES_PATH):
+	problems = []
+	rcTypes = set()
+	for name in sorted(generations.keys()):
+		rcTypes.update(generations[name]["rcTypes"].keys())
+		for rcName in sorted(generations[name]["remotes"].keys()):
+			if not isfile(pathjoin(remotesPath, "%s.xml" % rcName)):
+				problems.append(("warning", "'%s' remote control '%s' has no definition" % (name, rcName)))
+		for model in generations[name]["models"]:
+			if model not in remotes:
+				problems.append(("warning", "'%s' model '%s' is not in %s" % (name, model, REMOTES_XML)))
+	dangling = {}
+	for model, types in remotes.items():
+		for rcType in types.keys():
+			if rcType != "0" and rcType not in rcTypes:
+				dangling.setdefault(rcType, []).append(model)
+	for rcType in sorted(dangling.keys(), key=lambda x: (len(x), x)):
+		problems.append(("warning", "rcType %s of %s in %s is not in any generation" % (rcType, ", ".join(["'%s'" % x for x in sorted(dangling[rcType])]), REMOTES_XML)))
+	return problems
+
+
+def saveHardware(filename, generations, digests):
+	table = {
+		"version": HARDWARE_VERSION,
+		"sources": digests,
+		"generations": generations
+	}
+	with open(filename, "w") as fd:
+		dump(table, fd, indent=1, separators=(",", ": "), sort_keys=True)
+		fd.write("\n")
+
+
+# Load the compiled tables.  If sources is given and the tables are
+# missing, from another version or were not compiled from the current
+# sources, the sources are compiled instead.
+#
+def loadHardware(filename=HARDWARE_TABLE, sources=None):
+	try:
+		with open(filename, "r") as fd:
+			table = load(fd)
+		if table.get("version") == HARDWARE_VERSION and (sources is None or table.get("sources") == sourceDigests(sources)):
+			return table["generations"]
+	except (IOError, OSError) as err:
+		if err.errno != ENOENT or sources is None:
+			raise
+	except (ValueError, KeyError, AttributeError):
+		if sources is None:
+			raise
+	if sources is None:
+		raise ValueError("Hardware table '%s' is from another version!" % filename)
+	return compileHardware(sources)[0]
+
+
+# Return the rcName of an rcType in a generation or None if the
+# generation has no such rcType.
+#
+def findRcName(generations, generation, rcType):
+	return generations.get(generation, {}).get("rcTypes", {}).get(str(rcType))
+
+
+# Return the generation whose hardware file lists a model or None.
+#
+def findGeneration(generations, model):
+	for name in sorted(generations.keys()):
+		if model in generations[name]["models"]:
+			return name
+	return None
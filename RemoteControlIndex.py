@@ -0,0 +1,97 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlIndex.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	The index of the remote controls used by each box model.  remotes.xml
+# 	lists the remote control of each model and rcType and makeindex.py
+# 	compiles it into remotes.json so that finding the remote control of
+# 	a box is a dict lookup rather than a parse of remotes.xml.  A model
+# 	and rcType can have more than one remote control so each is a list
+# 	of entries with the code names of the remote control definitions
+# 	already split and the display name.  The index records the SHA-256
+# 	of the remotes.xml it was compiled from so that a stale index can be
+# 	detected.
+
+from errno import ENOENT
+from hashlib import sha256
+from json import dump, load
+
+try:
+	from xml.etree.cElementTree import parse
+except ImportError:  # Python 3.9 and later only have ElementTree.
+	from xml.etree.ElementTree import parse
+
+INDEX_VERSION = 1
+REMOTES_XML = "remotes.xml"
+REMOTES_INDEX = "remotes.json"
+
+
+def sourceDigest(filename):
+	with open(filename, "rb") as fd:
+		return sha256(fd.read()).hexdigest()
+
+
+# Compile remotes.xml into a dict of models each with a dict of the
+# remote controls of each rcType.
+#
+def compileIndex(filename=REMOTES_XML):
+	remotes = {}
+	for remote in parse(filename).getroot().findall("remote"):
+		entry = {
+			"codeNames": [x.strip() for x in remote.get("codeName", "").split(",") if x.strip()],
+			"displayName": remote.get("displayName")
+		}
+		remotes.setdefault(remote.get("model"), {}).setdefault(remote.get("rcType", "0"), []).append(entry)
+	return remotes
+
+
+def saveIndex(filename, remotes, digest):
+	index = {
+		"version": INDEX_VERSION,
+		"source": digest,
+		"remotes": remotes
+	}
+	with open(filename, "w") as fd:
+		dump(index, fd, indent=1, separators=(",", ": "), sort_keys=True)
+		fd.write("\n")
+
+
+# Load the compiled index.  If source is given and the index is missing,
+# from another version or was not compiled from the current source, the
+# source is compiled instead.
+#
+def loadIndex(filename=REMOTES_INDEX, source=None):
+	try:
+		with open(filename, "r") as fd:
+			index = load(fd)
+		if index.get("version") == INDEX_VERSION and (source is None or index.get("source") == sourceDigest(source)):
+			return index["remotes"]
+	except (IOError, OSError) as err:
+		if err.errno != ENOENT or source is None:
+			raise
+	except (ValueError, KeyError, AttributeError):
+		if source is None:
+			raise
+	if source is None:
+		raise ValueError("Remote control index '%s' is from another version!" % filename)
+	return compileIndex(source)
+
+
+# Return the list of remote control entries of a model and rcType, which
+# is empty if there are none.
+#
+def findRemotes(remotes, model, rcType):
+	return remotes.get(model, {}).get(str(rcType), [])
+
+
+# Return the code names of the remote control definitions of a model
+# and rcType in the order they are listed without duplicates.
+#
+def findCodeNames(remotes, model, rcType):
+	codeNames = []
+	for entry in findRemotes(remotes, model, rcType):
+		codeNames.extend([x for x in entry["codeNames"] if x not in codeNames])
+	return codeNames
@@ -0,0 +1,146 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlInventory.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	An index of the remote control and box picture files.  A directory
+# 	is read in a single pass and every file is filed under its stem as
+# 	its image, XML or HTML definition or its preview.  The tools look up
+# 	the files of a remote control in the index rather than testing for
+# 	each file on disk.  The index also finds the orphaned files that
+# 	have lost the files they belong to and reads the size of images
+# 	from their PNG header without loading them.
+
+from os import listdir, stat
+from os.path import isdir, join as pathjoin, normpath, split
+from stat import S_ISREG
+from struct import unpack
+
+try:
+	from os import scandir
+except ImportError:  # Python 2 has no scandir so each file is stat'ed separately.
+	scandir = None
+
+REMOTES_PATH = "rc"
+BOXES_PATH = "boxes"
+
+PREVIEW_SUFFIX = "-preview.png"
+KINDS = ("png", "xml", "html", "preview")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+directories = {}  # The index of each directory that has been looked up, indexed by its normalised path.
+
+
+class Assets(object):
+	__slots__ = ("stem", "png", "xml", "html", "preview", "sizes", "mtimes")
+
+	def __init__(self, stem):
+		self.stem = stem
+		self.png = None  # The path of each kind of file or None if there is no such file.
+		self.xml = None
+		self.html = None
+		self.preview = None
+		self.sizes = {}  # The size and modification time of each file indexed by its kind.
+		self.mtimes = {}
+
+
+# Return the kind and stem of a file name or (None, None) if the file is
+# not a remote control or box picture file.
+#
+def classifyFile(name):
+	if name.endswith(PREVIEW_SUFFIX):
+		return "preview", name[:-len(PREVIEW_SUFFIX)]
+	stem, extension = name.rsplit(".", 1) if "." in name else (name, "")
+	if extension in ("png", "xml", "html"):
+		return extension, stem
+	return None, None
+
+
+# Return the regular files in a directory as a list of (name, path,
+# stat result) tuples.  A directory that does not exist has no files.
+#
+def listFiles(path):
+	files = []
+	if not isdir(path):
+		return files
+	if scandir:
+		for entry in scandir(path):
+			if entry.is_file():
+				files.append((entry.name, entry.path, entry.stat()))
+	else:
+		for name in listdir(path):
+			filename = pathjoin(path, name)
+			info = stat(filename)
+			if S_ISREG(info.st_mode):
+				files.append((name, filename, info))
+	return files
+
+
+# Read a directory and return the Assets of each stem found in it.
+#
+def scanDirectory(path):
+	index = {}
+	for name, filename, info in listFiles(path):
+		kind, stem = classifyFile(name)
+		if kind is None:
+			continue
+		assets = index.get(stem)
+		if assets is None:
+			assets = Assets(stem)
+			index[stem] = assets
+		setattr(assets, kind, filename)
+		assets.sizes[kind] = info.st_size
+		assets.mtimes[kind] = info.st_mtime
+	return index
+
+
+# Return the index of a directory, reading the directory only the first
+# time it is used.  The directory is looked up by its normalised path so
+# "./rc" and "rc" share one index, whose files are named as in "rc".
+#
+def directoryIndex(path):
+	path = normpath(path)
+	index = directories.get(path)
+	if index is None:
+		index = scanDirectory(path)
+		directories[path] = index
+	return index
+
+
+# Return the Assets of the remote control with the given path and stem,
+# for example "./rc/abcom", or None if it has no files.
+#
+def findAssets(filename):
+	path, stem = split(filename)
+	return directoryIndex(path or ".").get(stem)
+
+
+# Return a list of (file, problem) tuples for the files of a remote
+# control index that are missing the files they belong to.
+#
+def findOrphans(index):
+	orphans = []
+	for stem in sorted(index.keys()):
+		assets = index[stem]
+		if assets.preview and not assets.png:
+			orphans.append((assets.preview, "is a preview with no source image"))
+		if assets.preview and not assets.xml:
+			orphans.append((assets.preview, "is a preview with no XML definition"))
+		if assets.html and not assets.xml:
+			orphans.append((assets.html, "is an HTML definition with no XML definition"))
+		if assets.xml and not assets.png:
+			orphans.append((assets.xml, "is an XML definition with no image"))
+	return orphans
+
+
+# Return the width and height of a PNG image from its IHDR chunk, which
+# is always the first chunk, or None if the file is not a PNG image.
+#
+def pngSize(filename):
+	with open(filename, "rb") as fd:
+		header = fd.read(24)
+	if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b"IHDR":
+		return None
+	return unpack(">II", header[16:24])
@@ -0,0 +1,90 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	RemoteControlModel.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	The in memory model of a remote control definition shared by the
+# 	load, compare, complete and build stages of the remote control
+# 	tools.  A remote control has one Button per key id.  Each Button
+# 	holds what the XML and HTML files said about the button in separate
+# 	ButtonSide objects and the merged attribute values that are used to
+# 	build the output files.  All classes use __slots__ as there can be
+# 	many thousands of buttons in a run.  Attributes that are not
+# 	defined are None, "pos" and "coords" are tuples of integers.
+
+# The button attributes that are compared between the XML and HTML
+# files in the order they are compared.
+#
+ATTRIBUTES = ("keyName", "keyId", "name", "label", "pos", "title", "shape", "coords", "onclick")
+
+UNSORTED = 999999  # Sort value of buttons without a sequence or position.
+
+
+class ButtonSide(object):
+	__slots__ = ("keyName", "keyId", "sequence", "name", "label", "pos", "title", "shape", "coords", "onclick")
+
+	def __init__(self, keyId):
+		self.keyName = None
+		self.keyId = keyId
+		self.sequence = None
+		self.name = None
+		self.label = None
+		self.pos = None
+		self.title = None
+		self.shape = None
+		self.coords = None
+		self.onclick = None
+
+	# Return the sort value of the position of the button, top to
+	# bottom and then left to right.
+	#
+	def position(self):
+		return (self.pos[1], self.pos[0]) if self.pos else (UNSORTED, UNSORTED)
+
+
+class Button(object):
+	__slots__ = ("xml", "html", "remapName", "remapId") + ATTRIBUTES
+
+	def __init__(self, keyId):
+		self.xml = None
+		self.html = None
+		self.remapName = None
+		self.remapId = None
+		self.keyName = None
+		self.keyId = keyId
+		self.name = None
+		self.label = None
+		self.pos = None
+		self.title = None
+		self.shape = None
+		self.coords = None
+		self.onclick = None
+
+
+class RemoteDefinition(object):
+	__slots__ = ("filename", "id", "xmlFound", "htmlFound", "xmlImage", "htmlImage", "image", "xmlButtons", "htmlButtons", "xmlOnly", "htmlOnly", "buttons")
+
+	def __init__(self, filename):
+		self.filename = filename
+		self.id = None
+		self.xmlFound = False
+		self.htmlFound = False
+		self.xmlImage = None
+		self.htmlImage = None
+		self.image = None
+		self.xmlButtons = None  # The sorted key ids of the XML buttons if the XML file is valid.
+		self.htmlButtons = None  # The sorted key ids of the HTML buttons if the HTML file is valid.
+		self.xmlOnly = []
+		self.htmlOnly = []
+		self.buttons = {}
+
+	# Return the Button for a key id, adding it if it is new.
+	#
+	def button(self, keyId):
+		button = self.buttons.get(keyId)
+		if button is None:
+			button = Button(keyId)
+			self.buttons[keyId] = button
+		return button
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+from argparse import ArgumentParser
+from json import dump
+import sys
+
+from RemoteControlIndex import REMOTES_INDEX, REMOTES_XML, loadIndex
+from RemoteControlInventory import BOXES_PATH, REMOTES_PATH, directoryIndex
+
+NO_DEFINITION = "#"  # The code name of a remote control that has no definition files.
+GENERIC_MODEL = ""  # The model of the remote controls that only depend on the rcType, which has no box picture.
+
+# The level of a missing remote control file of each kind.
+#
+MISSING_LEVELS = {
+    "xml": "error",
+    "png": "error",
+    "html": "warning"
+}
+
+
+# Resolve every remote control of remotes.xml against the remote control
+# and box picture files.  Return a list of problems, each a dict with
+# the level, the kind of problem and its details.  The files of each
+# definition are only looked up once however many models use it.
+#
+def checkReferences(remotes, definitions, pictures):
+    problems = []
+    missingKinds = {}  # The kinds of file missing from each definition that has been looked up.
+    for model in sorted(remotes.keys()):
+        if model != GENERIC_MODEL and not (model in pictures and pictures[model].png):
+            problems.append({"level": "warning", "problem": "missing-picture", "model": model, "file": "%s/%s.png" % (BOXES_PATH, model)})
+        rcTypes = remotes[model]
+        for rcType in sorted(rcTypes.keys(), key=lambda x: (len(x), x)):
+            entries = rcTypes[rcType]
+            if len(entries) > 1:
+                problems.append({"level": "warning", "problem": "duplicate-remote", "model": model, "rcType": rcType, "displayNames": [x["displayName"] for x in entries]})
+            for entry in entries:
+                for codeName in entry["codeNames"]:
+                    if codeName == NO_DEFINITION:
+                        continue
+                    missing = missingKinds.get(codeName)
+                    if missing is None:
+                        assets = definitions.get(codeName)
+                        missing = [kind for kind in ("xml", "png", "html") if assets is None or getattr(assets, kind) is None]
+                        missingKinds[codeName] = missing
+                    for kind in missing:  # Every model that uses a missing file is reported.
+                        problems.append({"level": MISSING_LEVELS[kind], "problem": "missing-definition", "model": model, "rcType": rcType, "codeName": codeName, "file": "%s/%s.%s" % (REMOTES_PATH, codeName, kind)})
+    for stem in sorted(definitions.keys()):
+        if definitions[stem].xml and stem not in missingKinds:
+            problems.append({"level": "warning", "problem": "unused-definition", "codeName": stem, "file": definitions[stem].xml})
+    for stem in sorted(pictures.keys()):
+        if pictures[stem].png and stem not in remotes:
+            problems.append({"level": "warning", "problem": "unused-picture", "model": stem, "file": pictures[stem].png})
+    return problems
+
+
+def describeProblem(problem):
+    kind = problem["problem"]
+    if kind == "missing-picture":
+        return "'%s' has no box picture '%s'" % (problem["model"], problem["file"])
+    if kind == "duplicate-remote":
+        return "'%s' rcType %s has %d remote controls (%s)" % (problem["model"], problem["rcType"], len(problem["displayNames"]), ", ".join(problem["displayNames"]))
+    if kind == "missing-definition":
+        return "'%s' rcType %s uses '%s' which is missing" % (problem["model"], problem["rcType"], problem["file"])
+    if kind == "unused-definition":
+        return "'%s' is not used by any model in %s" % (problem["file"], REMOTES_XML)
+    return "'%s' is not the picture of any model in %s" % (problem["file"], REMOTES_XML)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Check that every remote control in %s has its definition files and every model its box picture, and that every file is used." % REMOTES_XML)
+    parser.add_argument("--json", dest="json", metavar="FILE", help="also write the problems found to FILE as JSON")
+    options = parser.parse_args()
+    remotes = loadIndex(REMOTES_INDEX, REMOTES_XML)  # The index is compiled again if it is missing or out of date.
+    problems = checkReferences(remotes, directoryIndex(REMOTES_PATH), directoryIndex(BOXES_PATH))
+    errors = len([x for x in problems if x["level"] == "error"])
+    for problem in problems:
+        if problem["level"] == "error":
+            print("**ERROR: %s**\n" % describeProblem(problem))
+        else:
+            print("WARNING: %s\n" % describeProblem(problem))
+    if options.json:
+        with open(options.json, "w") as fd:
+            dump({"errors": errors, "warnings": len(problems) - errors, "problems": problems}, fd, indent=1, separators=(",", ": "), sort_keys=True)
+            fd.write("\n")
+    print("%d models checked, %d errors, %d warnings." % (len(remotes), errors, len(problems) - errors))
+    sys.exit(1 if errors else 0)
@@ -1,21 +1,40 @@
 #!/usr/bin/python
-from os import listdir
-from os.path import join, isfile
-from PIL import Image
-import xml.etree.ElementTree as ET
+from os.path import basename
 
+from RemoteControlDocuments import parseXML
+from RemoteControlInventory import BOXES_PATH, REMOTES_PATH, directoryIndex, findOrphans, pngSize
 
-for f in listdir("./rc/"):
-    if "png" in f and not "preview" in f:
-        xmlFile = f.replace(".png", ".xml")
-        if not isfile(join("./rc", xmlFile)):
+# The width and height the images in each directory should be or None
+# if they can be any size.  The images are only read up to the end of
+# their PNG header.
+#
+EXPECTED_SIZES = {
+    REMOTES_PATH: (154, 500),
+    BOXES_PATH: None
+}
+
+
+for path in sorted(EXPECTED_SIZES.keys()):
+    expected = EXPECTED_SIZES[path]
+    index = directoryIndex(path)
+    for stem in sorted(index.keys()):
+        png = index[stem].png
+        if png:
+            f = basename(png) if path == REMOTES_PATH else png
+            size = pngSize(png)
+            if size is None:
+                print("**ERROR: '%s' is not a valid PNG image**\n" % f)
+            elif expected and size != expected:
+                print("WARNING: '%s' has not the correct size w=%s,h=%s\n" % (f, size[0], size[1]))
+remotes = directoryIndex(REMOTES_PATH)
+for stem in sorted(remotes.keys()):
+    assets = remotes[stem]
+    if assets.png:
+        xmlFile = "%s.xml" % stem
+        if not assets.xml:
             print("**ERROR: '%s' is missing**\n" % xmlFile)
         else:
-            with Image.open(join("./rc", f)) as im:
-                if im.width != 154 or im.height != 500:
-                    print("WARNING: '%s' has not the correct size w=%s,h=%s\n" % (f, im.width, im.height))
-            tree = ET.parse(join("./rc", xmlFile))
-            root = tree.getroot()
+            root = parseXML(assets.xml)  # The document is shared with the other tools run in the same process.
             rc = root.find("rc")
             if rc:
                 for button in rc.findall("button"):
@@ -29,3 +48,5 @@ for f in listdir("./rc/"):
                         break
             else:
                 print("**ERROR: '%s' is invalid**\n" % xmlFile)
+for filename, problem in findOrphans(remotes):
+    print("WARNING: '%s' %s\n" % (basename(filename), problem))
@@ -0,0 +1,174 @@
+#!/usr/bin/python
+from argparse import ArgumentParser
+from io import BytesIO
+from multiprocessing import Pool, cpu_count
+from os import rename
+from os.path import getsize
+from struct import unpack_from
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+import sys
+import zlib
+
+from RemoteControlInventory import BOXES_PATH, REMOTES_PATH, directoryIndex
+
+# The zlib strategies tried for every image at the highest compression
+# level.  Pillow already chooses the best PNG filter for each row of an
+# image that is not a palette image.  The Huffman only, RLE and fixed
+# strategies are never smaller for these images so they are not tried.
+#
+STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED)
+MODES = ("1", "L", "LA", "P", "RGB", "RGBA")  # Images in other modes are left unchanged.
+COLOR_CHUNKS = (b"cHRM", b"gAMA", b"sRGB")  # The chunks, other than the colour profile, that change how an image is shown.
+
+DRY_RUN = False
+
+
+# Return the image as a palette image if it has no more than 256
+# colours, otherwise None.  The colours with transparency are put first
+# in the palette to keep the transparency chunk as short as possible.
+#
+def paletteImage(rgba):
+    colors = rgba.getcolors(256)
+    if colors is None:
+        return None
+    colors = [color for count, color in sorted(colors, key=lambda x: (x[1][3] == 255, -x[0], x[1]))]
+    index = dict([(bytes(bytearray(color)), number) for number, color in enumerate(colors)])
+    data = rgba.tobytes()
+    image = Image.frombytes("P", rgba.size, bytes(bytearray([index[data[x:x + 4]] for x in range(0, len(data), 4)])))
+    image.putpalette([value for color in colors for value in color[:3]])
+    alphas = [color[3] for color in colors if color[3] != 255]
+    if alphas:
+        image.info["transparency"] = bytes(bytearray(alphas))
+    return image
+
+
+# Return a list of the (type, data) tuples of the COLOR_CHUNKS of PNG
+# data in the order they are found.  They all come before the image data.
+#
+def colorChunks(data):
+    chunks = []
+    offset = 8
+    while offset + 8 <= len(data):
+        length, cid = unpack_from(">I4s", data, offset)
+        if cid == b"IDAT":
+            break
+        if cid in COLOR_CHUNKS:
+            chunks.append((cid, data[offset + 8:offset + 8 + length]))
+        offset += length + 12
+    return chunks
+
+
+# Return the smallest PNG encoding of an image with the zlib strategies.
+# Only the image data, palette, transparency, colour profile and colour
+# chunks are written so any text, time or EXIF metadata is dropped.
+#
+def smallestEncoding(image, profile, chunks):
+    best = None
+    for strategy in STRATEGIES:
+        output = BytesIO()
+        options = {"optimize": True, "compress_type": strategy}
+        if chunks:
+            info = PngInfo()
+            for cid, data in chunks:
+                info.add(cid, data)
+            options["pnginfo"] = info
+        if "transparency" in image.info:
+            options["transparency"] = image.info["transparency"]
+        if profile:
+            options["icc_profile"] = profile  # The colour profile changes how the image is shown.
+        image.save(output, "PNG", **options)
+        if best is None or output.tell() < len(best):
+            best = output.getvalue()
+    return best
+
+
+# Recompress a PNG file if a smaller lossless encoding can be found.
+# Return the file name, its old and new size and an error message or
+# None.  The new encoding is only written if it decodes to exactly the
+# same pixels as the original and has the same colour chunks.  Pillow
+# won't write an sRGB chunk beside a colour profile so such files are
+# left unchanged.
+#
+def compressFile(filename):
+    size = getsize(filename)
+    try:
+        with open(filename, "rb") as fd:
+            original = fd.read()
+        chunks = colorChunks(original)
+        with Image.open(BytesIO(original)) as im:
+            im.load()
+            if im.format != "PNG" or im.mode not in MODES:
+                return filename, size, size, None
+            rgba = im.convert("RGBA")
+            candidates = [im]
+            if im.mode == "RGBA" and rgba.getextrema()[3] == (255, 255):
+                candidates.append(im.convert("RGB"))  # The alpha channel is unused.
+            if im.mode in ("LA", "RGB", "RGBA"):
+                palette = paletteImage(rgba)
+                if palette:
+                    candidates.append(palette)
+            best = None
+            for candidate in candidates:
+                data = smallestEncoding(candidate, im.info.get("icc_profile"), chunks)
+                if best is None or len(data) < len(best):
+                    best = data
+        if len(best) >= size or colorChunks(best) != chunks:
+            return filename, size, size, None
+        with Image.open(BytesIO(best)) as check:
+            if check.info.get("icc_profile") != im.info.get("icc_profile"):
+                return filename, size, size, "the recompressed image has another colour profile"
+            if check.convert("RGBA").tobytes() != rgba.tobytes():
+                return filename, size, size, "the recompressed image is not identical"
+        if not DRY_RUN:
+            with open("%s.tmp" % filename, "wb") as fd:
+                fd.write(best)
+            rename("%s.tmp" % filename, filename)
+        return filename, size, len(best), None
+    except Exception as err:
+        return filename, size, size, "can't be recompressed (%s)" % err
+
+
+# Apply the command line options to the program settings.  This is
+# also run in each worker process of a parallel run.
+#
+def applyOptions(options):
+    global DRY_RUN
+    DRY_RUN = options.dryRun
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Losslessly recompress the remote control and box PNG images.")
+    parser.add_argument("dirs", nargs="*", default=[REMOTES_PATH, BOXES_PATH], help="directories of PNG images to recompress (default: %s and %s)" % (REMOTES_PATH, BOXES_PATH))
+    parser.add_argument("-n", "--dry-run", dest="dryRun", action="store_true", help="only report the bytes that would be saved")
+    parser.add_argument("-j", "--jobs", dest="jobs", type=int, default=1, metavar="N", help="recompress the images with N worker processes, 0 uses one per CPU (default: 1)")
+    options = parser.parse_args()
+    applyOptions(options)
+    filenames = []
+    for path in options.dirs:
+        for assets in directoryIndex(path).values():
+            filenames.extend([x for x in (assets.png, assets.preview) if x])
+    filenames.sort()
+    jobs = options.jobs if options.jobs > 0 else cpu_count()
+    pool = None
+    if jobs > 1 and len(filenames) > 1:
+        pool = Pool(min(jobs, len(filenames)), applyOptions, (options,))
+        results = pool.imap(compressFile, filenames)  # The results are returned in the order of filenames.
+    else:
+        results = (compressFile(filename) for filename in filenames)
+    before = 0
+    after = 0
+    errors = 0
+    for filename, size, newSize, error in results:
+        before += size
+        after += newSize
+        if error:
+            print("ERROR: '%s' %s" % (filename, error))
+            errors += 1
+        elif newSize < size:
+            print("'%s' %d -> %d bytes, %d bytes (%.1f%%) saved." % (filename, size, newSize, size - newSize, (size - newSize) * 100.0 / size))
+    if pool:
+        pool.close()
+        pool.join()
+    print("%d images, %d -> %d bytes, %d bytes (%.1f%%) %s." % (len(filenames), before, after, before - after, (before - after) * 100.0 / before if before else 0.0, "can be saved" if DRY_RUN else "saved"))
+    sys.exit(1 if errors else 0)
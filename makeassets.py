@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	makeassets.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Prepare the remote control and box picture files for a web server.
+# 	Every XML and HTML file is given a gzip compressed ".gz" sibling
+# 	that can be served as it is and manifest.json records the SHA-256
+# 	and size of every file, and of its ".gz" sibling, for use as strong
+# 	ETags.  The ".gz" files are reproducible, they have no name or time
+# 	in their header, and are only written again when their file changes.
+# 	The ".gz" files recorded in the manifest of files that have been
+# 	removed are deleted.
+#
+# 	Usage: makeassets.py [--manifest FILE]
+
+from __future__ import print_function
+
+from argparse import ArgumentParser
+from gzip import GzipFile
+from hashlib import sha256
+from io import BytesIO
+from json import dump, load
+from os import remove, sep
+from os.path import dirname, isfile
+from sys import exit
+
+from RemoteControlInventory import BOXES_PATH, KINDS, REMOTES_PATH, directoryIndex
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+TEXT_KINDS = ("xml", "html")  # The kinds of file that are given a ".gz" sibling.
+
+
+def gzipData(data):
+	output = BytesIO()
+	with GzipFile(filename="", mode="wb", compresslevel=9, fileobj=output, mtime=0) as fd:
+		fd.write(data)
+	return output.getvalue()
+
+
+def describe(data):
+	return {"sha256": sha256(data).hexdigest(), "size": len(data)}
+
+
+# Return the assets recorded in a manifest or an empty dict if the
+# manifest is missing, unreadable or from another version.
+#
+def loadManifest(filename):
+	try:
+		with open(filename, "r") as fd:
+			manifest = load(fd)
+		if manifest.get("version") == MANIFEST_VERSION:
+			return manifest.get("assets", {})
+	except (IOError, OSError, ValueError, AttributeError):
+		pass
+	return {}
+
+
+def saveManifest(filename, assets):
+	manifest = {
+		"version": MANIFEST_VERSION,
+		"assets": assets
+	}
+	with open(filename, "w") as fd:
+		dump(manifest, fd, indent=1, separators=(",", ": "), sort_keys=True)
+		fd.write("\n")
+
+
+# Describe every file in a directory and write the ".gz" siblings that
+# are missing or out of date.  Only the ".gz" siblings recorded in the
+# previous manifest are deleted when their file is removed, so any other
+# ".gz" file is left alone.  Return the number of ".gz" files written and
+# deleted.
+#
+def buildDirectory(path, previous, assets):
+	written = 0
+	deleted = 0
+	siblings = set()
+	index = directoryIndex(path)
+	for stem in sorted(index.keys()):
+		for kind in KINDS:
+			filename = getattr(index[stem], kind)
+			if filename is None:
+				continue
+			with open(filename, "rb") as fd:
+				data = fd.read()
+			name = filename.replace(sep, "/")
+			asset = describe(data)
+			if kind in TEXT_KINDS:
+				sibling = "%s.gz" % filename
+				siblings.add(sibling)
+				old = previous.get(name, {})
+				if old.get("sha256") == asset["sha256"] and "gzip" in old and isfile(sibling):
+					asset["gzip"] = old["gzip"]
+				else:
+					compressed = gzipData(data)
+					with open(sibling, "wb") as fd:
+						fd.write(compressed)
+					asset["gzip"] = describe(compressed)
+					written += 1
+			assets[name] = asset
+	for name in sorted(previous.keys()):
+		sibling = "%s.gz" % name.replace("/", sep)
+		if "gzip" in previous[name] and dirname(sibling) == path and sibling not in siblings and isfile(sibling):
+			remove(sibling)  # The file has been removed.
+			deleted += 1
+	return written, deleted
+
+
+if __name__ == "__main__":
+	parser = ArgumentParser(description="Write the compressed XML and HTML files and the asset manifest for a web server.")
+	parser.add_argument("--manifest", dest="manifest", default=MANIFEST, metavar="FILE", help="the asset manifest to write (default: %s)" % MANIFEST)
+	options = parser.parse_args()
+	previous = loadManifest(options.manifest)
+	assets = {}
+	written = 0
+	deleted = 0
+	for path in (REMOTES_PATH, BOXES_PATH):
+		counts = buildDirectory(path, previous, assets)
+		written += counts[0]
+		deleted += counts[1]
+	saveManifest(options.manifest, assets)
+	print("%d assets written to '%s', %d compressed files written and %d deleted." % (len(assets), options.manifest, written, deleted))
+	exit(0)
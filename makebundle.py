@@ -0,0 +1,46 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	makebundle.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Compile every remote control XML definition in rc/ into the binary
+# 	bundle read by RemoteControlBundle.py.  The definitions that can't be
+# 	compiled are reported and left out of the bundle, the buttons with an
+# 	unknown shape are reported and kept with no shape.
+#
+# 	Usage: makebundle.py [bundle]
+
+from __future__ import print_function
+
+from sys import argv, exit
+
+from RemoteControlBundle import BUNDLE_FILE, compileRemote, packBundle
+from RemoteControlInventory import REMOTES_PATH, directoryIndex
+
+if __name__ == "__main__":
+	output = argv[1] if len(argv) > 1 else BUNDLE_FILE
+	index = directoryIndex(REMOTES_PATH)
+	remotes = []
+	errors = 0
+	for stem in sorted(index.keys()):
+		if index[stem].xml:
+			try:
+				remote, problems = compileRemote(index[stem].xml, stem)
+			except Exception as err:
+				print("**ERROR: '%s' can't be compiled (%s)**" % (index[stem].xml, err))
+				errors += 1
+				continue
+			for level, message in problems:
+				if level == "error":
+					print("**ERROR: %s**" % message)
+					errors += 1
+				else:
+					print("WARNING: %s" % message)
+			remotes.append(remote)
+	data = packBundle(remotes)
+	with open(output, "wb") as fd:
+		fd.write(data)
+	print("%d remote controls with %d buttons written to '%s', %d bytes." % (len(remotes), sum([len(x["buttons"]) for x in remotes]), output, len(data)))
+	exit(1 if errors else 0)
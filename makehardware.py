@@ -0,0 +1,34 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	makehardware.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Compile hardware/*.xml into hardware.json, the rcType table of each
+# 	hardware generation read by RemoteControlHardware.py, and report the
+# 	conflicting and dangling rcTypes found with remotes.xml.  The exit
+# 	status is 1 if a hardware file has conflicts of its own.
+#
+# 	Usage: makehardware.py [hardware.json]
+
+from __future__ import print_function
+
+from sys import argv, exit
+
+from RemoteControlHardware import HARDWARE_TABLE, checkHardware, compileHardware, hardwareSources, saveHardware, sourceDigests
+from RemoteControlIndex import REMOTES_INDEX, REMOTES_XML, loadIndex
+
+if __name__ == "__main__":
+	output = argv[1] if len(argv) > 1 else HARDWARE_TABLE
+	sources = hardwareSources()
+	generations, problems = compileHardware(sources)
+	problems.extend(checkHardware(generations, loadIndex(REMOTES_INDEX, REMOTES_XML)))
+	for level, message in problems:
+		if level == "error":
+			print("**ERROR: %s**" % message)
+		else:
+			print("WARNING: %s" % message)
+	saveHardware(output, generations, sourceDigests(sources))
+	print("%d generations with %d rcTypes written to '%s'." % (len(generations), sum([len(x["rcTypes"]) for x in generations.values()]), output))
+	exit(1 if [x for x in problems if x[0] == "error"] else 0)
@@ -0,0 +1,25 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	makeindex.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Compile remotes.xml into remotes.json, the index of the remote
+# 	controls of each box model and rcType read by RemoteControlIndex.py.
+#
+# 	Usage: makeindex.py [remotes.xml [remotes.json]]
+
+from __future__ import print_function
+
+from sys import argv, exit
+
+from RemoteControlIndex import REMOTES_INDEX, REMOTES_XML, compileIndex, saveIndex, sourceDigest
+
+if __name__ == "__main__":
+	source = argv[1] if len(argv) > 1 else REMOTES_XML
+	output = argv[2] if len(argv) > 2 else REMOTES_INDEX
+	remotes = compileIndex(source)
+	saveIndex(output, remotes, sourceDigest(source))
+	print("%d models with %d remote controls written to '%s'." % (len(remotes), sum([len(x) for rcTypes in remotes.values() for x in rcTypes.values()]), output))
+	exit(0)
@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	makekeyids.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Generate RemoteControlKeyIds.py from the Linux kernel's
+# 	input-event-codes.h and the Enigma2 specific key codes in
+# 	RemoteControlKeys.py.
+#
+# 	The Enigma2 key codes take precedence.  A kernel key is only added
+# 	if neither its name nor its code is already used by Enigma2 so that
+# 	the existing remote control definitions keep their meaning.  Kernel
+# 	aliases (names defined as another name) and the KEY_MAX, KEY_CNT
+# 	and KEY_MIN_INTERESTING markers are ignored.  Where the kernel
+# 	defines several names for one code the last one, which is the
+# 	specific key rather than the range marker, is used.
+#
+# 	Usage: makekeyids.py [input-event-codes.h [RemoteControlKeyIds.py]]
+
+from __future__ import print_function
+
+from os.path import basename
+from re import compile as recompile
+from sys import argv, exit
+
+from RemoteControlKeys import ENIGMA2_KEYIDS, KNOWN_ALISAES
+
+HEADER = "input-event-codes.h"
+OUTPUT = "RemoteControlKeyIds.py"
+
+DEFINE = recompile(r"^#define\s+((?:KEY|BTN)_\w+)\s+(\S+)")
+MARKERS = ("KEY_MAX", "KEY_CNT", "KEY_MIN_INTERESTING")
+
+
+# Return the key codes defined in the header as a list of (name, code)
+# pairs in the order they are defined.
+#
+def loadHeader(filename):
+	keys = []
+	with open(filename, "r") as fd:
+		for line in fd:
+			match = DEFINE.match(line)
+			if match is None:
+				continue
+			name, value = match.groups()
+			if name in MARKERS:
+				continue
+			try:
+				keys.append((name, int(value, 0)))
+			except ValueError:
+				pass  # This is an alias for another name or an expression.
+	return keys
+
+
+# Merge the kernel key codes into the Enigma2 key codes.  Return the
+# name of each code and the code of each name.
+#
+def mergeKeys(kernelKeys):
+	names = {}
+	errors = 0
+	for name, code in sorted(ENIGMA2_KEYIDS.items(), key=lambda x: (x[1], x[0])):
+		if code not in names:
+			names[code] = name
+		elif code in KNOWN_ALISAES and name in KNOWN_ALISAES[code]:
+			names[code] = KNOWN_ALISAES[code][0]
+		else:
+			print("[keyids] Error: Key code %d is mapped to both '%s' and '%s'!" % (code, names[code], name))
+			errors += 1
+	codes = dict(ENIGMA2_KEYIDS)
+	kernelNames = {}
+	for name, code in kernelKeys:
+		if name not in codes and code not in names:
+			kernelNames[code] = name  # A later definition replaces an earlier range marker.
+	for code, name in kernelNames.items():
+		names[code] = name
+		codes[name] = code
+	return names, codes, errors
+
+
+def buildModule(header, names, codes):
+	lines = []
+	lines.append("# -*- coding: utf-8 -*-")
+	lines.append("#")
+	lines.append("# 	RemoteControlKeyIds.py")
+	lines.append("#")
+	lines.append("# 	Generated by makekeyids.py from %s and RemoteControlKeys.py." % basename(header))
+	lines.append("# 	Do not edit this file, edit ENIGMA2_KEYIDS and run makekeyids.py.")
+	lines.append("")
+	lines.append("# The preferred name of each key code, indexed by the key code.  Codes")
+	lines.append("# without a name are None.")
+	lines.append("#")
+	lines.append("KEYID_NAMES = (")
+	size = max(names.keys()) + 1
+	for code in range(size):
+		name = names.get(code)
+		separator = "," if code < size - 1 else ""
+		lines.append("\t%s%s  # %d" % ("\"%s\"" % name if name else "None", separator, code))
+	lines.append(")")
+	lines.append("")
+	lines.append("# All key names, including aliases, and their key codes sorted by name.")
+	lines.append("#")
+	lines.append("KEYID_INDEX = (")
+	for name, code in sorted(codes.items()):
+		lines.append("\t(\"%s\", %d)," % (name, code))
+	lines.append(")")
+	return lines
+
+
+if __name__ == "__main__":
+	header = argv[1] if len(argv) > 1 else HEADER
+	output = argv[2] if len(argv) > 2 else OUTPUT
+	kernelKeys = loadHeader(header)
+	names, codes, errors = mergeKeys(kernelKeys)
+	if errors:
+		exit(1)
+	with open(output, "w") as fd:
+		fd.write("%s\n" % "\n".join(buildModule(header, names, codes)))
+	print("%d key codes and %d key names written to '%s' (%d from '%s')." % (len(names), len(codes), output, len(codes) - len(ENIGMA2_KEYIDS), header))
+	exit(0)
@@ -1,40 +1,145 @@
 #!/usr/bin/python
-from os import listdir
-from os.path import join, isfile
-from PIL import Image, ImageDraw
-import xml.etree.ElementTree as ET
-
-
-for f in listdir("./rc/"):
-    if "png" in f and not "preview" in f and isfile(join("./rc", f.replace(".png", ".xml"))):
-        with Image.open(join("./rc", f)) as im:
-            dst = Image.new('RGBA', (154, 500))
-            dst.paste((255, 255, 255), [0, 0, dst.size[0], dst.size[1]])
-            l = 154 - im.width
-            t = 500 - im.height
-            dst.paste(im, (0, 0))
-            preview = Image.new('RGBA', (154 * 3, 500))
-            preview.paste(dst, (0, 0))
-            tree = ET.parse(join("./rc", f.replace(".png", ".xml")))
-            root = tree.getroot()
-            rc = root.find("rc")
-            bpos = 1
-            legend = Image.new('RGBA', (154, 500))
-            legend.paste((255, 255, 255), [0, 0, legend.size[0], legend.size[1]])
-            ldraw = ImageDraw.Draw(legend)
-            ldraw.text((20, 10), f.replace(".png", ""), fill="black")
-            try:
-                for button in rc.findall("button"):
-                    pp = [int(x.strip()) for x in button.attrib.get("pos", "0").split(",")]
-                    p_x, p_y = pp[0], pp[1]
-                    draw = ImageDraw.Draw(dst)
-                    draw.ellipse((p_x - 10, p_y - 10, p_x + 10, p_y + 10), fill=(255, 255, 255, 50), outline=(255, 255, 0))
-                    draw.text((p_x - 5, p_y - 5), str(bpos), fill="red")
-                    txt = "%s - %s" % (str(bpos), button.attrib.get("id"))
-                    ldraw.text((10, 20 + (bpos * 9)), txt, fill="black")
-                    bpos += 1
-            except:
-                pass
-            preview.paste(dst, (155, 0))
-            preview.paste(legend, (155 + 154, 0))
-            preview.save(join("./previews", f))
+from argparse import ArgumentParser
+from multiprocessing import Pool, cpu_count
+from os.path import basename, join
+from PIL import Image, ImageDraw, ImageFont, __version__ as PILLOW_VERSION
+import sys
+
+from RemoteControlCache import fileDigest, fingerprint, loadManifest, lookupEntry, removeOutputs, saveManifest
+from RemoteControlDocuments import parseXML
+from RemoteControlInventory import PREVIEW_SUFFIX, REMOTES_PATH, directoryIndex
+
+RENDERER_VERSION = 1  # Increase this when a change to the renderer changes the previews.
+PREVIEWS_PATH = "./previews"  # The previews are written here and CI/preview.sh moves them into rc/.
+PALETTE = False  # If True the previews are saved as palette images, which are smaller.
+
+WIDTH = 154  # The size of each panel of a preview.
+HEIGHT = 500
+WHITE = (255, 255, 255, 255)
+FONT = ImageFont.load_default()  # The font is only loaded once rather than for every preview.
+
+
+# Draw the preview of a remote control from its image and XML definition
+# and save it in PREVIEWS_PATH.  The preview is three panels side by
+# side, the image, the image with a numbered marker on each button and
+# the legend of the button numbers, all drawn on a single canvas with a
+# single Draw object.  Return a list of the problems found drawing the
+# buttons.
+#
+def makePreview(assets):
+    errors = []
+    f = basename(assets.png)
+    with Image.open(assets.png) as im:
+        image = im.convert("RGBA").crop((0, 0, min(im.width, WIDTH), min(im.height, HEIGHT)))
+    root = parseXML(assets.xml)  # The document is shared with the other tools run in the same process.
+    rc = root.find("rc")
+    preview = Image.new("RGBA", (WIDTH * 3, HEIGHT))
+    draw = ImageDraw.Draw(preview)
+    # The markers are drawn before the image and legend panels are filled
+    # so that any marker overlapping the edge of its panel is cut off.
+    x = WIDTH + 1
+    preview.paste(WHITE, (x, 0, x + WIDTH, HEIGHT))
+    preview.paste(image, (x, 0))
+    legend = []
+    try:
+        for button in rc.findall("button"):
+            pp = [int(value.strip()) for value in button.attrib.get("pos", "0").split(",")]
+            p_x, p_y = pp[0] + x, pp[1]
+            draw.ellipse((p_x - 10, p_y - 10, p_x + 10, p_y + 10), fill=(255, 255, 255, 50), outline=(255, 255, 0))
+            draw.text((p_x - 5, p_y - 5), str(len(legend) + 1), fill="red", font=FONT)
+            legend.append("%s - %s" % (len(legend) + 1, button.attrib.get("id")))
+    except Exception as err:
+        errors.append("button %d and the following buttons can't be drawn (%s)" % (len(legend) + 1, err))
+    preview.paste(WHITE, (0, 0, WIDTH, HEIGHT))
+    preview.paste(image, (0, 0))
+    preview.paste((0, 0, 0, 0), (WIDTH, 0, x, HEIGHT))
+    x += WIDTH
+    preview.paste(WHITE, (x, 0, WIDTH * 3, HEIGHT))
+    draw.text((x + 20, 10), f.replace(".png", ""), fill="black", font=FONT)
+    for index, txt in enumerate(legend, 1):
+        draw.text((x + 10, 20 + (index * 9)), txt, fill="black", font=FONT)
+    if PALETTE:
+        preview = preview.quantize()
+    preview.save(join(PREVIEWS_PATH, f))
+    return errors
+
+
+# Draw the preview of a remote control and return its stem, whether the
+# preview was saved and the problems found.  This runs in the worker
+# processes of a parallel run so every error is returned rather than
+# raised.
+#
+def drawPreview(assets):
+    try:
+        return assets.stem, True, makePreview(assets)
+    except Exception as err:
+        return assets.stem, False, ["can't be drawn (%s)" % err]
+
+
+# Apply the command line options to the program settings.  This is
+# also run in each worker process of a parallel run.
+#
+def applyOptions(options):
+    global PALETTE
+    PALETTE = options.palette
+
+
+# Return the name the preview of a remote control has once it is in rc/.
+#
+def previewFilename(stem):
+    return join(REMOTES_PATH, "%s%s" % (stem, PREVIEW_SUFFIX))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Draw the previews of the remote control images showing the button positions.")
+    parser.add_argument("--cache", dest="cache", metavar="FILE", help="only draw the previews of remote controls whose image or XML file changed since the run recorded in the manifest FILE, or whose preview is missing from rc/")
+    parser.add_argument("-j", "--jobs", dest="jobs", type=int, default=1, metavar="N", help="draw the previews with N worker processes, 0 uses one per CPU (default: 1)")
+    parser.add_argument("--palette", dest="palette", action="store_true", help="save the previews as palette images, which are smaller but may have fewer colours")
+    options = parser.parse_args()
+    applyOptions(options)
+    remotes = directoryIndex(REMOTES_PATH)
+    entries = {}
+    if options.cache:
+        tables = fingerprint(RENDERER_VERSION, PILLOW_VERSION, PALETTE, fileDigest(__file__))
+        entries = loadManifest(options.cache, tables)
+        for stem in list(entries.keys()):
+            if stem not in remotes or not (remotes[stem].png and remotes[stem].xml):
+                removeOutputs(entries, stem)  # The remote control has been removed.
+    digests = {}
+    pending = []
+    unchanged = 0
+    for stem in sorted(remotes.keys()):
+        assets = remotes[stem]
+        if assets.png and assets.xml:
+            if options.cache:
+                digests[stem] = fileDigest(assets.png, assets.xml)
+                if lookupEntry(entries, stem, digests[stem]):
+                    unchanged += 1
+                    continue
+                entries.pop(stem, None)
+            pending.append(assets)
+    jobs = options.jobs if options.jobs > 0 else cpu_count()
+    pool = None
+    if jobs > 1 and len(pending) > 1:
+        pool = Pool(min(jobs, len(pending)), applyOptions, (options,))
+        results = pool.imap(drawPreview, pending)  # The results are returned in the order of pending.
+    else:
+        results = (drawPreview(assets) for assets in pending)
+    drawn = 0
+    failed = 0
+    for stem, saved, errors in results:
+        for error in errors:
+            print("ERROR: Preview of '%s' %s" % (stem, error))
+        if saved:
+            drawn += 1
+        else:
+            failed += 1
+        if options.cache and saved and not errors:  # Previews with problems are drawn again so they are reported again.
+            entries[stem] = {"digest": digests[stem], "outputs": [previewFilename(stem)]}
+    if pool:
+        pool.close()
+        pool.join()
+    if options.cache:
+        saveManifest(options.cache, tables, entries)
+    print("%d previews drawn, %d previews failed, %d previews unchanged." % (drawn, failed, unchanged))
+    sys.exit(1 if failed else 0)
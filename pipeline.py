@@ -0,0 +1,87 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	pipeline.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Run the remote control check, convert, image check and preview stages
+# 	of CI in a single process.  Each stage is the unchanged tool run as
+# 	its own "__main__" with the output written to its log.  The stages
+# 	share the imported modules so the directory index of
+# 	RemoteControlInventory.py and the parsed documents of
+# 	RemoteControlDocuments.py are built by the first stage that needs
+# 	them and reused by the others, every remote control XML file is only
+# 	parsed once rather than once per tool.
+#
+# 	The check and convert stages are run in this process so the documents
+# 	they parse are kept.  The previews are drawn by worker processes that
+# 	are forked once the documents have been parsed so they inherit them.
+#
+# 	Usage: pipeline.py
+
+from __future__ import print_function
+
+from os import makedirs
+from os.path import isdir
+from runpy import run_path
+import sys
+
+try:
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
+
+# The script, arguments and log of each stage in the order they are
+# run.  A stage whose log is None writes to the console.  The lines of
+# the image check log are sorted and duplicate lines removed.
+#
+STAGES = (
+	("CheckRemoteControls.py", ["--cache", "check-report/manifest.json", "--report-dir", "check-report", "--result-dir", "check-result", "./rc"], "check.log"),
+	("ConvertRemoteControls.py", ["--cache", "convert-report/manifest.json", "--report-dir", "convert-report", "--result-dir", "convert-result", "./rc"], "convert.log"),
+	("checkremotes.py", [], "previews.log"),
+	("makepreviews.py", ["--jobs", "0", "--cache", "previews.json"], None)
+)
+SORTED_LOGS = ("previews.log",)
+DIRECTORIES = ("check-report", "check-result", "convert-report", "convert-result", "previews")
+
+
+# Run a tool as "__main__" with the given arguments and return its exit
+# status and everything it printed.
+#
+def runStage(script, arguments):
+	argv = sys.argv
+	stdout = sys.stdout
+	sys.argv = [script] + arguments
+	sys.stdout = StringIO()
+	status = 0
+	try:
+		run_path(script, run_name="__main__")
+	except SystemExit as err:
+		status = err.code or 0
+	finally:
+		output = sys.stdout.getvalue()
+		sys.stdout = stdout
+		sys.argv = argv
+	return status, output
+
+
+if __name__ == "__main__":
+	for path in DIRECTORIES:
+		if not isdir(path):
+			makedirs(path)
+	failed = 0
+	for script, arguments, log in STAGES:
+		print("Running '%s', please wait ..." % script)
+		status, output = runStage(script, arguments)
+		if log is None:
+			sys.stdout.write(output)
+		else:
+			if log in SORTED_LOGS:
+				output = "".join(["%s\n" % x for x in sorted(set(output.splitlines()))])
+			with open(log, "w") as fd:
+				fd.write(output)
+		if status:
+			print("ERROR: '%s' failed with exit status %s!" % (script, status))
+			failed += 1
+	sys.exit(1 if failed else 0)
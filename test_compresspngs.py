@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# Tests of the colour chunk handling of compresspngs.py, run with
+# "python3 -m pytest test_compresspngs.py".
+from struct import pack
+from zlib import crc32
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+
+from compresspngs import colorChunks, compressFile
+
+CHUNKS = [(b"cHRM", pack(">8I", 31270, 32900, 64000, 33000, 30000, 60000, 15000, 6000)), (b"gAMA", pack(">I", 45455)), (b"sRGB", b"\0")]
+
+
+# Save an image that is easy to recompress, with no compression and the
+# given colour chunks.
+#
+def saveImage(filename, chunks, **options):
+    image = Image.new("RGB", (154, 500), (20, 40, 60))
+    info = PngInfo()
+    for cid, data in chunks:
+        info.add(cid, data)
+    image.save(filename, "PNG", compress_level=0, pnginfo=info, **options)
+    with open(filename, "rb") as fd:
+        return fd.read()
+
+
+def test_colorChunksAreKept(tmp_path):
+    filename = str(tmp_path / "colour.png")
+    saveImage(filename, CHUNKS)
+    name, size, newSize, error = compressFile(filename)
+    assert error is None and newSize < size
+    with open(filename, "rb") as fd:
+        assert colorChunks(fd.read()) == CHUNKS
+
+
+def test_imageWithAProfileAndSRGBIsUnchanged(tmp_path):
+    filename = str(tmp_path / "profile.png")
+    data = saveImage(filename, [], icc_profile=b"profile")
+    # Pillow won't write sRGB beside a profile so it is put after IHDR here.
+    original = data[:33] + pack(">I4sB", 1, b"sRGB", 0) + pack(">I", crc32(b"sRGB\0") & 0xFFFFFFFF) + data[33:]
+    with open(filename, "wb") as fd:
+        fd.write(original)
+    assert colorChunks(original) == [(b"sRGB", b"\0")]
+    name, size, newSize, error = compressFile(filename)
+    assert error is None and newSize == size
+    with open(filename, "rb") as fd:
+        assert fd.read() == original
+
+
+def test_colourProfileIsKept(tmp_path):
+    filename = str(tmp_path / "profile.png")
+    saveImage(filename, [(b"gAMA", pack(">I", 45455))], icc_profile=b"profile")
+    name, size, newSize, error = compressFile(filename)
+    assert error is None and newSize < size
+    with Image.open(filename) as im:
+        assert im.info.get("icc_profile") == b"profile"
+        assert im.info.get("gamma") == 0.45455
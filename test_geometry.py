@@ -0,0 +1,91 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	test_geometry.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Tests of the overlap search of RemoteControlGeometry.py, run with
+# 	"python3 -m pytest test_geometry.py".
+
+from random import Random
+
+import RemoteControlGeometry
+from RemoteControlGeometry import boxOverlap, findOverlaps, overlapArea, shapeBounds
+
+
+# Return a list of (key, shape, coords) tuples scattered over a remote
+# control sized image.
+#
+def randomShapes(random, count):
+	shapes = []
+	for key in range(count):
+		x = random.randint(-20, 150)
+		y = random.randint(-20, 500)
+		shape = random.choice(("circle", "rect", "poly"))
+		if shape == "circle":
+			coords = [x, y, random.randint(1, 25)]
+		elif shape == "rect":
+			coords = [x, y, x + random.randint(1, 40), y + random.randint(1, 40)]
+		else:
+			coords = [x, y, x + random.randint(5, 20), y, x + random.randint(0, 20), y + random.randint(5, 20)]
+		shapes.append((key, shape, coords))
+	return shapes
+
+
+# Compare every pair of shapes whose bounding boxes overlap.
+#
+def bruteForceOverlaps(shapes):
+	overlaps = []
+	for index, (key, shape, coords) in enumerate(shapes):
+		bounds = shapeBounds(shape, coords)
+		for otherKey, otherShape, otherCoords in shapes[index + 1:]:
+			other = shapeBounds(otherShape, otherCoords)
+			if max(bounds[0], other[0]) < min(bounds[2], other[2]) and max(bounds[1], other[1]) < min(bounds[3], other[3]):
+				area = overlapArea(shape, coords, otherShape, otherCoords)
+				if area > 0.0:
+					overlaps.append((key, otherKey, area))
+	return overlaps
+
+
+def test_findOverlapsMatchesBruteForce():
+	random = Random(1)
+	for trial in range(50):
+		shapes = randomShapes(random, random.randint(0, 80))
+		found = findOverlaps(shapes)
+		expected = bruteForceOverlaps(shapes)
+		assert [x[:2] for x in found] == [x[:2] for x in expected]
+		assert [round(x[2], 6) for x in found] == [round(x[2], 6) for x in expected]  # The area depends slightly on the order of the shapes.
+
+
+def test_findOverlapsIgnoresInvalidShapes():
+	shapes = [(1, "rect", [0, 0, 10, 10]), (2, "poly", [1, 2]), (3, "rect", [5, 5, 15, 15]), (4, "circle", None)]
+	assert findOverlaps(shapes) == [(1, 3, 25.0)]
+
+
+# The buttons of a remote control are in a narrow column, so every box
+# overlaps every other box on x.  Each button must only be compared with
+# the few buttons near it, not with every other button.  The comparisons
+# are counted, rather than timed, by wrapping boxOverlap and overlapArea.
+#
+def test_findOverlapsComparesANarrowColumnInLinearTime(monkeypatch):
+	counts = {"boxes": 0, "areas": 0}
+
+	def countedBoxOverlap(first, second):
+		counts["boxes"] += 1
+		return boxOverlap(first, second)
+
+	def countedOverlapArea(*args):
+		counts["areas"] += 1
+		return overlapArea(*args)
+
+	monkeypatch.setattr(RemoteControlGeometry, "boxOverlap", countedBoxOverlap)
+	monkeypatch.setattr(RemoteControlGeometry, "overlapArea", countedOverlapArea)
+	for count in (1000, 4000):
+		for height in (15, 25):  # Buttons that are apart and buttons that overlap the next button.
+			counts["boxes"] = 0
+			counts["areas"] = 0
+			overlaps = findOverlaps([(key, "rect", [10, key * 20, 40, key * 20 + height]) for key in range(count)])
+			assert len(overlaps) == (count - 1 if height > 20 else 0)
+			assert counts["areas"] == len(overlaps)
+			assert counts["boxes"] < 3 * count
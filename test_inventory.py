@@ -0,0 +1,29 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# 	test_inventory.py
+#
+# 	GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
+#
+# 	Tests of the directory index of RemoteControlInventory.py, run with
+# 	"python3 -m pytest test_inventory.py".
+
+import RemoteControlInventory
+from RemoteControlInventory import directoryIndex, findAssets
+
+
+def test_directoryIndexIsSharedByEverySpellingOfAPath(tmp_path, monkeypatch):
+	monkeypatch.chdir(tmp_path)
+	monkeypatch.setattr(RemoteControlInventory, "directories", {})
+	tmp_path.joinpath("rc").mkdir()
+	tmp_path.joinpath("rc", "abcom.xml").write_text(u"<rcs />")
+	tmp_path.joinpath("rc", "abcom.png").write_bytes(b"")
+	scans = []
+	scanDirectory = RemoteControlInventory.scanDirectory
+	monkeypatch.setattr(RemoteControlInventory, "scanDirectory", lambda path: scans.append(path) or scanDirectory(path))
+	index = directoryIndex("rc")
+	assert directoryIndex("./rc") is index
+	assert directoryIndex("rc/") is index
+	assert findAssets("./rc/abcom") is index["abcom"]
+	assert index["abcom"].xml == "rc/abcom.xml"
+	assert scans == ["rc"]